@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, TypeVar
 
 import typer
 
@@ -16,6 +16,12 @@ from ai_truffle_hog.core.orchestrator import (
     create_orchestrator,
 )
 from ai_truffle_hog.providers.registry import get_registry
+from ai_truffle_hog.validator.http_client import close_client
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+T = TypeVar("T")
 
 app = typer.Typer(
     name="aitruffle",
@@ -166,6 +172,18 @@ def scan(
         raise typer.Exit(code=1)
 
 
+def _run(scan: Coroutine[object, object, T]) -> T:
+    """Run a scan coroutine, then close the HTTP client shared by its validations."""
+
+    async def main() -> T:
+        try:
+            return await scan
+        finally:
+            await close_client()
+
+    return asyncio.run(main())
+
+
 def _resolve_and_scan_targets(
     targets: list[str], orchestrator: ScanOrchestrator
 ) -> list[ScanResult]:
@@ -176,19 +194,19 @@ def _resolve_and_scan_targets(
 
         if _is_url_list_file(target_path):
             urls = _read_urls_from_file(target_path)
-            return asyncio.run(orchestrator.scan_batch(urls))
+            return _run(orchestrator.scan_batch(urls))
         elif target_path.exists():
-            result = asyncio.run(orchestrator.scan_local(target_path))
+            result = _run(orchestrator.scan_local(target_path))
             return [result]
         elif _is_repository_url(target):
-            result = asyncio.run(orchestrator.scan_repo(target))
+            result = _run(orchestrator.scan_repo(target))
             return [result]
         else:
             typer.echo(f"Invalid target: {target}", err=True)
             typer.echo("Target must be a valid local path or repository URL", err=True)
             raise typer.Exit(code=1)
     else:
-        return asyncio.run(orchestrator.scan_batch(targets))
+        return _run(orchestrator.scan_batch(targets))
 
 
 def _process_scan_results(
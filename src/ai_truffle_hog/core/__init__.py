@@ -1,11 +1,7 @@
 """Core module containing data models and business logic."""
 
-from ai_truffle_hog.core.models import (
-    ScanResult,
-    ScanSession,
-    SecretCandidate,
-    ValidationStatus,
-)
+from typing import TYPE_CHECKING, Any
+
 from ai_truffle_hog.core.orchestrator import (
     OutputFormat,
     ScanConfig,
@@ -21,6 +17,31 @@ from ai_truffle_hog.core.scanner import (
     create_scanner,
 )
 
+if TYPE_CHECKING:
+    from ai_truffle_hog.core.models import (
+        ScanResult,
+        ScanSession,
+        SecretCandidate,
+        ValidationStatus,
+    )
+
+# The Pydantic models are loaded on first access, so that importing the
+# scanner or orchestrator (and so every CLI run) does not import Pydantic
+_MODEL_NAMES = frozenset(
+    {"ScanResult", "ScanSession", "SecretCandidate", "ValidationStatus"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Load the Pydantic models from core.models on first access."""
+    if name in _MODEL_NAMES:
+        from ai_truffle_hog.core import models
+
+        return getattr(models, name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 __all__ = [
     "OrchestratorScanResult",
     "OutputFormat",
@@ -13,7 +13,7 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING
@@ -27,11 +27,13 @@ from ai_truffle_hog.reporter.console import (
 )
 from ai_truffle_hog.reporter.json_reporter import create_json_reporter
 from ai_truffle_hog.reporter.sarif import create_sarif_reporter
+from ai_truffle_hog.validator.cache import ValidationCache
 from ai_truffle_hog.validator.client import (
     SecretCandidate,
     ValidationStats,
     create_validation_client,
 )
+from ai_truffle_hog.validator.http_client import get_client
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -200,6 +202,9 @@ class ScanOrchestrator:
         self._json_reporter = create_json_reporter()
         self._sarif_reporter = create_sarif_reporter()
 
+        # Shared by every validation batch so repeated keys are checked once
+        self._validation_cache = ValidationCache()
+
     def _matches_to_candidates(
         self,
         matches: list[ScanMatch],
@@ -236,7 +241,10 @@ class ScanOrchestrator:
         """
         candidates = self._matches_to_candidates(matches)
 
-        async with create_validation_client() as client:
+        # Share connections with validations of other targets in this run
+        async with create_validation_client(
+            http_client=get_client(), cache=self._validation_cache
+        ) as client:
             _, stats = await client.validate_batch(candidates)
 
         return stats
@@ -318,30 +326,47 @@ class ScanOrchestrator:
             history_scanner = GitHistoryScanner(repo_path)
 
             seen_commits: set[str] = set()
+            # Scan results by content key; identical blobs (re-touched files,
+            # reverts, copies) are scanned only once
+            scanned_blobs: dict[str | None, list[ScanMatch]] = {}
+            reported: set[tuple[str | None, str]] = set()
 
-            for commit_info, changes in history_scanner.iter_commits_with_changes():
+            for commit_info, change_set in history_scanner.iter_commit_change_sets():
                 # Skip already processed commits (can appear in multiple branches)
                 if commit_info.hash in seen_commits:
                     continue
                 seen_commits.add(commit_info.hash)
                 scan_log.commits_scanned += 1
 
-                # Scan each file change in this commit
-                for change in changes:
-                    if change.content and not change.is_deleted:
-                        # Scan the file content
-                        matches = self._scanner.scan_content(
-                            change.content,
-                            file_path=change.path,
-                        )
-                        for match in matches:
-                            history_matches.append(
-                                HistoryMatch(
-                                    match=match,
-                                    commit=commit_info,
-                                    is_deleted=False,
-                                )
+                # Scan each file change in this commit, touching only the
+                # columns needed
+                for i in range(len(change_set)):
+                    content = change_set.contents[i]
+                    if not content or change_set.is_deleted(i):
+                        continue
+
+                    path = change_set.paths[i]
+                    key = change_set.content_key(i)
+                    if (key, path) in reported:
+                        continue
+                    reported.add((key, path))
+
+                    cached = scanned_blobs.get(key)
+                    if cached is None:
+                        matches = self._scanner.scan_content(content, file_path=path)
+                        scanned_blobs[key] = matches
+                    else:
+                        # Same content at a new path: reuse the scan
+                        matches = [replace(m, file_path=path) for m in cached]
+
+                    for match in matches:
+                        history_matches.append(
+                            HistoryMatch(
+                                match=match,
+                                commit=commit_info,
+                                is_deleted=False,
                             )
+                        )
 
         except Exception:
             logger.exception("Error scanning git history")
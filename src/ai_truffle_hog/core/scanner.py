@@ -6,10 +6,14 @@ secrets using regex patterns from registered providers.
 
 from __future__ import annotations
 
+import mmap
+import os
 import re
+import sys
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from ai_truffle_hog.providers.multimatch import CompiledMultiMatcher
 from ai_truffle_hog.providers.registry import get_registry
 from ai_truffle_hog.utils.entropy import calculate_entropy
 
@@ -20,7 +24,7 @@ if TYPE_CHECKING:
     from ai_truffle_hog.providers.base import BaseProvider
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanMatch:
     """Individual secret match result.
 
@@ -67,6 +71,9 @@ class ScanMatch:
         )
 
 
+# Distinct secrets whose entropy a scanner remembers before starting over
+ENTROPY_CACHE_SIZE = 16_384
+
 # Common variable name patterns for context extraction
 VARIABLE_PATTERN = re.compile(
     r"""
@@ -118,6 +125,17 @@ class PatternScanner:
         else:
             self._providers = list(self._registry.all())
 
+        self._bytes_prefilter = _build_bytes_prefilter(self._providers)
+        self._matcher = (
+            self._registry.matcher
+            if len(self._providers) == len(self._registry)
+            else CompiledMultiMatcher(self._providers)
+        )
+        # Secret -> entropy, so a key repeated across lines and files is only
+        # measured once. Held per scanner rather than globally so secrets
+        # live no longer than the scanner and its matches do.
+        self._entropy_cache: dict[str, float] = {}
+
     @property
     def provider_count(self) -> int:
         """Number of providers being used."""
@@ -150,13 +168,29 @@ class PatternScanner:
         if not content:
             return []
 
+        # One pass over the combined patterns finds the earliest offset any
+        # provider can match at; content without any match stops here
+        first = self._matcher.search(content)
+        if first is None:
+            return []
+
         lines = content.splitlines()
         matches: list[ScanMatch] = []
         seen_secrets: set[tuple[str, int, int]] = set()  # Dedupe
 
         for provider in self._providers:
+            # Only try the patterns where one of the provider's literal
+            # prefixes occurs; skip the provider if there are none
+            start = first.start()
+            offsets = provider.candidate_offsets(content, start)
+            if offsets is not None and not offsets:
+                continue
             for pattern_idx, pattern in enumerate(provider.patterns):
-                pattern_name = f"{provider.display_name} Pattern {pattern_idx + 1}"
+                # Interned so every match of a pattern shares one key object
+                # for the reporters' per-rule dict lookups
+                pattern_name = sys.intern(
+                    f"{provider.display_name} Pattern {pattern_idx + 1}"
+                )
                 provider_matches = self._find_matches(
                     content=content,
                     lines=lines,
@@ -165,6 +199,8 @@ class PatternScanner:
                     pattern_name=pattern_name,
                     file_path=file_path,
                     seen_secrets=seen_secrets,
+                    offsets=offsets,
+                    start=start,
                 )
                 matches.extend(provider_matches)
 
@@ -179,6 +215,8 @@ class PatternScanner:
         pattern_name: str,
         file_path: str,
         seen_secrets: set[tuple[str, int, int]],
+        offsets: list[int] | None = None,
+        start: int = 0,
     ) -> list[ScanMatch]:
         """Find matches for a single pattern.
 
@@ -190,13 +228,16 @@ class PatternScanner:
             pattern_name: Name for this pattern.
             file_path: File path for context.
             seen_secrets: Set of already-seen secrets for deduplication.
+            offsets: Candidate offsets to try the pattern at, or None to
+                search every position.
+            start: Offset at which to start searching when offsets is None.
 
         Returns:
             List of matches found.
         """
         matches: list[ScanMatch] = []
 
-        for match in pattern.finditer(content):
+        for match in provider.iter_matches(pattern, content, offsets, start):
             # Get the matched secret (use group 1 if exists, else group 0)
             secret_value = match.group(1) if match.lastindex else match.group(0)
 
@@ -220,7 +261,7 @@ class PatternScanner:
             variable_name = self._extract_variable_name(line_content, column_start)
 
             # Calculate entropy
-            entropy = calculate_entropy(secret_value)
+            entropy = self._entropy(secret_value)
 
             matches.append(
                 ScanMatch(
@@ -241,6 +282,16 @@ class PatternScanner:
 
         return matches
 
+    def _entropy(self, secret_value: str) -> float:
+        """Return the entropy of a secret, memoized per scanner."""
+        cache = self._entropy_cache
+        entropy = cache.get(secret_value)
+        if entropy is None:
+            if len(cache) >= ENTROPY_CACHE_SIZE:
+                cache.clear()
+            entropy = cache[secret_value] = calculate_entropy(secret_value)
+        return entropy
+
     def _position_to_line_col(self, content: str, pos: int) -> tuple[int, int]:
         """Convert character position to line number and column.
 
@@ -297,6 +348,10 @@ class PatternScanner:
     def scan_file(self, file_path: Path) -> list[ScanMatch]:
         """Scan a file for secrets.
 
+        The file is memory-mapped and checked for provider prefix literals
+        before anything is decoded, so files that cannot contain a key are
+        never copied into a Python string.
+
         Args:
             file_path: Path to the file to scan.
 
@@ -306,11 +361,25 @@ class PatternScanner:
         Raises:
             OSError: If file cannot be read.
         """
-        # Try UTF-8 first, fall back to latin-1
-        try:
-            content = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            content = file_path.read_text(encoding="latin-1")
+        with file_path.open("rb") as f:
+            # Empty files cannot be memory-mapped
+            if not os.fstat(f.fileno()).st_size:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                prefilter = self._bytes_prefilter
+                if prefilter is not None and not prefilter.might_match(mm):
+                    return []
+                # Decode straight from the mapping, without a bytes copy;
+                # try UTF-8 first, fall back to latin-1
+                with memoryview(mm) as view:
+                    try:
+                        content = str(view, "utf-8")
+                    except UnicodeDecodeError:
+                        content = str(view, "latin-1")
+
+        # Match text-mode reads, which translate all newlines to "\n"
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
 
         return self.scan_content(content, str(file_path))
 
@@ -352,6 +421,60 @@ class PatternScanner:
             yield file_path, matches, error
 
 
+@dataclass(frozen=True, slots=True)
+class _BytesPrefilter:
+    """Cheap check for whether raw file bytes could contain a provider key.
+
+    Case-sensitive literals are located with ``find``, which runs at memchr
+    speed; only the case-insensitive ones need a regex pass.
+    """
+
+    literals: tuple[bytes, ...]
+    folded: re.Pattern[bytes] | None
+
+    def might_match(self, data: bytes | mmap.mmap) -> bool:
+        """Check whether any prefix literal occurs in data."""
+        if any(data.find(literal) >= 0 for literal in self.literals):
+            return True
+        return self.folded is not None and self.folded.search(data) is not None
+
+
+def _build_bytes_prefilter(providers: list[BaseProvider]) -> _BytesPrefilter | None:
+    """Build a bytes prefilter matching any provider's prefix literal.
+
+    Args:
+        providers: Providers whose literals to combine.
+
+    Returns:
+        Prefilter, or None if some provider has no literals (in which case
+        no file can be skipped).
+    """
+    literals: set[bytes] = set()
+    folded: list[bytes] = []
+    for provider in providers:
+        if not provider.prefix_literals:
+            return None
+        for literal in provider.prefix_literals:
+            encoded = literal.encode("utf-8")
+            if provider.prefix_ignore_case:
+                folded.append(re.escape(encoded))
+            else:
+                literals.add(encoded)
+    if not literals and not folded:
+        return None
+
+    # A literal containing another one can only occur where the shorter does
+    minimal = tuple(
+        sorted(
+            literal
+            for literal in literals
+            if not any(other != literal and other in literal for other in literals)
+        )
+    )
+    pattern = re.compile(b"|".join(folded), re.IGNORECASE) if folded else None
+    return _BytesPrefilter(minimal, pattern)
+
+
 def create_scanner(
     providers: list[str] | None = None,
     context_lines: int = 3,
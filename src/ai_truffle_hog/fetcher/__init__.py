@@ -11,6 +11,7 @@ from ai_truffle_hog.fetcher.file_walker import (
     create_walker_from_config,
 )
 from ai_truffle_hog.fetcher.git import (
+    CommitChangeSet,
     CommitInfo,
     FileChange,
     GitFetcher,
@@ -23,6 +24,7 @@ __all__ = [
     "DEFAULT_EXCLUDE_PATTERNS",
     "DEFAULT_INCLUDE_EXTENSIONS",
     "SPECIAL_FILENAMES",
+    "CommitChangeSet",
     "CommitInfo",
     "FileChange",
     "FileFilter",
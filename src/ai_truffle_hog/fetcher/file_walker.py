@@ -6,6 +6,7 @@ and filtering files based on extension and path rules.
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
@@ -181,6 +182,49 @@ DEFAULT_EXCLUDE_PATTERNS: tuple[str, ...] = (
     r"composer\.lock$",
 )
 
+# DEFAULT_EXCLUDE_PATTERNS compiled once for every filter that uses them
+_COMPILED_EXCLUDE_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in DEFAULT_EXCLUDE_PATTERNS
+)
+
+# A leading ".*" that can be dropped without changing whether search matches;
+# a following quantifier would make the remainder invalid or different
+_LEADING_ANY = re.compile(r"^\.\*(?![?*+{])")
+
+
+@functools.lru_cache(maxsize=32)
+def _combine_patterns(
+    patterns: tuple[re.Pattern[str], ...],
+) -> re.Pattern[str] | None:
+    """Combine exclude patterns into one alternation searched in a single pass.
+
+    A leading ".*" is dropped from each pattern: ``search`` tries every
+    start offset anyway, and in an alternation the prefix would make the
+    engine scan to the end of the path once per offset.
+
+    Args:
+        patterns: Compiled exclude patterns.
+
+    Returns:
+        Pattern that matches wherever any of the patterns does, or None if
+        they use different flags, capturing groups or inline global flags
+        and cannot be combined.
+    """
+    if not patterns:
+        return None
+    flags = patterns[0].flags
+    if any(p.flags != flags or p.groups for p in patterns):
+        return None
+    try:
+        return re.compile(
+            "|".join(f"(?:{_LEADING_ANY.sub('', p.pattern)})" for p in patterns),
+            flags,
+        )
+    except re.error:
+        # e.g. inline global flags, which are only allowed at the very start
+        return None
+
+
 # Special filenames without extensions that should be scanned
 SPECIAL_FILENAMES: frozenset[str] = frozenset(
     {
@@ -236,15 +280,16 @@ class FileFilter:
     skip_hidden: bool = True
     skip_symlinks: bool = True
     special_filenames: frozenset[str] = field(default_factory=lambda: SPECIAL_FILENAMES)
+    # exclude_patterns as one alternation, when they can be combined
+    _exclude_regex: re.Pattern[str] | None = field(
+        init=False, repr=False, compare=False, default=None
+    )
 
     def __post_init__(self) -> None:
         """Compile exclude patterns if provided as strings."""
         if not self.exclude_patterns:
-            # Compile default patterns
-            self.exclude_patterns = tuple(
-                re.compile(pattern, re.IGNORECASE)
-                for pattern in DEFAULT_EXCLUDE_PATTERNS
-            )
+            self.exclude_patterns = _COMPILED_EXCLUDE_PATTERNS
+        self._exclude_regex = _combine_patterns(self.exclude_patterns)
 
     @classmethod
     def from_config(
@@ -273,9 +318,10 @@ class FileFilter:
             else DEFAULT_INCLUDE_EXTENSIONS
         )
 
-        patterns = tuple(
-            re.compile(p, re.IGNORECASE)
-            for p in (exclude_patterns or DEFAULT_EXCLUDE_PATTERNS)
+        patterns = (
+            tuple(re.compile(p, re.IGNORECASE) for p in exclude_patterns)
+            if exclude_patterns
+            else _COMPILED_EXCLUDE_PATTERNS
         )
 
         return cls(
@@ -304,6 +350,8 @@ class FileFilter:
             relative_str = str(path)
 
         # Check against exclusion patterns
+        if self._exclude_regex is not None:
+            return self._exclude_regex.search(relative_str) is None
         for pattern in self.exclude_patterns:
             if pattern.search(relative_str):
                 return False
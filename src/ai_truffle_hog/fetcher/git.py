@@ -7,21 +7,30 @@ using PyDriller for memory-efficient commit analysis.
 
 from __future__ import annotations
 
-import shutil
+import hashlib
+import logging
+import multiprocessing
+import os
+import subprocess
 import tempfile
+from array import array
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
 
 from git import Repo
 from git.exc import GitCommandError, InvalidGitRepositoryError
+from pydriller import Git as PyDrillerGit
 from pydriller import Repository as PyDrillerRepository
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator, Mapping
     from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CommitInfo:
@@ -74,6 +83,7 @@ class FileChange:
         is_deleted: Whether the file was deleted.
         is_modified: Whether the file was modified.
         is_renamed: Whether the file was renamed.
+        blob_sha: Git object ID of the new file content, if known.
     """
 
     path: str
@@ -86,6 +96,19 @@ class FileChange:
     is_deleted: bool = False
     is_modified: bool = False
     is_renamed: bool = False
+    blob_sha: str | None = None
+
+    @property
+    def content_key(self) -> str | None:
+        """Identity of the file content, for skipping already-scanned blobs.
+
+        Uses the git blob SHA when available (free, git already computed
+        it) and falls back to hashing the content.
+
+        Returns:
+            Content identifier, or None if there is no content.
+        """
+        return _content_key(self.blob_sha, self.content)
 
     @classmethod
     def from_pydriller_modification(cls, mod: Any) -> FileChange:
@@ -101,9 +124,241 @@ class FileChange:
             is_deleted=mod.change_type.name == "DELETE",
             is_modified=mod.change_type.name == "MODIFY",
             is_renamed=mod.change_type.name == "RENAME",
+            blob_sha=_blob_sha(mod),
         )
 
 
+# Bit flags packed into CommitChangeSet.flags
+CHANGE_ADDED = 1
+CHANGE_DELETED = 2
+CHANGE_MODIFIED = 4
+CHANGE_RENAMED = 8
+
+_CHANGE_TYPE_FLAGS: dict[str, int] = {
+    "ADD": CHANGE_ADDED,
+    "DELETE": CHANGE_DELETED,
+    "MODIFY": CHANGE_MODIFIED,
+    "RENAME": CHANGE_RENAMED,
+}
+
+
+@dataclass
+class CommitChangeSet:
+    """Column-oriented file changes for a single commit.
+
+    Stores one list/array per FileChange field instead of one object per
+    file, which keeps wide commits compact and lets consumers touch only
+    the columns they need. Use ``__getitem__`` to materialize a FileChange.
+
+    Attributes:
+        paths: Path to each file.
+        old_paths: Previous path if renamed, else None.
+        contents: File content after the change (None if deleted).
+        diffs: The diff content.
+        blob_shas: Git object ID of the new content, if known.
+        added_lines: Number of lines added, per file.
+        deleted_lines: Number of lines deleted, per file.
+        flags: CHANGE_* bit flags, per file.
+    """
+
+    paths: list[str] = field(default_factory=list)
+    old_paths: list[str | None] = field(default_factory=list)
+    contents: list[str | None] = field(default_factory=list)
+    diffs: list[str | None] = field(default_factory=list)
+    blob_shas: list[str | None] = field(default_factory=list)
+    added_lines: array[int] = field(default_factory=lambda: array("i"))
+    deleted_lines: array[int] = field(default_factory=lambda: array("i"))
+    flags: bytearray = field(default_factory=bytearray)
+
+    @classmethod
+    def from_pydriller_modifications(
+        cls,
+        mods: Iterable[Any],
+        blob_contents: Mapping[str, bytes | None] | None = None,
+    ) -> CommitChangeSet:
+        """Create a CommitChangeSet from PyDriller modification objects.
+
+        Args:
+            mods: PyDriller ModifiedFile objects.
+            blob_contents: Raw blob data already fetched by SHA. Blobs not
+                in the mapping are read through PyDriller.
+
+        Returns:
+            CommitChangeSet with one entry per modification.
+        """
+        change_set = cls()
+        for mod in mods:
+            blob_sha = _blob_sha(mod)
+            if blob_sha is not None and blob_contents and blob_sha in blob_contents:
+                raw = blob_contents[blob_sha]
+                # Same decoding as PyDriller's ModifiedFile.source_code
+                content = raw.decode("utf-8", "ignore") if raw is not None else None
+            else:
+                content = mod.source_code
+            change_set.paths.append(mod.new_path or mod.old_path or "")
+            change_set.old_paths.append(
+                mod.old_path if mod.old_path != mod.new_path else None
+            )
+            change_set.contents.append(content)
+            change_set.diffs.append(mod.diff)
+            change_set.blob_shas.append(blob_sha)
+            change_set.added_lines.append(mod.added_lines)
+            change_set.deleted_lines.append(mod.deleted_lines)
+            change_set.flags.append(_CHANGE_TYPE_FLAGS.get(mod.change_type.name, 0))
+        return change_set
+
+    def __len__(self) -> int:
+        """Return number of changed files."""
+        return len(self.paths)
+
+    def __getitem__(self, index: int) -> FileChange:
+        """Materialize the change at index as a FileChange."""
+        flags = self.flags[index]
+        return FileChange(
+            path=self.paths[index],
+            old_path=self.old_paths[index],
+            content=self.contents[index],
+            diff=self.diffs[index],
+            added_lines=self.added_lines[index],
+            deleted_lines=self.deleted_lines[index],
+            is_added=bool(flags & CHANGE_ADDED),
+            is_deleted=bool(flags & CHANGE_DELETED),
+            is_modified=bool(flags & CHANGE_MODIFIED),
+            is_renamed=bool(flags & CHANGE_RENAMED),
+            blob_sha=self.blob_shas[index],
+        )
+
+    def is_deleted(self, index: int) -> bool:
+        """Check whether the file at index was deleted."""
+        return bool(self.flags[index] & CHANGE_DELETED)
+
+    def content_key(self, index: int) -> str | None:
+        """Get the content identity of the file at index (see FileChange)."""
+        return _content_key(self.blob_shas[index], self.contents[index])
+
+
+def _content_key(blob_sha: str | None, content: str | None) -> str | None:
+    """Identify file content by blob SHA, falling back to a content hash."""
+    if blob_sha:
+        return blob_sha
+    if content is None:
+        return None
+    return hashlib.blake2b(
+        content.encode("utf-8", "surrogatepass"), digest_size=16
+    ).hexdigest()
+
+
+def _blob_sha(mod: Any) -> str | None:
+    """Get the new-side blob SHA from a PyDriller modification.
+
+    PyDriller doesn't expose it publicly, so read it from the underlying
+    GitPython diff.
+
+    Args:
+        mod: PyDriller ModifiedFile.
+
+    Returns:
+        Hex blob SHA, or None if the file was deleted or it's unavailable.
+    """
+    blob = getattr(getattr(mod, "_c_diff", None), "b_blob", None)
+    sha = getattr(blob, "hexsha", None)
+    return sha if isinstance(sha, str) else None
+
+
+class GitBlobReader:
+    """Read blob contents through one long-lived ``git cat-file --batch``.
+
+    Requests for a whole commit's blobs are written to the process in one
+    go and the responses streamed back, instead of paying a round trip
+    per blob.
+
+    Example:
+        >>> with GitBlobReader(Path("/path/to/repo")) as reader:
+        ...     blobs = reader.read_many(["e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"])
+    """
+
+    # Requests per write; keeps each write well under the OS pipe buffer so
+    # neither side can block on a full pipe
+    BATCH_SIZE = 512
+
+    def __init__(self, repo_path: Path) -> None:
+        """Initialize the reader.
+
+        Args:
+            repo_path: Path to the git repository.
+        """
+        self.repo_path = repo_path
+        self._proc: subprocess.Popen[bytes] | None = None
+
+    def _ensure_process(self) -> subprocess.Popen[bytes]:
+        """Start the cat-file process on first use."""
+        if self._proc is None:
+            self._proc = subprocess.Popen(
+                ["git", "-C", str(self.repo_path), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        return self._proc
+
+    def read_many(self, shas: Iterable[str]) -> dict[str, bytes | None]:
+        """Read several blobs.
+
+        Args:
+            shas: Blob object IDs to read.
+
+        Returns:
+            Mapping of SHA to raw content, or None if the object is missing.
+
+        Raises:
+            OSError: If the git process exits unexpectedly.
+        """
+        unique = list(dict.fromkeys(shas))
+        result: dict[str, bytes | None] = {}
+        if not unique:
+            return result
+
+        proc = self._ensure_process()
+        assert proc.stdin is not None
+        assert proc.stdout is not None
+
+        for i in range(0, len(unique), self.BATCH_SIZE):
+            batch = unique[i : i + self.BATCH_SIZE]
+            proc.stdin.write("".join(f"{sha}\n" for sha in batch).encode("ascii"))
+            proc.stdin.flush()
+
+            for sha in batch:
+                header = proc.stdout.readline().split()
+                if not header:
+                    self.close()
+                    raise OSError("git cat-file exited unexpectedly")
+                if header[1] == b"missing":
+                    result[sha] = None
+                    continue
+                size = int(header[2])
+                result[sha] = proc.stdout.read(size)
+                proc.stdout.read(1)  # trailing newline
+
+        return result
+
+    def close(self) -> None:
+        """Stop the cat-file process."""
+        if self._proc is not None:
+            proc, self._proc = self._proc, None
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait()
+            if proc.stdout is not None:
+                proc.stdout.close()
+
+    def __enter__(self) -> GitBlobReader:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        """Context manager exit, stopping the process."""
+        self.close()
+
+
 @dataclass
 class GitFetcher:
     """Clone and manage git repositories.
@@ -127,20 +382,25 @@ class GitFetcher:
     repo_path: Path | None = field(default=None, init=False)
     shallow: bool = False
     _temp_dir: Path | None = field(default=None, init=False, repr=False)
+    _temp_ctx: tempfile.TemporaryDirectory[str] | None = field(
+        default=None, init=False, repr=False
+    )
     _repo: Repo | None = field(default=None, init=False, repr=False)
+    _repo_name: str = field(default="", init=False, repr=False)
 
     def __post_init__(self) -> None:
-        """Validate URL format."""
-        self._validate_url()
+        """Validate URL format and derive the repository name once."""
+        parsed = urlparse(self.url)
+        self._validate_url(parsed)
+        self._repo_name = self._compute_repo_name(parsed)
 
-    def _validate_url(self) -> None:
+    def _validate_url(self, parsed: ParseResult) -> None:
         """Validate that the URL looks like a git repository URL."""
         # SSH format: git@github.com:user/repo.git
         if self.url.startswith("git@"):
             return
 
         # HTTPS format
-        parsed = urlparse(self.url)
         if parsed.scheme in ("http", "https") and parsed.netloc:
             return
 
@@ -151,9 +411,8 @@ class GitFetcher:
 
         raise ValueError(f"Invalid git repository URL or path: {self.url}")
 
-    @property
-    def repo_name(self) -> str:
-        """Extract repository name from URL."""
+    def _compute_repo_name(self, parsed: ParseResult) -> str:
+        """Extract repository name from the URL."""
         # Handle SSH format: git@github.com:user/repo.git
         if self.url.startswith("git@"):
             path_part = self.url.split(":")[-1]
@@ -163,13 +422,17 @@ class GitFetcher:
             return name
 
         # Handle HTTPS format
-        parsed = urlparse(self.url)
         path = parsed.path.rstrip("/")
         name = path.split("/")[-1]
         if name.endswith(".git"):
             name = name[:-4]
         return name or "repo"
 
+    @property
+    def repo_name(self) -> str:
+        """Repository name derived from the URL."""
+        return self._repo_name
+
     def clone(self, target_dir: Path | None = None) -> Path:
         """Clone the repository to a local directory.
 
@@ -191,7 +454,8 @@ class GitFetcher:
             self.repo_path = target_dir / self.repo_name
             self.repo_path.mkdir(parents=True, exist_ok=True)
         else:
-            self._temp_dir = Path(tempfile.mkdtemp(prefix="aitruffle_"))
+            self._temp_ctx = tempfile.TemporaryDirectory(prefix="aitruffle_")
+            self._temp_dir = Path(self._temp_ctx.name)
             self.repo_path = self._temp_dir / self.repo_name
 
         # Clone options
@@ -261,20 +525,41 @@ class GitFetcher:
             return "HEAD"
 
     def cleanup(self) -> None:
-        """Clean up temporary directory if created."""
-        if self._temp_dir and self._temp_dir.exists():
-            shutil.rmtree(self._temp_dir, ignore_errors=True)
-            self._temp_dir = None
-            self.repo_path = None
-            self._repo = None
+        """Clean up temporary directory if created.
+
+        Raises:
+            OSError: If the temporary directory cannot be removed.
+        """
+        if self._temp_ctx is not None:
+            if self._repo is not None:
+                # Stop GitPython's helper processes before removing the tree
+                self._repo.close()
+            temp_ctx, self._temp_ctx = self._temp_ctx, None
+            try:
+                temp_ctx.cleanup()
+            finally:
+                # The directory is gone or cannot be removed; either way the
+                # fetcher no longer owns it
+                self._temp_dir = None
+                self.repo_path = None
+                self._repo = None
 
     def __enter__(self) -> GitFetcher:
         """Context manager entry."""
         return self
 
-    def __exit__(self, *_args: object) -> None:
-        """Context manager exit with cleanup."""
-        self.cleanup()
+    def __exit__(self, exc_type: type[BaseException] | None, *_args: object) -> None:
+        """Context manager exit with cleanup.
+
+        A failure to remove the clone is logged rather than raised when the
+        block is already raising, so it does not replace that exception.
+        """
+        try:
+            self.cleanup()
+        except OSError:
+            if exc_type is None:
+                raise
+            logger.warning("Failed to remove cloned repository", exc_info=True)
 
 
 class GitHistoryScanner:
@@ -353,14 +638,38 @@ class GitHistoryScanner:
         Yields:
             Tuple of (CommitInfo, list of FileChange) for each commit.
         """
+        for commit_info, change_set in self.iter_commit_change_sets():
+            yield commit_info, [change_set[i] for i in range(len(change_set))]
+
+    def iter_commit_change_sets(
+        self,
+    ) -> Iterator[tuple[CommitInfo, CommitChangeSet]]:
+        """Iterate over commits with their file changes in columnar form.
+
+        Blob contents for each commit are fetched together through a single
+        ``git cat-file --batch`` process kept open for the whole traversal.
+
+        Yields:
+            Tuple of (CommitInfo, CommitChangeSet) for each commit.
+        """
         kwargs = self._get_pydriller_kwargs()
-        for commit in PyDrillerRepository(**kwargs).traverse_commits():
-            commit_info = CommitInfo.from_pydriller_commit(commit)
-            changes = [
-                FileChange.from_pydriller_modification(mod)
-                for mod in commit.modified_files
-            ]
-            yield commit_info, changes
+        with GitBlobReader(self.repo_path) as blob_reader:
+            for commit in PyDrillerRepository(**kwargs).traverse_commits():
+                yield self._build_change_set(commit, blob_reader)
+
+    @staticmethod
+    def _build_change_set(
+        commit: Any, blob_reader: GitBlobReader
+    ) -> tuple[CommitInfo, CommitChangeSet]:
+        """Convert a PyDriller commit, batch-reading its blob contents."""
+        mods = commit.modified_files
+        blob_contents = blob_reader.read_many(
+            sha for sha in map(_blob_sha, mods) if sha
+        )
+        return (
+            CommitInfo.from_pydriller_commit(commit),
+            CommitChangeSet.from_pydriller_modifications(mods, blob_contents),
+        )
 
     def iter_all_file_changes(self) -> Iterator[tuple[CommitInfo, FileChange]]:
         """Iterate over all file changes across all commits.
@@ -372,6 +681,84 @@ class GitHistoryScanner:
             for change in changes:
                 yield commit_info, change
 
+    def iter_all_file_changes_parallel(
+        self,
+        num_procs: int | None = None,
+    ) -> Iterator[tuple[CommitInfo, FileChange]]:
+        """Iterate over all file changes, diffing commits in worker processes.
+
+        The commit list is partitioned into slabs that are processed by a
+        pool of ``spawn`` workers, each with its own repository handle.
+        Changes are yielded as slabs complete, so commit order is not
+        preserved.
+
+        Args:
+            num_procs: Number of worker processes (default: CPU count).
+
+        Yields:
+            Tuple of (CommitInfo, FileChange) for each file change.
+        """
+        num_procs = num_procs or os.cpu_count() or 1
+        shas = self._list_commit_shas()
+        if num_procs <= 1 or len(shas) <= 1:
+            yield from self._iter_file_changes_for(shas)
+            return
+
+        # Several slabs per worker so one slow range does not stall the pool
+        num_slabs = min(len(shas), num_procs * 4)
+        slab_size = -(-len(shas) // num_slabs)
+        jobs = [(self, shas[i : i + slab_size]) for i in range(0, len(shas), slab_size)]
+
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(
+            num_procs, initializer=_init_slab_worker, initargs=(context.Lock(),)
+        ) as pool:
+            for results in pool.imap_unordered(_scan_commit_slab, jobs):
+                yield from results
+
+    def _list_commit_shas(self) -> list[str]:
+        """List the commits a traversal covers, oldest first."""
+        cmd = ["git", "-C", str(self.repo_path), "rev-list", "--reverse"]
+        if self.since:
+            cmd.append(f"--since={self.since.isoformat()}")
+        if self.to:
+            cmd.append(f"--until={self.to.isoformat()}")
+        cmd.append(self.only_in_branch or "HEAD")
+        return subprocess.check_output(cmd, text=True).split()
+
+    def _iter_file_changes_for(
+        self,
+        shas: Iterable[str],
+        open_lock: AbstractContextManager[Any] | None = None,
+    ) -> Iterator[tuple[CommitInfo, FileChange]]:
+        """Iterate over the file changes of specific commits.
+
+        Args:
+            shas: Commits to diff.
+            open_lock: Lock held while opening the repository. PyDriller
+                writes to ``.git/config`` on open, which fails when several
+                processes do it at once.
+        """
+        file_types = tuple(self.only_modifications_with_file_types or ())
+        with open_lock or nullcontext():
+            git = PyDrillerGit(str(self.repo_path))
+        try:
+            with GitBlobReader(self.repo_path) as blob_reader:
+                for sha in shas:
+                    commit = git.get_commit(sha)
+                    if file_types and not any(
+                        mod.filename.endswith(file_types)
+                        for mod in commit.modified_files
+                    ):
+                        continue
+                    commit_info, change_set = self._build_change_set(
+                        commit, blob_reader
+                    )
+                    for i in range(len(change_set)):
+                        yield commit_info, change_set[i]
+        finally:
+            git.clear()
+
     def get_commit_count(self) -> int:
         """Get the total number of commits.
 
@@ -383,6 +770,23 @@ class GitHistoryScanner:
         return sum(1 for _ in self.iter_commits())
 
 
+_slab_open_lock: AbstractContextManager[Any] | None = None
+
+
+def _init_slab_worker(open_lock: AbstractContextManager[Any]) -> None:
+    """Pool initializer storing the lock shared by all history workers."""
+    global _slab_open_lock
+    _slab_open_lock = open_lock
+
+
+def _scan_commit_slab(
+    job: tuple[GitHistoryScanner, list[str]],
+) -> list[tuple[CommitInfo, FileChange]]:
+    """Worker entry point for GitHistoryScanner.iter_all_file_changes_parallel."""
+    scanner, shas = job
+    return list(scanner._iter_file_changes_for(shas, _slab_open_lock))
+
+
 def clone_repository(
     url: str,
     target_dir: Path | None = None,
@@ -11,6 +11,7 @@ from ai_truffle_hog.providers.google import GoogleGeminiProvider
 from ai_truffle_hog.providers.groq import GroqProvider
 from ai_truffle_hog.providers.huggingface import HuggingFaceProvider
 from ai_truffle_hog.providers.langsmith import LangSmithProvider
+from ai_truffle_hog.providers.multimatch import CompiledMultiMatcher
 from ai_truffle_hog.providers.openai import OpenAIProvider
 from ai_truffle_hog.providers.registry import ProviderRegistry, get_registry
 from ai_truffle_hog.providers.replicate import ReplicateProvider
@@ -19,6 +20,7 @@ __all__ = [
     "AnthropicProvider",
     "BaseProvider",
     "CohereProvider",
+    "CompiledMultiMatcher",
     "GoogleGeminiProvider",
     "GroqProvider",
     "HuggingFaceProvider",
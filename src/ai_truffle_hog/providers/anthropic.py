@@ -5,15 +5,72 @@ supporting both standard API keys and admin keys.
 """
 
 import re
+from collections.abc import Mapping
 from typing import Any, ClassVar
 
 from ai_truffle_hog.providers.base import (
     BaseProvider,
+    StatusHandler,
     ValidationResult,
     ValidationStatus,
+    unexpected_status_result,
 )
 
 
+def _valid(status_code: int, _body: dict[str, object] | None) -> ValidationResult:
+    """Handle 200: key is valid."""
+    return ValidationResult(
+        status=ValidationStatus.VALID,
+        http_status_code=status_code,
+        message="Key is valid and active",
+    )
+
+
+def _invalid(status_code: int, _body: dict[str, object] | None) -> ValidationResult:
+    """Handle 401/403: key is invalid or revoked."""
+    return ValidationResult(
+        status=ValidationStatus.INVALID,
+        http_status_code=status_code,
+        message="Key is invalid or revoked",
+    )
+
+
+def _bad_request(
+    status_code: int, response_body: dict[str, object] | None
+) -> ValidationResult:
+    """Handle 400: distinguish exhausted credits from a bad request."""
+    # Check if it's a credit balance issue
+    error_msg = ""
+    if response_body:
+        error_obj = response_body.get("error", {})
+        if isinstance(error_obj, dict):
+            error_msg = str(error_obj.get("message", "")).lower()
+
+    if "credit" in error_msg or "balance" in error_msg:
+        return ValidationResult(
+            status=ValidationStatus.QUOTA_EXCEEDED,
+            http_status_code=status_code,
+            message="Key is valid but account has insufficient credits",
+        )
+    # 400 without credit issue means key is valid but bad request
+    return ValidationResult(
+        status=ValidationStatus.VALID,
+        http_status_code=status_code,
+        message="Key is valid (bad request parameters)",
+    )
+
+
+def _rate_limited(
+    status_code: int, _body: dict[str, object] | None
+) -> ValidationResult:
+    """Handle 429: key is valid but rate limited."""
+    return ValidationResult(
+        status=ValidationStatus.RATE_LIMITED,
+        http_status_code=status_code,
+        message="Key is valid but rate limited",
+    )
+
+
 class AnthropicProvider(BaseProvider):
     """Anthropic API key provider.
 
@@ -32,7 +89,7 @@ class AnthropicProvider(BaseProvider):
     VALIDATION_MODEL = "claude-3-haiku-20240307"
 
     # Compiled patterns for key detection
-    _patterns: ClassVar[list[re.Pattern[str]]] = [
+    patterns: ClassVar[tuple[re.Pattern[str], ...]] = (
         # API key pattern (version flexible: api01, api02, api03, etc.)
         re.compile(
             r"\b(sk-ant-api\d{2}-[a-zA-Z0-9\-_]{80,120})\b",
@@ -40,10 +97,39 @@ class AnthropicProvider(BaseProvider):
         ),
         # Admin key pattern
         re.compile(
-            r"\b(sk-ant-admin-[a-zA-Z0-9\-_]{20,})\b",
+            r"\b(sk-ant-admin-[a-zA-Z0-9\-_]{20,128})\b",
             re.ASCII,
         ),
-    ]
+    )
+
+    # Literal every key pattern requires (see BaseProvider.might_match)
+    prefix_literals: ClassVar[tuple[str, ...]] = ("sk-ant-",)
+
+    # Shape of a whole key (see BaseProvider.quick_reject)
+    key_format: ClassVar[re.Pattern[str] | None] = re.compile(
+        r"sk-ant-(?:api\d{2}-[a-zA-Z0-9\-_]{80,120}|admin-[a-zA-Z0-9\-_]{20,128})",
+        re.ASCII,
+    )
+
+    # Only these responses carry details interpret_response reads
+    response_body_statuses: ClassVar[frozenset[int]] = frozenset({400})
+
+    # Authentication header template (see BaseProvider.build_auth_header)
+    _AUTH_HEADER: ClassVar[str] = "x-api-key"
+    _AUTH_PREFIX: ClassVar[str] = ""
+    _STATIC_HEADERS: ClassVar[Mapping[str, str]] = {
+        "anthropic-version": ANTHROPIC_VERSION,
+        "Content-Type": "application/json",
+    }
+
+    # Status code -> result handler; anything else falls through to ERROR
+    _STATUS_TABLE: ClassVar[dict[int, StatusHandler]] = {
+        200: _valid,
+        400: _bad_request,
+        401: _invalid,
+        403: _invalid,
+        429: _rate_limited,
+    }
 
     @property
     def name(self) -> str:
@@ -55,38 +141,11 @@ class AnthropicProvider(BaseProvider):
         """Return human-readable provider name."""
         return "Anthropic"
 
-    @property
-    def patterns(self) -> list[re.Pattern[str]]:
-        """Return compiled regex patterns for detection."""
-        return self._patterns
-
     @property
     def validation_endpoint(self) -> str:
         """Return API endpoint for validation."""
         return "https://api.anthropic.com/v1/messages"
 
-    @property
-    def auth_header_name(self) -> str:
-        """Return authentication header name."""
-        return "x-api-key"
-
-    def build_auth_header(self, key: str) -> dict[str, str]:
-        """Build authentication headers for validation request.
-
-        Anthropic requires both x-api-key and anthropic-version headers.
-
-        Args:
-            key: The Anthropic API key to validate.
-
-        Returns:
-            Headers dictionary with API key and version.
-        """
-        return {
-            "x-api-key": key,
-            "anthropic-version": self.ANTHROPIC_VERSION,
-            "Content-Type": "application/json",
-        }
-
     def get_validation_body(self) -> dict[str, Any]:
         """Return minimal request body for validation.
 
@@ -121,51 +180,7 @@ class AnthropicProvider(BaseProvider):
         Returns:
             ValidationResult with appropriate status.
         """
-        if status_code == 200:
-            return ValidationResult(
-                status=ValidationStatus.VALID,
-                http_status_code=status_code,
-                message="Key is valid and active",
-            )
-
-        if status_code in (401, 403):
-            return ValidationResult(
-                status=ValidationStatus.INVALID,
-                http_status_code=status_code,
-                message="Key is invalid or revoked",
-            )
-
-        if status_code == 400:
-            # Check if it's a credit balance issue
-            error_msg = ""
-            if response_body:
-                error_obj = response_body.get("error", {})
-                if isinstance(error_obj, dict):
-                    error_msg = str(error_obj.get("message", "")).lower()
-
-            if "credit" in error_msg or "balance" in error_msg:
-                return ValidationResult(
-                    status=ValidationStatus.QUOTA_EXCEEDED,
-                    http_status_code=status_code,
-                    message="Key is valid but account has insufficient credits",
-                )
-            # 400 without credit issue means key is valid but bad request
-            return ValidationResult(
-                status=ValidationStatus.VALID,
-                http_status_code=status_code,
-                message="Key is valid (bad request parameters)",
-            )
-
-        if status_code == 429:
-            return ValidationResult(
-                status=ValidationStatus.RATE_LIMITED,
-                http_status_code=status_code,
-                message="Key is valid but rate limited",
-            )
-
-        # Server errors or unexpected responses
-        return ValidationResult(
-            status=ValidationStatus.ERROR,
-            http_status_code=status_code,
-            message=f"Server/unexpected error: {status_code}",
-        )
+        handler = self._STATUS_TABLE.get(status_code)
+        if handler is not None:
+            return handler(status_code, response_body)
+        return unexpected_status_result(status_code)
@@ -4,10 +4,26 @@ This module defines the abstract base class that all provider implementations
 must inherit from, along with validation result types.
 """
 
+import contextlib
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from enum import StrEnum
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from ai_truffle_hog.providers.fastscan import find_all, find_first
+
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
 
 
 class ValidationStatus(StrEnum):
@@ -29,6 +45,110 @@ class ValidationResult:
     http_status_code: int | None = None
     message: str | None = None
     metadata: dict[str, str] = field(default_factory=dict)
+    # Seconds the provider asked us to wait (Retry-After), if rate limited
+    retry_after: float | None = None
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header into a delay in seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date.
+
+    Returns:
+        Non-negative delay in seconds, or None if absent or malformed.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+# Maps (status_code, response_body) to a ValidationResult; used by providers
+# that dispatch interpret_response through a per-status lookup table.
+StatusHandler = Callable[[int, dict[str, object] | None], ValidationResult]
+
+# Fixed outcome for a status code: (status, message)
+StatusRule = tuple[ValidationStatus, str]
+
+# Extracts result metadata from (status_code, response_body)
+MetadataExtractor = Callable[[int, dict[str, object] | None], dict[str, str]]
+
+
+def unexpected_status_result(status_code: int) -> ValidationResult:
+    """Build the ERROR result for a status code a provider does not expect.
+
+    Args:
+        status_code: HTTP status code from the response.
+
+    Returns:
+        ValidationResult describing a server error (5xx) or other response.
+    """
+    if 500 <= status_code < 600:
+        message = f"Server error: {status_code}"
+    else:
+        message = f"Unexpected response: {status_code}"
+    return ValidationResult(
+        status=ValidationStatus.ERROR,
+        http_status_code=status_code,
+        message=message,
+    )
+
+
+def compile_status_rules(
+    rules: Mapping[int, StatusRule],
+    extract_metadata: MetadataExtractor | None = None,
+) -> Callable[..., ValidationResult]:
+    """Build an interpret_response method from fixed per-status results.
+
+    The rules are frozen into a lookup table when the provider class is
+    created, so each call is a single dict lookup. Status codes without a
+    rule produce the result of ``unexpected_status_result``. Providers that
+    report account details pass ``extract_metadata``, which is called for
+    status codes with a rule to fill in the result's metadata.
+
+    Example:
+        >>> class MyProvider(BaseProvider):
+        ...     interpret_response = compile_status_rules(
+        ...         {200: (ValidationStatus.VALID, "Key is valid")}
+        ...     )
+
+    Args:
+        rules: Mapping of status code to (status, message).
+        extract_metadata: Optional metadata extractor for matched codes.
+
+    Returns:
+        Function usable as a provider's interpret_response method.
+    """
+    table = dict(rules)
+
+    def interpret_response(
+        _self: Any,
+        status_code: int,
+        response_body: dict[str, object] | None,
+    ) -> ValidationResult:
+        rule = table.get(status_code)
+        if rule is None:
+            return unexpected_status_result(status_code)
+        result = ValidationResult(
+            status=rule[0],
+            http_status_code=status_code,
+            message=rule[1],
+        )
+        if extract_metadata is not None:
+            result.metadata = extract_metadata(status_code, response_body)
+        return result
+
+    return interpret_response
 
 
 class BaseProvider(ABC):
@@ -36,10 +156,50 @@ class BaseProvider(ABC):
 
     Each provider must implement methods for:
     - Pattern matching (regex patterns to detect keys)
-    - Authentication header building
     - Response interpretation for validation
+
+    Authentication headers are built from the ``_AUTH_HEADER``,
+    ``_AUTH_PREFIX`` and ``_STATIC_HEADERS`` class attributes, which default
+    to a bearer token in the Authorization header.
+
+    Providers whose matches always start with one of a few literals can list
+    them in ``prefix_literals``. ``match`` then skips the regex pass entirely
+    on text that cannot contain a key, and otherwise only tries the patterns
+    at offsets where a literal occurs.
+
+    Providers that know the complete shape of their keys can declare it as
+    ``key_format``; keys not matching it are rejected by ``quick_reject``
+    without a validation request.
+
+    Providers whose responses map each status code to a fixed result can
+    declare them as data and build ``interpret_response`` from them with
+    ``compile_status_rules`` in the class body.
     """
 
+    # Compiled regex patterns for detecting this provider's keys
+    patterns: ClassVar[tuple[re.Pattern[str], ...]]
+
+    # Literals with which every match of this provider's patterns starts
+    prefix_literals: ClassVar[tuple[str, ...]] = ()
+
+    # Whether prefix_literals should be compared case-insensitively
+    prefix_ignore_case: ClassVar[bool] = False
+
+    # Complete shape of a key, if known; validation rejects keys that do not
+    # match it without sending a request
+    key_format: ClassVar[re.Pattern[str] | None] = None
+
+    # Status codes whose response body interpret_response reads; other
+    # responses are not JSON-decoded
+    response_body_statuses: ClassVar[frozenset[int]] = frozenset()
+
+    # Header carrying the key, and the text that precedes the key in it
+    _AUTH_HEADER: ClassVar[str] = "Authorization"
+    _AUTH_PREFIX: ClassVar[str] = "Bearer "
+
+    # Headers sent unchanged with every validation request
+    _STATIC_HEADERS: ClassVar[Mapping[str, str]] = {}
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -62,35 +222,47 @@ class BaseProvider(ABC):
 
     @property
     @abstractmethod
-    def patterns(self) -> list[re.Pattern[str]]:
-        """Compiled regex patterns for detecting this provider's keys.
+    def validation_endpoint(self) -> str:
+        """API endpoint URL for key validation.
 
         Returns:
-            List of compiled regex patterns.
+            Full URL to the validation endpoint.
         """
         ...
 
-    @property
-    @abstractmethod
-    def validation_endpoint(self) -> str:
-        """API endpoint URL for key validation.
+    @cached_property
+    def endpoint_url(self) -> "httpx.URL":
+        """Parsed validation endpoint.
+
+        httpx re-parses string URLs on every request; handing it this
+        already-parsed URL skips that work.
 
         Returns:
-            Full URL to the validation endpoint.
+            The validation endpoint as an httpx.URL, parsed once.
         """
-        ...
+        import httpx
+
+        return httpx.URL(self.validation_endpoint)
+
+    @cached_property
+    def origin(self) -> str:
+        """Scheme and authority of the validation endpoint.
+
+        Returns:
+            Origin such as 'https://api.openai.com', computed once.
+        """
+        url = self.endpoint_url
+        return f"{url.scheme}://{url.netloc.decode('ascii')}"
 
     @property
-    @abstractmethod
     def auth_header_name(self) -> str:
         """Name of the authentication header.
 
         Returns:
             Header name (e.g., 'Authorization', 'x-api-key').
         """
-        ...
+        return self._AUTH_HEADER
 
-    @abstractmethod
     def build_auth_header(self, key: str) -> dict[str, str]:
         """Build authentication headers for validation request.
 
@@ -100,7 +272,54 @@ class BaseProvider(ABC):
         Returns:
             Dictionary of headers to include in the request.
         """
-        ...
+        headers = {self._AUTH_HEADER: self._AUTH_PREFIX + key}
+        if self._STATIC_HEADERS:
+            headers.update(self._STATIC_HEADERS)
+        return headers
+
+    def build_validation_url(self, key: str) -> "str | httpx.URL":  # noqa: ARG002
+        """Build the URL to request when validating a key.
+
+        Providers that pass the key in the URL rather than in a header
+        override this.
+
+        Args:
+            key: The API key to validate.
+
+        Returns:
+            Full URL for the validation request.
+        """
+        return self.endpoint_url
+
+    async def validate(self, key: str, client: "httpx.AsyncClient") -> ValidationResult:
+        """Validate a key by calling the provider's API.
+
+        Args:
+            key: The API key to validate.
+            client: HTTP client to send the request through.
+
+        Returns:
+            ValidationResult for the provider's response.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+        """
+        response = await client.get(
+            self.build_validation_url(key),
+            headers=self.build_auth_header(key),
+        )
+        body: dict[str, object] | None = None
+        if response.status_code in self.response_body_statuses:
+            with contextlib.suppress(Exception):
+                body = (
+                    response.json()
+                    if orjson is None
+                    else orjson.loads(response.content)
+                )
+        result = self.interpret_response(response.status_code, body)
+        if result.status == ValidationStatus.RATE_LIMITED:
+            result.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return result
 
     @abstractmethod
     def interpret_response(
@@ -119,6 +338,105 @@ class BaseProvider(ABC):
         """
         ...
 
+    def first_candidate_offset(self, text: str) -> int:
+        """Find where the first possible match of this provider could start.
+
+        Args:
+            text: Text to check.
+
+        Returns:
+            Offset of the earliest prefix literal (0 if the provider has no
+            literals or compares them case-insensitively), or -1 if none of
+            the literals occur in text.
+        """
+        if not self.prefix_literals:
+            return 0
+        if self.prefix_ignore_case:
+            # Lowercasing can change string length, so offsets aren't kept
+            return 0 if find_first(text.lower(), self.prefix_literals) >= 0 else -1
+        return find_first(text, self.prefix_literals)
+
+    def quick_reject(self, key: str) -> bool:
+        """Check whether a key is malformed without asking the provider.
+
+        Args:
+            key: The API key to check.
+
+        Returns:
+            True if the key cannot be valid because it does not match
+            ``key_format``; False if it might be valid or no format is known.
+        """
+        return self.key_format is not None and self.key_format.fullmatch(key) is None
+
+    def might_match(self, text: str) -> bool:
+        """Cheaply check whether text could contain one of this provider's keys.
+
+        Args:
+            text: Text to check.
+
+        Returns:
+            False only if none of the prefix literals occur in text.
+        """
+        return self.first_candidate_offset(text) >= 0
+
+    def candidate_offsets(self, text: str, start: int = 0) -> list[int] | None:
+        """Find every offset at which one of this provider's keys could start.
+
+        Args:
+            text: Text to search.
+            start: Offset at which to start searching.
+
+        Returns:
+            Sorted offsets of all prefix literal occurrences, or None if the
+            provider has no literals (any offset is a candidate).
+        """
+        if not self.prefix_literals:
+            return None
+        if self.prefix_ignore_case:
+            lowered = text.lower()
+            if len(lowered) != len(text):
+                # Lowercasing changed offsets; search case-insensitively
+                literals = "|".join(map(re.escape, self.prefix_literals))
+                lookahead = re.compile(f"(?=(?:{literals}))", re.IGNORECASE)
+                return [m.start() for m in lookahead.finditer(text, start)]
+            return find_all(lowered, self.prefix_literals, start)
+        return find_all(text, self.prefix_literals, start)
+
+    @staticmethod
+    def iter_matches(
+        pattern: re.Pattern[str],
+        text: str,
+        offsets: list[int] | None,
+        start: int = 0,
+    ) -> Iterator[re.Match[str]]:
+        """Find a pattern's matches, trying it only at candidate offsets.
+
+        Yields the same matches as ``pattern.finditer(text, start)``,
+        provided every match starts at one of the offsets.
+
+        Args:
+            pattern: Compiled regex pattern.
+            text: Text to search.
+            offsets: Sorted candidate offsets from ``candidate_offsets``, or
+                None to search every position.
+            start: Offset at which to start when offsets is None.
+
+        Yields:
+            Non-overlapping regex match objects.
+        """
+        if offsets is None:
+            yield from pattern.finditer(text, start)
+            return
+
+        resume = 0
+        for offset in offsets:
+            if offset < resume:
+                continue
+            match = pattern.match(text, offset)
+            if match is not None:
+                yield match
+                resume = max(match.end(), offset + 1)
+
     def match(self, text: str) -> list[re.Match[str]]:
         """Find all pattern matches in text.
 
@@ -128,9 +446,13 @@ class BaseProvider(ABC):
         Returns:
             List of regex match objects.
         """
+        offsets = self.candidate_offsets(text)
+        if offsets is not None and not offsets:
+            return []
+
         matches: list[re.Match[str]] = []
         for pattern in self.patterns:
-            matches.extend(pattern.finditer(text))
+            matches.extend(self.iter_matches(pattern, text, offsets))
         return matches
 
     def __repr__(self) -> str:
@@ -5,15 +5,59 @@ Cohere keys don't have a unique prefix, so detection relies on contextual patter
 """
 
 import re
+from collections.abc import Mapping
 from typing import Any, ClassVar
 
 from ai_truffle_hog.providers.base import (
     BaseProvider,
+    StatusHandler,
     ValidationResult,
     ValidationStatus,
+    unexpected_status_result,
 )
 
 
+def _check_api_key(
+    status_code: int, response_body: dict[str, object] | None
+) -> ValidationResult:
+    """Handle 200: the 'valid' field in the body decides validity."""
+    is_valid = False
+    if response_body:
+        is_valid = bool(response_body.get("valid", False))
+
+    if is_valid:
+        return ValidationResult(
+            status=ValidationStatus.VALID,
+            http_status_code=status_code,
+            message="Key is valid and active",
+        )
+    return ValidationResult(
+        status=ValidationStatus.INVALID,
+        http_status_code=status_code,
+        message="Key validation returned invalid",
+    )
+
+
+def _invalid(status_code: int, _body: dict[str, object] | None) -> ValidationResult:
+    """Handle 401: key is invalid."""
+    return ValidationResult(
+        status=ValidationStatus.INVALID,
+        http_status_code=status_code,
+        message="Key is invalid",
+    )
+
+
+def _rate_limited(
+    status_code: int, _body: dict[str, object] | None
+) -> ValidationResult:
+    """Handle 429: rate limited."""
+    return ValidationResult(
+        status=ValidationStatus.RATE_LIMITED,
+        http_status_code=status_code,
+        message="Rate limited",
+    )
+
+
 class CohereProvider(BaseProvider):
     """Cohere API key provider.
 
@@ -26,18 +70,41 @@ class CohereProvider(BaseProvider):
     """
 
     # Compiled patterns for key detection (contextual)
-    _patterns: ClassVar[list[re.Pattern[str]]] = [
+    patterns: ClassVar[tuple[re.Pattern[str], ...]] = (
         # Variable assignment with 'cohere' context
         re.compile(
-            r"(?i)(?:cohere)[^\n]{0,30}['\"]([a-zA-Z0-9]{40})['\"]",
+            r"(?i:cohere)[^\n]{0,30}['\"]([a-zA-Z0-9]{40})['\"]",
             re.ASCII,
         ),
         # Environment variable pattern
         re.compile(
-            r"(?i)COHERE_API_KEY\s*[=:]\s*['\"]?([a-zA-Z0-9]{40})['\"]?",
+            r"(?i:COHERE_API_KEY)\s*[=:]\s*['\"]?([a-zA-Z0-9]{40})['\"]?",
             re.ASCII,
         ),
-    ]
+    )
+
+    # Both patterns are case-insensitive and contain "cohere"
+    prefix_literals: ClassVar[tuple[str, ...]] = ("cohere",)
+
+    # Shape of a whole key (see BaseProvider.quick_reject)
+    key_format: ClassVar[re.Pattern[str] | None] = re.compile(
+        r"[a-zA-Z0-9]{40}",
+        re.ASCII,
+    )
+    prefix_ignore_case: ClassVar[bool] = True
+
+    # Only these responses carry details interpret_response reads
+    response_body_statuses: ClassVar[frozenset[int]] = frozenset({200})
+
+    # Authentication header template (see BaseProvider.build_auth_header)
+    _STATIC_HEADERS: ClassVar[Mapping[str, str]] = {"Content-Type": "application/json"}
+
+    # Status code -> result handler; 5xx and unknown codes fall through to ERROR
+    _STATUS_TABLE: ClassVar[dict[int, StatusHandler]] = {
+        200: _check_api_key,
+        401: _invalid,
+        429: _rate_limited,
+    }
 
     @property
     def name(self) -> str:
@@ -49,35 +116,11 @@ class CohereProvider(BaseProvider):
         """Return human-readable provider name."""
         return "Cohere"
 
-    @property
-    def patterns(self) -> list[re.Pattern[str]]:
-        """Return compiled regex patterns for detection."""
-        return self._patterns
-
     @property
     def validation_endpoint(self) -> str:
         """Return API endpoint for validation."""
         return "https://api.cohere.ai/v1/check-api-key"
 
-    @property
-    def auth_header_name(self) -> str:
-        """Return authentication header name."""
-        return "Authorization"
-
-    def build_auth_header(self, key: str) -> dict[str, str]:
-        """Build authentication headers for validation request.
-
-        Args:
-            key: The Cohere API key to validate.
-
-        Returns:
-            Headers dictionary with Bearer token authentication.
-        """
-        return {
-            "Authorization": f"Bearer {key}",
-            "Content-Type": "application/json",
-        }
-
     def get_validation_body(self) -> dict[str, Any]:
         """Return request body for validation.
 
@@ -106,44 +149,7 @@ class CohereProvider(BaseProvider):
         Returns:
             ValidationResult with appropriate status.
         """
-        if status_code == 200:
-            is_valid = False
-            if response_body:
-                is_valid = bool(response_body.get("valid", False))
-
-            if is_valid:
-                return ValidationResult(
-                    status=ValidationStatus.VALID,
-                    http_status_code=status_code,
-                    message="Key is valid and active",
-                )
-            else:
-                return ValidationResult(
-                    status=ValidationStatus.INVALID,
-                    http_status_code=status_code,
-                    message="Key validation returned invalid",
-                )
-        elif status_code == 401:
-            return ValidationResult(
-                status=ValidationStatus.INVALID,
-                http_status_code=status_code,
-                message="Key is invalid",
-            )
-        elif status_code == 429:
-            return ValidationResult(
-                status=ValidationStatus.RATE_LIMITED,
-                http_status_code=status_code,
-                message="Rate limited",
-            )
-        elif 500 <= status_code < 600:
-            return ValidationResult(
-                status=ValidationStatus.ERROR,
-                http_status_code=status_code,
-                message=f"Server error: {status_code}",
-            )
-        else:
-            return ValidationResult(
-                status=ValidationStatus.ERROR,
-                http_status_code=status_code,
-                message=f"Unexpected response: {status_code}",
-            )
+        handler = self._STATUS_TABLE.get(status_code)
+        if handler is not None:
+            return handler(status_code, response_body)
+        return unexpected_status_result(status_code)
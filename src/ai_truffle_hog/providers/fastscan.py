@@ -0,0 +1,61 @@
+"""Fast literal-prefix search for narrowing regex scans.
+
+Provider keys start with distinctive literals (``sk-ant-``, ``AIza``,
+``gsk_``, ...). Locating the first occurrence with ``str.find`` runs in C
+and lets the regex engine skip everything before it. Locating every
+occurrence lets it be anchored at just those offsets instead of being
+tried at every position in the text.
+"""
+
+
+def find_first(text: str, literals: tuple[str, ...]) -> int:
+    """Find the lowest offset at which any of the literals occurs.
+
+    Args:
+        text: Text to search.
+        literals: Literal substrings to look for.
+
+    Returns:
+        Offset of the earliest occurrence, or -1 if none occur.
+
+    Examples:
+        >>> find_first("x = 'gsk_abc'", ("sk-", "gsk_"))
+        5
+        >>> find_first("nothing here", ("sk-",))
+        -1
+    """
+    first = -1
+    for literal in literals:
+        # Once something is found, only look for earlier occurrences
+        end = len(text) if first < 0 else first + len(literal) - 1
+        idx = text.find(literal, 0, end)
+        if idx >= 0:
+            first = idx
+    return first
+
+
+def find_all(text: str, literals: tuple[str, ...], start: int = 0) -> list[int]:
+    """Find every offset at which any of the literals occurs.
+
+    Args:
+        text: Text to search.
+        literals: Literal substrings to look for.
+        start: Offset at which to start searching.
+
+    Returns:
+        Sorted, distinct offsets of all occurrences, including overlapping
+        ones.
+
+    Examples:
+        >>> find_all("sk-a sk-ant-b", ("sk-", "sk-ant-"))
+        [0, 5]
+        >>> find_all("aaa", ("aa",))
+        [0, 1]
+    """
+    offsets: set[int] = set()
+    for literal in literals:
+        idx = text.find(literal, start)
+        while idx >= 0:
+            offsets.add(idx)
+            idx = text.find(literal, idx + 1)
+    return sorted(offsets)
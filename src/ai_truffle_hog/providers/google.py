@@ -5,12 +5,14 @@ Note: The AIza prefix is shared across many Google Cloud services.
 """
 
 import re
+from collections.abc import Mapping
 from typing import ClassVar
 
 from ai_truffle_hog.providers.base import (
     BaseProvider,
-    ValidationResult,
+    StatusRule,
     ValidationStatus,
+    compile_status_rules,
 )
 
 
@@ -28,13 +30,39 @@ class GoogleGeminiProvider(BaseProvider):
     """
 
     # Compiled patterns for key detection
-    _patterns: ClassVar[list[re.Pattern[str]]] = [
+    patterns: ClassVar[tuple[re.Pattern[str], ...]] = (
         # API key: AIza prefix + 35 characters (alphanumeric, dash, underscore)
         re.compile(
             r"\b(AIza[0-9A-Za-z\-_]{35})\b",
             re.ASCII,
         ),
-    ]
+    )
+
+    # Literal every key pattern requires (see BaseProvider.might_match)
+    prefix_literals: ClassVar[tuple[str, ...]] = ("AIza",)
+
+    # Shape of a whole key (see BaseProvider.quick_reject)
+    key_format: ClassVar[re.Pattern[str] | None] = re.compile(
+        r"AIza[0-9A-Za-z\-_]{35}",
+        re.ASCII,
+    )
+
+    # Authentication header template (see BaseProvider.build_auth_header)
+    _AUTH_HEADER: ClassVar[str] = ""
+
+    # Response code interpretation
+    _status_rules: ClassVar[Mapping[int, StatusRule]] = {
+        200: (ValidationStatus.VALID, "Key is valid for Gemini API"),
+        400: (
+            ValidationStatus.INVALID,
+            "Key is invalid or not authorized for Gemini API",
+        ),
+        403: (
+            ValidationStatus.INVALID,
+            "Key is invalid or not authorized for Gemini API",
+        ),
+        429: (ValidationStatus.QUOTA_EXCEEDED, "Key is valid but quota exceeded"),
+    }
 
     @property
     def name(self) -> str:
@@ -46,24 +74,11 @@ class GoogleGeminiProvider(BaseProvider):
         """Return human-readable provider name."""
         return "Google Gemini"
 
-    @property
-    def patterns(self) -> list[re.Pattern[str]]:
-        """Return compiled regex patterns for detection."""
-        return self._patterns
-
     @property
     def validation_endpoint(self) -> str:
         """Return API endpoint for validation."""
         return "https://generativelanguage.googleapis.com/v1beta/models"
 
-    @property
-    def auth_header_name(self) -> str:
-        """Return authentication header name.
-
-        Google Gemini uses query parameter authentication, not headers.
-        """
-        return ""  # Empty - uses query parameter instead
-
     def build_auth_header(self, _key: str) -> dict[str, str]:
         """Build authentication headers for validation request.
 
@@ -87,54 +102,7 @@ class GoogleGeminiProvider(BaseProvider):
         Returns:
             Full URL with key as query parameter.
         """
+        # Formatting the string is cheaper than endpoint_url.copy_add_param
         return f"{self.validation_endpoint}?key={key}"
 
-    def interpret_response(
-        self,
-        status_code: int,
-        _response_body: dict[str, object] | None,
-    ) -> ValidationResult:
-        """Interpret HTTP response to determine key validity.
-
-        Response code interpretation:
-        - 200: Key is valid for Gemini API
-        - 400: Key is invalid or wrong type
-        - 403: Key is invalid or API not enabled
-
-        Args:
-            status_code: HTTP status code from the response.
-            response_body: Parsed JSON body if available.
-
-        Returns:
-            ValidationResult with appropriate status.
-        """
-        if status_code == 200:
-            return ValidationResult(
-                status=ValidationStatus.VALID,
-                http_status_code=status_code,
-                message="Key is valid for Gemini API",
-            )
-        elif status_code in (400, 403):
-            return ValidationResult(
-                status=ValidationStatus.INVALID,
-                http_status_code=status_code,
-                message="Key is invalid or not authorized for Gemini API",
-            )
-        elif status_code == 429:
-            return ValidationResult(
-                status=ValidationStatus.QUOTA_EXCEEDED,
-                http_status_code=status_code,
-                message="Key is valid but quota exceeded",
-            )
-        elif 500 <= status_code < 600:
-            return ValidationResult(
-                status=ValidationStatus.ERROR,
-                http_status_code=status_code,
-                message=f"Server error: {status_code}",
-            )
-        else:
-            return ValidationResult(
-                status=ValidationStatus.ERROR,
-                http_status_code=status_code,
-                message=f"Unexpected response: {status_code}",
-            )
+    interpret_response = compile_status_rules(_status_rules)
@@ -0,0 +1,164 @@
+"""Single-pass matching across the patterns of many providers.
+
+Each provider exposes its own compiled patterns. Running them one by one
+walks every scanned byte once per pattern; combining them into a single
+alternation lets one pass find the first position where any provider's
+key could be, and tag each hit with the provider that produced it.
+
+The alternation is still tried position by position by the backtracking
+engine, which is slow for long texts. When every provider declares prefix
+literals, matches can only start where one of those literals occurs, so
+the literals are located with ``str.find`` and the alternation is only
+attempted at those offsets.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from ai_truffle_hog.providers.base import BaseProvider
+
+# Global inline flags such as "(?i)" are only allowed at the very start of a
+# pattern, so they are folded into the scoped group wrapping each pattern
+_LEADING_FLAGS = re.compile(r"^\(\?[aiLmsux]+\)")
+
+_FLAG_LETTERS = (
+    (re.ASCII, "a"),
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+
+def _iter_offsets(text: str, literal: str, pos: int) -> Iterator[int]:
+    """Yield every offset of literal in text from pos on, in order."""
+    idx = text.find(literal, pos)
+    while idx >= 0:
+        yield idx
+        idx = text.find(literal, idx + 1)
+
+
+def _scoped_source(pattern: re.Pattern[str]) -> str:
+    """Return pattern's source wrapped so its flags apply only to itself."""
+    source = _LEADING_FLAGS.sub("", pattern.pattern)
+    letters = "".join(letter for flag, letter in _FLAG_LETTERS if pattern.flags & flag)
+    return f"(?{letters}:{source})" if letters else f"(?:{source})"
+
+
+class CompiledMultiMatcher:
+    """One regex alternation over the patterns of several providers.
+
+    Matching follows Python's alternation semantics: at each position the
+    first pattern (in provider order) that matches wins, and ``scan``
+    yields non-overlapping hits. ``search`` returning None therefore means
+    no individual pattern matches anywhere in the text.
+
+    Patterns must not use numbered backreferences, since wrapping them in
+    the combined expression renumbers their groups. If every provider
+    declares ``prefix_literals``, the alternation is only tried where one
+    of them occurs.
+
+    Example:
+        >>> matcher = CompiledMultiMatcher(get_registry().all())
+        >>> for provider_name, start, end in matcher.scan(text):
+        ...     print(provider_name, text[start:end])
+    """
+
+    def __init__(self, providers: Iterable[BaseProvider]) -> None:
+        """Compile the combined expression.
+
+        Args:
+            providers: Providers whose patterns to combine.
+        """
+        self._group_providers: dict[str, str] = {}
+        parts: list[str] = []
+        # (literal, compare case-insensitively) pairs every match starts with
+        literals: set[tuple[str, bool]] | None = set()
+        for provider in providers:
+            for pattern in provider.patterns:
+                group = f"p{len(parts)}"
+                self._group_providers[group] = provider.name
+                parts.append(f"(?P<{group}>{_scoped_source(pattern)})")
+            if not provider.prefix_literals:
+                literals = None
+            elif literals is not None:
+                ignore_case = provider.prefix_ignore_case
+                literals.update(
+                    (literal.lower() if ignore_case else literal, ignore_case)
+                    for literal in provider.prefix_literals
+                )
+
+        self._regex = re.compile("|".join(parts)) if parts else None
+        self._literals = None if literals is None else tuple(sorted(literals))
+        self._fold_case = any(ignore_case for _, ignore_case in self._literals or ())
+
+    @property
+    def pattern_count(self) -> int:
+        """Number of provider patterns combined."""
+        return len(self._group_providers)
+
+    def search(self, text: str, pos: int = 0) -> re.Match[str] | None:
+        """Find the earliest position where any provider pattern matches.
+
+        Args:
+            text: Text to search.
+            pos: Offset at which to start searching.
+
+        Returns:
+            Match object, or None if no provider pattern matches.
+        """
+        return next(self._finditer(text, pos), None)
+
+    def scan(self, text: str) -> Iterator[tuple[str, int, int]]:
+        """Find provider-tagged hits in a single pass.
+
+        Args:
+            text: Text to scan.
+
+        Yields:
+            Tuple of (provider name, start offset, end offset) per hit.
+        """
+        for match in self._finditer(text, 0):
+            group = match.lastgroup
+            if group is not None:
+                yield self._group_providers[group], match.start(), match.end()
+
+    def _finditer(self, text: str, pos: int) -> Iterator[re.Match[str]]:
+        """Yield the matches ``finditer`` would, anchored at literal offsets.
+
+        Args:
+            text: Text to scan.
+            pos: Offset at which to start.
+
+        Yields:
+            Non-overlapping matches of the combined expression.
+        """
+        if self._regex is None:
+            return
+        folded = text.lower() if self._fold_case else text
+        if self._literals is None or len(folded) != len(text):
+            # Lowercasing changed offsets, or some match can start anywhere
+            yield from self._regex.finditer(text, pos)
+            return
+
+        candidates = heapq.merge(
+            *(
+                _iter_offsets(folded if ignore_case else text, literal, pos)
+                for literal, ignore_case in self._literals
+            )
+        )
+        resume = pos
+        for offset in candidates:
+            if offset < resume:
+                continue
+            resume = offset + 1
+            match = self._regex.match(text, offset)
+            if match is not None:
+                yield match
+                resume = max(match.end(), resume)
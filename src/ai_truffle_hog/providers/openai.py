@@ -5,12 +5,14 @@ supporting all key formats including legacy, project, org, admin, and service ac
 """
 
 import re
+from collections.abc import Mapping
 from typing import ClassVar
 
 from ai_truffle_hog.providers.base import (
     BaseProvider,
-    ValidationResult,
+    StatusRule,
     ValidationStatus,
+    compile_status_rules,
 )
 
 
@@ -28,14 +30,35 @@ class OpenAIProvider(BaseProvider):
     """
 
     # Compiled patterns for key detection
-    _patterns: ClassVar[list[re.Pattern[str]]] = [
+    patterns: ClassVar[tuple[re.Pattern[str], ...]] = (
         # Standard pattern covering all sk- variants
         # Matches: sk-xxx, sk-proj-xxx, sk-org-xxx, sk-admin-xxx, sk-svcacct-xxx
         re.compile(
             r"\b(sk-(?:proj-|org-|admin-|svcacct-)?[a-zA-Z0-9]{20,150})\b",
             re.ASCII,
         ),
-    ]
+    )
+
+    # Literal every key pattern requires (see BaseProvider.might_match)
+    prefix_literals: ClassVar[tuple[str, ...]] = ("sk-",)
+
+    # Authentication header template (see BaseProvider.build_auth_header)
+    _STATIC_HEADERS: ClassVar[Mapping[str, str]] = {"Content-Type": "application/json"}
+
+    # Response code interpretation
+    _status_rules: ClassVar[Mapping[int, StatusRule]] = {
+        200: (ValidationStatus.VALID, "Key is valid and active"),
+        401: (ValidationStatus.INVALID, "Key is invalid or revoked"),
+        # 403 means the key is valid but scoped/restricted
+        403: (
+            ValidationStatus.VALID,
+            "Key is valid but lacks permissions for this endpoint",
+        ),
+        429: (
+            ValidationStatus.QUOTA_EXCEEDED,
+            "Key is valid but quota exceeded or rate limited",
+        ),
+    }
 
     @property
     def name(self) -> str:
@@ -47,89 +70,9 @@ class OpenAIProvider(BaseProvider):
         """Return human-readable provider name."""
         return "OpenAI"
 
-    @property
-    def patterns(self) -> list[re.Pattern[str]]:
-        """Return compiled regex patterns for detection."""
-        return self._patterns
-
     @property
     def validation_endpoint(self) -> str:
         """Return API endpoint for validation."""
         return "https://api.openai.com/v1/models"
 
-    @property
-    def auth_header_name(self) -> str:
-        """Return authentication header name."""
-        return "Authorization"
-
-    def build_auth_header(self, key: str) -> dict[str, str]:
-        """Build authentication headers for validation request.
-
-        Args:
-            key: The OpenAI API key to validate.
-
-        Returns:
-            Headers dictionary with Bearer token authentication.
-        """
-        return {
-            "Authorization": f"Bearer {key}",
-            "Content-Type": "application/json",
-        }
-
-    def interpret_response(
-        self,
-        status_code: int,
-        _response_body: dict[str, object] | None,
-    ) -> ValidationResult:
-        """Interpret HTTP response to determine key validity.
-
-        Response code interpretation:
-        - 200: Key is valid and active
-        - 401: Key is invalid or revoked
-        - 403: Key is valid but lacks permissions (scoped key)
-        - 429: Key is valid but quota exceeded or rate limited
-
-        Args:
-            status_code: HTTP status code from the response.
-            response_body: Parsed JSON body if available.
-
-        Returns:
-            ValidationResult with appropriate status.
-        """
-        if status_code == 200:
-            return ValidationResult(
-                status=ValidationStatus.VALID,
-                http_status_code=status_code,
-                message="Key is valid and active",
-            )
-        elif status_code == 401:
-            return ValidationResult(
-                status=ValidationStatus.INVALID,
-                http_status_code=status_code,
-                message="Key is invalid or revoked",
-            )
-        elif status_code == 403:
-            # 403 means the key is valid but scoped/restricted
-            return ValidationResult(
-                status=ValidationStatus.VALID,
-                http_status_code=status_code,
-                message="Key is valid but lacks permissions for this endpoint",
-            )
-        elif status_code == 429:
-            return ValidationResult(
-                status=ValidationStatus.QUOTA_EXCEEDED,
-                http_status_code=status_code,
-                message="Key is valid but quota exceeded or rate limited",
-            )
-        elif 500 <= status_code < 600:
-            return ValidationResult(
-                status=ValidationStatus.ERROR,
-                http_status_code=status_code,
-                message=f"Server error: {status_code}",
-            )
-        else:
-            return ValidationResult(
-                status=ValidationStatus.ERROR,
-                http_status_code=status_code,
-                message=f"Unexpected response: {status_code}",
-            )
+    interpret_response = compile_status_rules(_status_rules)
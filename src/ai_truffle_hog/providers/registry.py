@@ -4,6 +4,11 @@ This module provides a registry pattern for registering and retrieving
 provider implementations at runtime.
 """
 
+import functools
+import threading
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
+
 from ai_truffle_hog.providers.anthropic import AnthropicProvider
 from ai_truffle_hog.providers.base import BaseProvider
 from ai_truffle_hog.providers.cohere import CohereProvider
@@ -11,6 +16,7 @@ from ai_truffle_hog.providers.google import GoogleGeminiProvider
 from ai_truffle_hog.providers.groq import GroqProvider
 from ai_truffle_hog.providers.huggingface import HuggingFaceProvider
 from ai_truffle_hog.providers.langsmith import LangSmithProvider
+from ai_truffle_hog.providers.multimatch import CompiledMultiMatcher
 from ai_truffle_hog.providers.openai import OpenAIProvider
 from ai_truffle_hog.providers.replicate import ReplicateProvider
 
@@ -19,20 +25,70 @@ class ProviderRegistry:
     """Registry for all supported AI providers.
 
     Provides methods to register, retrieve, and iterate over
-    provider implementations.
+    provider implementations. Once ``freeze`` is called the registry is
+    read-only and can be shared between threads.
     """
 
     def __init__(self) -> None:
         """Initialize an empty registry."""
         self._providers: dict[str, BaseProvider] = {}
+        self._providers_view = MappingProxyType(self._providers)
+        self._all: tuple[BaseProvider, ...] = ()
+        self._matcher: CompiledMultiMatcher | None = None
+        self._frozen = False
 
     def register(self, provider: BaseProvider) -> None:
         """Register a provider instance.
 
         Args:
             provider: Provider instance to register.
+
+        Raises:
+            RuntimeError: If the registry has been frozen.
         """
+        if self._frozen:
+            msg = f"Cannot register provider '{provider.name}': registry is frozen"
+            raise RuntimeError(msg)
         self._providers[provider.name] = provider
+        self._all = tuple(self._providers.values())
+        self._matcher = None
+
+    def freeze(self) -> None:
+        """Make the registry read-only.
+
+        The combined matcher is compiled here, so frozen registries never
+        mutate state when read from several threads.
+        """
+        _ = self.matcher
+        self._frozen = True
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the registry rejects further registrations."""
+        return self._frozen
+
+    @property
+    def providers(self) -> Mapping[str, BaseProvider]:
+        """Read-only mapping of provider name to provider instance."""
+        return self._providers_view
+
+    @property
+    def matcher(self) -> CompiledMultiMatcher:
+        """Combined matcher over every registered provider's patterns."""
+        if self._matcher is None:
+            self._matcher = CompiledMultiMatcher(self._providers.values())
+        return self._matcher
+
+    def scan(self, text: str) -> Iterator[tuple[str, int, int]]:
+        """Scan text once for keys of any registered provider.
+
+        Args:
+            text: Text to scan.
+
+        Yields:
+            Tuple of (provider name, start offset, end offset) per hit.
+        """
+        return self.matcher.scan(text)
 
     def get(self, name: str) -> BaseProvider | None:
         """Get a provider by name.
@@ -45,13 +101,13 @@ class ProviderRegistry:
         """
         return self._providers.get(name)
 
-    def all(self) -> list[BaseProvider]:
+    def all(self) -> tuple[BaseProvider, ...]:
         """Get all registered providers.
 
         Returns:
-            List of all provider instances.
+            Tuple of all provider instances, in registration order.
         """
-        return list(self._providers.values())
+        return self._all
 
     def names(self) -> list[str]:
         """Get all provider names.
@@ -70,23 +126,34 @@ class ProviderRegistry:
         return name in self._providers
 
 
-# Global registry instance
-_registry: ProviderRegistry | None = None
+# Serializes the first build of the global registry
+_registry_lock = threading.Lock()
 
 
+@functools.cache
 def get_registry() -> ProviderRegistry:
     """Get the global provider registry.
 
-    Initializes the registry with all providers on first access.
+    Initializes and freezes the registry with all providers on first
+    access. Safe to call from several threads at once; later calls are a
+    plain cache hit.
 
     Returns:
         The global ProviderRegistry instance.
     """
-    global _registry
-    if _registry is None:
-        _registry = ProviderRegistry()
-        _initialize_providers(_registry)
-    return _registry
+    # functools.cache may run this more than once if threads race on the
+    # first call, so the build itself is cached and serialized
+    with _registry_lock:
+        return _build_registry()
+
+
+@functools.cache
+def _build_registry() -> ProviderRegistry:
+    """Create, populate and freeze the global registry."""
+    registry = ProviderRegistry()
+    _initialize_providers(registry)
+    registry.freeze()
+    return registry
 
 
 def _initialize_providers(registry: ProviderRegistry) -> None:
@@ -7,6 +7,7 @@ displaying scan results in a formatted table.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import TYPE_CHECKING, ClassVar
 
 from rich.console import Console
@@ -18,6 +19,18 @@ from rich.text import Text
 if TYPE_CHECKING:
     from ai_truffle_hog.core.scanner import ScanMatch
 
+# Longest file path shown in the findings table before truncation
+MAX_PATH_WIDTH = 40
+# Characters of a truncated path kept after the leading "..."
+_PATH_TAIL_WIDTH = MAX_PATH_WIDTH - 3
+
+
+def _truncate_path(file_path: str) -> str:
+    """Shorten a path to its last MAX_PATH_WIDTH characters for display."""
+    if len(file_path) <= MAX_PATH_WIDTH:
+        return file_path
+    return "..." + file_path[-_PATH_TAIL_WIDTH:]
+
 
 @dataclass
 class ConsoleSummary:
@@ -44,6 +57,14 @@ class ConsoleSummary:
             self.matches_by_provider.get(provider, 0) + 1
         )
 
+    def sorted_providers(self) -> list[tuple[str, int]]:
+        """Return (provider, count) pairs, most findings first."""
+        return sorted(
+            self.matches_by_provider.items(),
+            key=itemgetter(1),
+            reverse=True,
+        )
+
 
 class ConsoleReporter:
     """Rich console reporter for scan results.
@@ -74,6 +95,23 @@ class ConsoleReporter:
         "langsmith": "yellow",
     }
 
+    # Provider labels and their bold styles, formatted once rather than
+    # per finding
+    _PROVIDER_LABELS: ClassVar[dict[str, str]] = {
+        provider: provider.upper() for provider in SEVERITY_COLORS
+    }
+    _LABEL_STYLES: ClassVar[dict[str, str]] = {
+        provider: f"bold {color}" for provider, color in SEVERITY_COLORS.items()
+    }
+
+    # Summary shown for clean scans; rendering does not modify it, so one
+    # instance is shared
+    _NO_SECRETS_PANEL: ClassVar[Panel] = Panel(
+        Text("✓ No secrets detected", style="green"),
+        title="Scan Complete",
+        border_style="green",
+    )
+
     # Status colors
     STATUS_COLORS: ClassVar[dict[str, str]] = {
         "valid": "red",
@@ -104,6 +142,14 @@ class ConsoleReporter:
         """Get color for provider severity."""
         return self.SEVERITY_COLORS.get(provider, "white")
 
+    def _get_label(self, provider: str) -> str:
+        """Get the uppercase display label for a provider."""
+        return self._PROVIDER_LABELS.get(provider) or provider.upper()
+
+    def _get_label_style(self, provider: str) -> str:
+        """Get the bold style for a provider label."""
+        return self._LABEL_STYLES.get(provider, "bold white")
+
     def print_header(self, title: str = "AI Truffle Hog Scan Results") -> None:
         """Print a styled header.
 
@@ -126,7 +172,7 @@ class ConsoleReporter:
             matches: List of scan matches to display.
         """
         if not matches:
-            self.console.print("[dim]No secrets found.[/dim]")
+            self.console.print(Text("No secrets found.", style="dim"))
             return
 
         table = Table(
@@ -143,17 +189,12 @@ class ConsoleReporter:
         table.add_column("Entropy", justify="right", style="blue")
 
         for match in matches:
-            color = self._get_severity_color(match.provider)
-            provider_text = Text(match.provider.upper(), style=f"bold {color}")
-
-            # Truncate file path if too long
-            file_path = match.file_path
-            if len(file_path) > 40:
-                file_path = "..." + file_path[-37:]
-
             table.add_row(
-                provider_text,
-                file_path,
+                Text(
+                    self._get_label(match.provider),
+                    style=self._get_label_style(match.provider),
+                ),
+                _truncate_path(match.file_path),
                 str(match.line_number),
                 match.redacted_value,
                 f"{match.entropy:.2f}" if match.entropy else "-",
@@ -167,27 +208,34 @@ class ConsoleReporter:
         Args:
             match: The match to display in detail.
         """
-        color = self._get_severity_color(match.provider)
-
-        self.console.print()
-        self.console.print(
-            f"[bold {color}]● {match.provider.upper()}[/bold {color}] "
-            f"[dim]in[/dim] [green]{match.file_path}[/green]"
-            f"[dim]:[/dim][yellow]{match.line_number}[/yellow]"
+        # Build the whole block as one Text so Rich renders it in one pass
+        text = Text("\n")
+        text.append(
+            f"● {self._get_label(match.provider)}",
+            style=self._get_label_style(match.provider),
         )
+        text.append(" ")
+        text.append("in", style="dim")
+        text.append(" ")
+        text.append(match.file_path, style="green")
+        text.append(":", style="dim")
+        text.append(str(match.line_number), style="yellow")
 
         # Show context if available
         if self.show_context:
-            if match.context_before:
-                for line in match.context_before:
-                    self.console.print(f"  [dim]{line}[/dim]")
+            for line in match.context_before:
+                text.append("\n  ")
+                text.append(line, style="dim")
 
             # Highlight the secret line
-            self.console.print(f"  [bold red]{match.line_content}[/bold red]")
+            text.append("\n  ")
+            text.append(match.line_content, style="bold red")
 
-            if match.context_after:
-                for line in match.context_after:
-                    self.console.print(f"  [dim]{line}[/dim]")
+            for line in match.context_after:
+                text.append("\n  ")
+                text.append(line, style="dim")
+
+        self.console.print(text)
 
     def print_summary(self, summary: ConsoleSummary) -> None:
         """Print summary statistics.
@@ -198,13 +246,7 @@ class ConsoleReporter:
         self.console.print()
 
         if summary.total_matches == 0:
-            self.console.print(
-                Panel(
-                    "[green]✓ No secrets detected[/green]",
-                    title="Scan Complete",
-                    border_style="green",
-                )
-            )
+            self.console.print(self._NO_SECRETS_PANEL)
             return
 
         # Create summary table
@@ -246,14 +288,10 @@ class ConsoleReporter:
             provider_table.add_column("Provider", style="cyan")
             provider_table.add_column("Count", justify="right", style="yellow")
 
-            for provider, count in sorted(
-                summary.matches_by_provider.items(),
-                key=lambda x: x[1],
-                reverse=True,
-            ):
+            for provider, count in summary.sorted_providers():
                 color = self._get_severity_color(provider)
                 provider_table.add_row(
-                    Text(provider.upper(), style=color),
+                    Text(self._get_label(provider), style=color),
                     str(count),
                 )
 
@@ -265,7 +303,7 @@ class ConsoleReporter:
         Args:
             message: Error message to display.
         """
-        self.console.print(f"[bold red]Error:[/bold red] {message}")
+        self.console.print(Text.assemble(("Error:", "bold red"), " ", message))
 
     def print_warning(self, message: str) -> None:
         """Print a warning message.
@@ -273,7 +311,7 @@ class ConsoleReporter:
         Args:
             message: Warning message to display.
         """
-        self.console.print(f"[bold yellow]Warning:[/bold yellow] {message}")
+        self.console.print(Text.assemble(("Warning:", "bold yellow"), " ", message))
 
     def print_info(self, message: str) -> None:
         """Print an info message.
@@ -282,7 +320,7 @@ class ConsoleReporter:
             message: Info message to display.
         """
         if self.verbose:
-            self.console.print(f"[dim]{message}[/dim]")
+            self.console.print(Text(message, style="dim"))
 
     def create_progress(self, description: str = "Scanning...") -> Progress:  # noqa: ARG002
         """Create a progress indicator.
@@ -310,16 +348,20 @@ class ConsoleReporter:
             file_path: Path to the file.
             matches: List of matches in the file.
         """
-        self.console.print()
-        self.console.print(f"[bold blue]📁 {file_path}[/bold blue]")
+        # Build the file header and every match line as one Text
+        text = Text("\n")
+        text.append(f"📁 {file_path}", style="bold blue")
 
         for match in matches:
             color = self._get_severity_color(match.provider)
-            self.console.print(
-                f"  [dim]Line {match.line_number}:[/dim] "
-                f"[{color}]{match.provider.upper()}[/{color}] "
-                f"[red]{match.redacted_value}[/red]"
-            )
+            text.append("\n  ")
+            text.append(f"Line {match.line_number}:", style="dim")
+            text.append(" ")
+            text.append(self._get_label(match.provider), style=color)
+            text.append(" ")
+            text.append(match.redacted_value, style="red")
+
+        self.console.print(text)
 
 
 def create_console_reporter(
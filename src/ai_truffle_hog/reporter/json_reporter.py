@@ -6,18 +6,26 @@ exporting scan results to files.
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass, field
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from ai_truffle_hog.reporter.serialization import (
+    STREAM_BUFFER_SIZE,
+    dump,
+    dumps,
+    dumps_str,
+)
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
     from ai_truffle_hog.core.scanner import ScanMatch
 
 
-@dataclass
+@dataclass(slots=True)
 class JSONFinding:
     """JSON representation of a scan finding.
 
@@ -49,6 +57,27 @@ class JSONFinding:
     context_after: list[str] = field(default_factory=list)
     validation_status: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary.
+
+        Equivalent to ``dataclasses.asdict`` but copies the context lists
+        shallowly instead of deep-copying every field.
+        """
+        return {
+            "provider": self.provider,
+            "pattern_name": self.pattern_name,
+            "secret_redacted": self.secret_redacted,
+            "file_path": self.file_path,
+            "line_number": self.line_number,
+            "column_start": self.column_start,
+            "column_end": self.column_end,
+            "line_content": self.line_content,
+            "entropy": self.entropy,
+            "context_before": self.context_before.copy(),
+            "context_after": self.context_after.copy(),
+            "validation_status": self.validation_status,
+        }
+
 
 @dataclass
 class JSONReport:
@@ -126,8 +155,9 @@ class JSONReporter:
             column_end=match.column_end,
             line_content=match.line_content,
             entropy=match.entropy,
-            context_before=list(match.context_before) if self.include_context else [],
-            context_after=list(match.context_after) if self.include_context else [],
+            # Shared with the match; to_dict copies them into the output
+            context_before=match.context_before if self.include_context else [],
+            context_after=match.context_after if self.include_context else [],
         )
 
     def _compute_summary(
@@ -142,29 +172,27 @@ class JSONReporter:
         Returns:
             Summary dictionary.
         """
-        providers: dict[str, int] = {}
-        files: set[str] = set()
-
-        for match in matches:
-            providers[match.provider] = providers.get(match.provider, 0) + 1
-            files.add(match.file_path)
+        providers = Counter(match.provider for match in matches)
+        files = {match.file_path for match in matches}
 
         return {
             "total_findings": len(matches),
             "unique_files": len(files),
-            "findings_by_provider": providers,
+            "findings_by_provider": dict(providers),
         }
 
     def generate(
         self,
         matches: list[ScanMatch],
         scan_target: str = "",
+        timestamp: str | None = None,
     ) -> dict[str, Any]:
         """Generate JSON output from scan matches.
 
         Args:
             matches: List of scan matches to report.
             scan_target: Description of what was scanned.
+            timestamp: ISO 8601 scan time to record; defaults to now.
 
         Returns:
             JSON structure as a dictionary.
@@ -175,7 +203,7 @@ class JSONReporter:
         report = JSONReport(
             tool=self.tool_name,
             version=self.tool_version,
-            timestamp=datetime.now(UTC).isoformat(),
+            timestamp=timestamp or datetime.now(UTC).isoformat(),
             scan_target=scan_target,
             total_findings=len(findings),
             findings=findings,
@@ -189,7 +217,7 @@ class JSONReporter:
             "timestamp": report.timestamp,
             "scan_target": report.scan_target,
             "total_findings": report.total_findings,
-            "findings": [asdict(f) for f in report.findings],
+            "findings": [f.to_dict() for f in report.findings],
             "summary": report.summary,
         }
 
@@ -198,6 +226,7 @@ class JSONReporter:
         matches: list[ScanMatch],
         scan_target: str = "",
         pretty: bool = True,
+        timestamp: str | None = None,
     ) -> str:
         """Generate JSON output as a string.
 
@@ -205,14 +234,13 @@ class JSONReporter:
             matches: List of scan matches to report.
             scan_target: Description of what was scanned.
             pretty: Whether to format the JSON with indentation.
+            timestamp: ISO 8601 scan time to record; defaults to now.
 
         Returns:
             JSON string.
         """
-        data = self.generate(matches, scan_target)
-        if pretty:
-            return json.dumps(data, indent=2, ensure_ascii=False)
-        return json.dumps(data, ensure_ascii=False)
+        data = self.generate(matches, scan_target, timestamp)
+        return dumps_str(data, pretty)
 
     def write(
         self,
@@ -220,6 +248,7 @@ class JSONReporter:
         output_path: Path,
         scan_target: str = "",
         pretty: bool = True,
+        timestamp: str | None = None,
     ) -> None:
         """Write JSON output to a file.
 
@@ -228,9 +257,70 @@ class JSONReporter:
             output_path: Path to write the JSON file.
             scan_target: Description of what was scanned.
             pretty: Whether to format the JSON with indentation.
+            timestamp: ISO 8601 scan time to record; defaults to now.
+        """
+        dump(self.generate(matches, scan_target, timestamp), output_path, pretty)
+
+    def write_stream(
+        self,
+        matches: Iterable[ScanMatch],
+        output_path: Path,
+        scan_target: str = "",
+        pretty: bool = True,
+        timestamp: str | None = None,
+    ) -> None:
+        """Write JSON output to a file while consuming matches.
+
+        Each finding is encoded and written as soon as it is read, so the
+        matches can come from a generator and are never held in memory
+        together. Because the number of findings is only known at the
+        end, ``total_findings`` follows ``findings`` in the document;
+        otherwise the content is the same as ``write`` produces.
+
+        Args:
+            matches: Scan matches to report, consumed once.
+            output_path: Path to write the JSON file.
+            scan_target: Description of what was scanned.
+            pretty: Whether to format the JSON with indentation.
+            timestamp: ISO 8601 scan time to record; defaults to now.
         """
-        json_str = self.generate_json(matches, scan_target, pretty)
-        output_path.write_text(json_str, encoding="utf-8")
+        header = {
+            "tool": self.tool_name,
+            "version": self.tool_version,
+            "timestamp": timestamp or datetime.now(UTC).isoformat(),
+            "scan_target": scan_target,
+        }
+        # Nested values are indented one level deeper than top-level keys
+        indent = b"\n    " if pretty else b""
+        providers: Counter[str] = Counter()
+        files: set[str] = set()
+        total = 0
+
+        with output_path.open("wb", buffering=STREAM_BUFFER_SIZE) as fp:
+            # Reopen the header object and start the findings array
+            fp.write(dumps(header, pretty)[:-1].rstrip())
+            fp.write(b',\n  "findings": [' if pretty else b',"findings":[')
+
+            for match in matches:
+                finding = dumps(self._match_to_finding(match).to_dict(), pretty)
+                if total:
+                    fp.write(b",")
+                fp.write(indent + finding.replace(b"\n", indent))
+                providers[match.provider] += 1
+                files.add(match.file_path)
+                total += 1
+
+            fp.write(b"\n  ]" if pretty and total else b"]")
+            trailer = {
+                "total_findings": total,
+                "summary": {
+                    "total_findings": total,
+                    "unique_files": len(files),
+                    "findings_by_provider": dict(providers),
+                },
+            }
+            # Splice the trailer's keys into the still-open report object
+            fp.write(b"," + dumps(trailer, pretty)[1:])
 
 
 def create_json_reporter(
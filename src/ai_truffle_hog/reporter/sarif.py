@@ -9,11 +9,14 @@ SARIF 2.1.0 specification: https://docs.oasis-open.org/sarif/sarif/v2.1.0/sarif-
 
 from __future__ import annotations
 
-import json
+import hashlib
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from ai_truffle_hog.reporter.serialization import dump, dumps_str
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -29,7 +32,7 @@ TOOL_VERSION = "0.1.0"
 TOOL_INFORMATION_URI = "https://github.com/ai-truffle-hog/ai-truffle-hog"
 
 
-@dataclass
+@dataclass(slots=True)
 class SARIFLocation:
     """SARIF physical location representation."""
 
@@ -60,7 +63,7 @@ class SARIFLocation:
         return location
 
 
-@dataclass
+@dataclass(frozen=True)
 class SARIFRule:
     """SARIF rule definition for a provider pattern."""
 
@@ -70,7 +73,7 @@ class SARIFRule:
     full_description: str = ""
     help_uri: str = ""
     default_severity: str = "error"
-    tags: list[str] = field(default_factory=list)
+    tags: tuple[str, ...] = ()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to SARIF rule format."""
@@ -88,12 +91,21 @@ class SARIFRule:
             rule["helpUri"] = self.help_uri
 
         if self.tags:
-            rule["properties"] = {"tags": self.tags}
+            rule["properties"] = {"tags": list(self.tags)}
 
         return rule
 
+    @cached_property
+    def as_dict(self) -> dict[str, Any]:
+        """SARIF rule format built once per rule.
+
+        The same dictionary is returned on every access and shared by
+        every report listing the rule, so it must not be modified.
+        """
+        return self.to_dict()
 
-@dataclass
+
+@dataclass(slots=True)
 class SARIFResult:
     """SARIF result representation of a finding."""
 
@@ -102,6 +114,7 @@ class SARIFResult:
     level: str
     locations: list[SARIFLocation] = field(default_factory=list)
     fingerprint: str = ""
+    occurrence_count: int = 1
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to SARIF result format."""
@@ -115,6 +128,9 @@ class SARIFResult:
         if self.fingerprint:
             result["fingerprints"] = {"primaryLocationLineHash": self.fingerprint}
 
+        if self.occurrence_count > 1:
+            result["occurrenceCount"] = self.occurrence_count
+
         return result
 
 
@@ -145,6 +161,11 @@ class SARIFReporter:
         "langsmith": "warning",
     }
 
+    # Uppercase provider labels used in rule and result text
+    _PROVIDER_LABELS: ClassVar[dict[str, str]] = {
+        provider: provider.upper() for provider in SEVERITY_LEVELS
+    }
+
     def __init__(
         self,
         tool_name: str = TOOL_NAME,
@@ -158,7 +179,15 @@ class SARIFReporter:
         """
         self.tool_name = tool_name
         self.tool_version = tool_version
+        # Rules referenced by the last generated report
         self._rules: dict[str, SARIFRule] = {}
+        # (provider, pattern name) -> rule, kept across reports so rule IDs
+        # and descriptions are only formatted once per pattern
+        self._rule_cache: dict[tuple[str, str], SARIFRule] = {}
+
+    def _get_label(self, provider: str) -> str:
+        """Get the uppercase display label for a provider."""
+        return self._PROVIDER_LABELS.get(provider) or provider.upper()
 
     def _get_or_create_rule(self, provider: str, pattern_name: str) -> SARIFRule:
         """Get or create a rule for a provider pattern.
@@ -170,36 +199,50 @@ class SARIFReporter:
         Returns:
             SARIFRule for the provider pattern.
         """
-        rule_id = f"{provider}/{pattern_name}".replace(" ", "-").lower()
-
-        if rule_id not in self._rules:
-            self._rules[rule_id] = SARIFRule(
-                id=rule_id,
-                name=f"{provider.upper()} API Key Exposure",
-                short_description=f"Exposed {provider.upper()} API key detected",
-                full_description=(
-                    f"An API key for {provider.upper()} was found in the source code. "
-                    "API keys should be stored in environment variables or secret managers, "
-                    "not committed to version control."
-                ),
-                default_severity=self.SEVERITY_LEVELS.get(provider, "warning"),
-                tags=["security", "secrets", "api-key", provider],
-            )
-
-        return self._rules[rule_id]
-
-    def _match_to_result(self, match: ScanMatch) -> SARIFResult:
-        """Convert a ScanMatch to a SARIF result.
+        rule = self._rule_cache.get((provider, pattern_name))
+        if rule is None:
+            rule = self._build_rule(provider, pattern_name)
+            self._rule_cache[provider, pattern_name] = rule
+
+        if rule.id not in self._rules:
+            self._rules[rule.id] = rule
+        return rule
+
+    def _build_rule(self, provider: str, pattern_name: str) -> SARIFRule:
+        """Build the rule for a provider pattern.
 
         Args:
-            match: The scan match to convert.
+            provider: Provider name.
+            pattern_name: Name of the pattern.
 
         Returns:
-            SARIFResult for the match.
+            New SARIFRule.
         """
-        rule = self._get_or_create_rule(match.provider, match.pattern_name)
+        label = self._get_label(provider)
+        return SARIFRule(
+            id=f"{provider}/{pattern_name}".replace(" ", "-").lower(),
+            name=f"{label} API Key Exposure",
+            short_description=f"Exposed {label} API key detected",
+            full_description=(
+                f"An API key for {label} was found in the source code. "
+                "API keys should be stored in environment variables or secret managers, "
+                "not committed to version control."
+            ),
+            default_severity=self.SEVERITY_LEVELS.get(provider, "warning"),
+            tags=("security", "secrets", "api-key", provider),
+        )
+
+    @staticmethod
+    def _match_to_location(match: ScanMatch) -> SARIFLocation:
+        """Convert a ScanMatch to a SARIF location.
 
-        location = SARIFLocation(
+        Args:
+            match: The scan match to convert.
+
+        Returns:
+            SARIFLocation of the matched secret.
+        """
+        return SARIFLocation(
             file_path=match.file_path,
             start_line=match.line_number,
             start_column=match.column_start + 1,  # SARIF uses 1-based columns
@@ -208,38 +251,70 @@ class SARIFReporter:
             snippet=match.line_content,
         )
 
-        # Create redacted message
-        message = (
-            f"Exposed {match.provider.upper()} API key: {match.redacted_value}"
-            if hasattr(match, "redacted_value")
-            else f"Exposed {match.provider.upper()} API key detected"
-        )
+    def _matches_to_result(self, matches: list[ScanMatch]) -> SARIFResult:
+        """Convert matches of one rule on one line to a SARIF result.
 
-        # Create fingerprint from file, line, and redacted value for deduplication
-        fingerprint = f"{match.file_path}:{match.line_number}:{match.provider}"
+        Args:
+            matches: The scan matches to convert, at least one.
+
+        Returns:
+            SARIFResult locating every match and naming each distinct key.
+        """
+        match = matches[0]
+        rule = self._get_or_create_rule(match.provider, match.pattern_name)
+
+        # Create redacted message
+        label = self._get_label(match.provider)
+        values = list(dict.fromkeys(m.redacted_value for m in matches))
+        if len(values) == 1:
+            message = f"Exposed {label} API key: {values[0]}"
+        else:
+            message = f"Exposed {label} API keys: {', '.join(values)}"
+
+        # Fingerprint file, line and provider for deduplication; hashing
+        # keeps it short and avoids embedding the path
+        fingerprint = hashlib.blake2b(
+            f"{match.file_path}\0{match.line_number}\0{match.provider}".encode(),
+            digest_size=8,
+        ).hexdigest()
 
         return SARIFResult(
             rule_id=rule.id,
             message=message,
             level=rule.default_severity,
-            locations=[location],
+            locations=[self._match_to_location(m) for m in matches],
             fingerprint=fingerprint,
+            occurrence_count=len(matches),
         )
 
-    def generate(self, matches: list[ScanMatch]) -> dict[str, Any]:
+    def generate(
+        self,
+        matches: list[ScanMatch],
+        timestamp: str | None = None,
+    ) -> dict[str, Any]:
         """Generate SARIF output from scan matches.
 
+        Matches of the same rule on the same line of a file are reported as
+        one result listing every location, with ``occurrenceCount`` set.
+
         Args:
             matches: List of scan matches to report.
+            timestamp: ISO 8601 end time of the scan; defaults to now.
 
         Returns:
             SARIF JSON structure as a dictionary.
         """
-        # Reset rules for fresh generation
+        # Only list the rules this report's results refer to
         self._rules = {}
 
-        # Convert matches to results
-        results = [self._match_to_result(m) for m in matches]
+        # Convert matches to results, folding repeats of a rule on the same
+        # line into one result with several locations
+        grouped: dict[tuple[str, str, int], list[ScanMatch]] = {}
+        for match in matches:
+            rule = self._get_or_create_rule(match.provider, match.pattern_name)
+            key = (rule.id, match.file_path, match.line_number)
+            grouped.setdefault(key, []).append(match)
+        results = [self._matches_to_result(group) for group in grouped.values()]
 
         # Build SARIF structure
         sarif = {
@@ -252,14 +327,14 @@ class SARIFReporter:
                             "name": self.tool_name,
                             "version": self.tool_version,
                             "informationUri": TOOL_INFORMATION_URI,
-                            "rules": [r.to_dict() for r in self._rules.values()],
+                            "rules": [r.as_dict for r in self._rules.values()],
                         }
                     },
                     "results": [r.to_dict() for r in results],
                     "invocations": [
                         {
                             "executionSuccessful": True,
-                            "endTimeUtc": datetime.now(UTC).isoformat(),
+                            "endTimeUtc": timestamp or datetime.now(UTC).isoformat(),
                         }
                     ],
                 }
@@ -272,26 +347,27 @@ class SARIFReporter:
         self,
         matches: list[ScanMatch],
         pretty: bool = True,
+        timestamp: str | None = None,
     ) -> str:
         """Generate SARIF output as a JSON string.
 
         Args:
             matches: List of scan matches to report.
             pretty: Whether to format the JSON with indentation.
+            timestamp: ISO 8601 end time of the scan; defaults to now.
 
         Returns:
             SARIF JSON string.
         """
-        sarif = self.generate(matches)
-        if pretty:
-            return json.dumps(sarif, indent=2, ensure_ascii=False)
-        return json.dumps(sarif, ensure_ascii=False)
+        sarif = self.generate(matches, timestamp)
+        return dumps_str(sarif, pretty)
 
     def write(
         self,
         matches: list[ScanMatch],
         output_path: Path,
         pretty: bool = True,
+        timestamp: str | None = None,
     ) -> None:
         """Write SARIF output to a file.
 
@@ -299,9 +375,9 @@ class SARIFReporter:
             matches: List of scan matches to report.
             output_path: Path to write the SARIF file.
             pretty: Whether to format the JSON with indentation.
+            timestamp: ISO 8601 end time of the scan; defaults to now.
         """
-        sarif_json = self.generate_json(matches, pretty=pretty)
-        output_path.write_text(sarif_json, encoding="utf-8")
+        dump(self.generate(matches, timestamp), output_path, pretty)
 
     @property
     def rule_count(self) -> int:
@@ -0,0 +1,87 @@
+"""JSON encoding shared by the file reporters.
+
+Reports with thousands of findings spend most of their time encoding.
+When the optional ``orjson`` package is installed
+(``pip install ai-truffle-hog[fast-json]``) it is used instead of the
+standard library encoder, which is several times slower.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+ORJSON_AVAILABLE = orjson is not None
+
+# Write buffer used when streaming indented output to a file
+STREAM_BUFFER_SIZE = 64 * 1024
+
+
+def _dumps_stdlib(data: Any, pretty: bool) -> str:
+    """Encode data with the standard library in the shared output style."""
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def dumps(data: Any, pretty: bool = True) -> bytes:
+    """Encode data as UTF-8 JSON.
+
+    Non-ASCII characters are written as-is rather than escaped, and
+    compact output has no whitespace, whichever encoder is used.
+
+    Args:
+        data: JSON-compatible data to encode.
+        pretty: Whether to indent the output by two spaces.
+
+    Returns:
+        Encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return _dumps_stdlib(data, pretty).encode("utf-8")
+
+
+def dumps_str(data: Any, pretty: bool = True) -> str:
+    """Encode data as a JSON string.
+
+    Same output as ``dumps``, without encoding the standard library's
+    string result to bytes only to decode it again.
+
+    Args:
+        data: JSON-compatible data to encode.
+        pretty: Whether to indent the output by two spaces.
+
+    Returns:
+        JSON document.
+    """
+    if orjson is not None:
+        return dumps(data, pretty).decode("utf-8")
+    return _dumps_stdlib(data, pretty)
+
+
+def dump(data: Any, output_path: Path, pretty: bool = True) -> None:
+    """Encode data as UTF-8 JSON and write it to a file.
+
+    The standard library only uses its C encoder for compact one-shot
+    output; indented output is encoded in Python either way, so it is
+    streamed to the file instead of first being built as one string.
+
+    Args:
+        data: JSON-compatible data to encode.
+        output_path: File to write.
+        pretty: Whether to indent the output by two spaces.
+    """
+    if orjson is not None or not pretty:
+        output_path.write_bytes(dumps(data, pretty))
+        return
+    with output_path.open("w", encoding="utf-8", buffering=STREAM_BUFFER_SIZE) as fp:
+        json.dump(data, fp, indent=2, ensure_ascii=False)
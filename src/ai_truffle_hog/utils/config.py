@@ -4,6 +4,8 @@ This module provides configuration loading and management using
 Pydantic Settings with support for environment variables and TOML files.
 """
 
+import contextlib
+import functools
 from pathlib import Path
 
 from pydantic import Field
@@ -13,7 +15,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class ScannerSettings(BaseSettings):
     """Scanner configuration settings."""
 
-    model_config = SettingsConfigDict(env_prefix="ATH_SCANNER_")
+    model_config = SettingsConfigDict(env_prefix="ATH_SCANNER_", frozen=True)
 
     file_extensions: list[str] = Field(
         default=[
@@ -62,7 +64,7 @@ class ScannerSettings(BaseSettings):
 class ValidatorSettings(BaseSettings):
     """Validator configuration settings."""
 
-    model_config = SettingsConfigDict(env_prefix="ATH_VALIDATOR_")
+    model_config = SettingsConfigDict(env_prefix="ATH_VALIDATOR_", frozen=True)
 
     enabled: bool = Field(default=True, description="Enable key validation")
     timeout_seconds: int = Field(
@@ -90,7 +92,7 @@ class ValidatorSettings(BaseSettings):
 class LoggingSettings(BaseSettings):
     """Logging configuration settings."""
 
-    model_config = SettingsConfigDict(env_prefix="ATH_LOGGING_")
+    model_config = SettingsConfigDict(env_prefix="ATH_LOGGING_", frozen=True)
 
     level: str = Field(default="INFO", description="Log level")
     format: str = Field(
@@ -107,7 +109,7 @@ class LoggingSettings(BaseSettings):
 class OutputSettings(BaseSettings):
     """Output configuration settings."""
 
-    model_config = SettingsConfigDict(env_prefix="ATH_OUTPUT_")
+    model_config = SettingsConfigDict(env_prefix="ATH_OUTPUT_", frozen=True)
 
     format: str = Field(
         default="table",
@@ -131,6 +133,7 @@ class Settings(BaseSettings):
         env_prefix="ATH_",
         env_nested_delimiter="__",
         extra="ignore",
+        frozen=True,
     )
 
     scanner: ScannerSettings = Field(default_factory=ScannerSettings)
@@ -155,31 +158,31 @@ def load_config(config_path: Path | None = None) -> Settings:
     """
     config_data: dict[str, object] = {}
 
-    if config_path and config_path.exists():
+    if config_path is not None:
         import tomllib
 
-        with config_path.open("rb") as f:
+        # A missing file falls back to the defaults; opening it directly
+        # saves a separate existence check
+        with (
+            contextlib.suppress(FileNotFoundError),
+            config_path.open("rb") as f,
+        ):
             config_data = tomllib.load(f)
 
     return Settings(**config_data)  # type: ignore[arg-type]
 
 
-# Global settings instance
-_settings: Settings | None = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get the global settings instance.
 
-    Initializes settings on first access.
+    Initializes settings on first access. The instance is frozen, so it
+    can be shared by every caller without being copied.
 
     Returns:
         The global Settings instance.
     """
-    global _settings
-    if _settings is None:
-        _settings = load_config()
-    return _settings
+    return load_config()
 
 
 def reset_settings() -> None:
@@ -187,5 +190,4 @@ def reset_settings() -> None:
 
     Useful for testing.
     """
-    global _settings
-    _settings = None
+    get_settings.cache_clear()
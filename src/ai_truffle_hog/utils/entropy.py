@@ -6,6 +6,40 @@ which helps distinguish high-randomness secrets from normal text.
 
 import math
 from collections import Counter
+from collections.abc import Iterable
+
+# Character classes recognized by detect_charset
+HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+ALPHANUMERIC_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+)
+BASE64_CHARS = ALPHANUMERIC_CHARS | frozenset("+/=")
+
+# Largest character count looked up in the c * log2(c) table; rarer
+# strings with more repeats compute each term directly
+_XLOGX_LIMIT = 1 << 16
+
+# c * log2(c) indexed by c; covers any string shorter than the table and
+# is grown on demand by _xlogx_table
+_xlogx = [0.0] + [c * math.log2(c) for c in range(1, 256)]
+
+
+def _xlogx_table(count: int) -> list[float]:
+    """Return the c * log2(c) table, covering every value up to count.
+
+    The table doubles in size when a larger count needs it. It is replaced
+    rather than extended in place, so concurrent callers never see a
+    partially built table.
+    """
+    global _xlogx
+    table = _xlogx
+    if count >= len(table):
+        size = len(table)
+        while size <= count:
+            size *= 2
+        table = table + [c * math.log2(c) for c in range(len(table), size)]
+        _xlogx = table
+    return table
 
 
 def calculate_entropy(text: str) -> float:
@@ -37,13 +71,26 @@ def calculate_entropy(text: str) -> float:
     # Count character frequencies
     freq = Counter(text)
     length = len(text)
+    if len(freq) == 1:
+        return 0.0
+
+    # -Σ (c/n) * log2(c/n) == log2(n) - Σ c * log2(c) / n, which turns the
+    # per-character work into table lookups summed in C
+    table = _xlogx
+    if length >= len(table):
+        top = max(freq.values())
+        if top > _XLOGX_LIMIT:
+            return _direct_entropy(freq.values(), length)
+        table = _xlogx_table(top)
+    return math.log2(length) - sum(map(table.__getitem__, freq.values())) / length
 
-    # Calculate entropy: -Σ p(x) * log2(p(x))
+
+def _direct_entropy(counts: Iterable[int], length: int) -> float:
+    """Calculate entropy term by term: -Σ p(x) * log2(p(x))."""
     entropy = 0.0
-    for count in freq.values():
+    for count in counts:
         probability = count / length
         entropy -= probability * math.log2(probability)
-
     return entropy
 
 
@@ -63,6 +110,12 @@ def is_high_entropy(text: str, threshold: float = 4.5) -> bool:
         >>> is_high_entropy("a8f3k2m9x7n4p1q6")
         True
     """
+    # Entropy is at most log2 of the number of distinct characters, which is
+    # at most the length; most text is ruled out by these bounds alone
+    if text and (
+        math.log2(len(text)) < threshold or math.log2(len(set(text))) < threshold
+    ):
+        return False
     return calculate_entropy(text) >= threshold
 
 
@@ -86,21 +139,13 @@ def detect_charset(text: str) -> str:
     if not text:
         return "empty"
 
-    hex_chars = set("0123456789abcdefABCDEF")
-    base64_chars = set(
-        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="
-    )
-    alphanum_chars = set(
-        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
-    )
-
     text_chars = set(text)
 
-    if text_chars <= hex_chars:
+    if text_chars <= HEX_CHARS:
         return "hex"
-    elif text_chars <= alphanum_chars:
+    elif text_chars <= ALPHANUMERIC_CHARS:
         return "alphanumeric"
-    elif text_chars <= base64_chars:
+    elif text_chars <= BASE64_CHARS:
         return "base64"
     else:
         return "mixed"
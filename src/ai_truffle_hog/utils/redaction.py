@@ -4,8 +4,13 @@ This module provides functions for redacting sensitive values
 before they are written to logs or displayed to users.
 """
 
+import re
 from collections.abc import Callable
 
+# Pieces of the redacted middle section for the default mask character
+_MASK4 = "****"
+_SEP = "..."
+
 
 def redact_secret(
     secret: str,
@@ -52,7 +57,8 @@ def redact_secret(
     prefix = secret[:show_prefix]
     suffix = secret[-show_suffix:] if show_suffix > 0 else ""
 
-    return f"{prefix}{mask_char * 4}...{mask_char * 4}{suffix}"
+    mask = _MASK4 if mask_char == "*" else mask_char * 4
+    return "".join((prefix, mask, _SEP, mask, suffix))
 
 
 def redact_in_text(
@@ -86,17 +92,28 @@ def redact_in_text(
 def create_redaction_filter(secrets: list[str]) -> Callable[[str], str]:
     """Create a filter function that redacts multiple secrets.
 
+    The secrets are combined into one alternation, longest first, so each
+    text is scanned once however many secrets there are. Where secrets
+    overlap, the longest one starting at the earliest offset is redacted.
+
     Args:
         secrets: List of secret values to redact.
 
     Returns:
         A function that takes text and returns redacted text.
     """
+    replacements = {secret: redact_secret(secret) for secret in secrets if secret}
+    if not replacements:
+        return lambda text: text
+
+    pattern = re.compile(
+        "|".join(map(re.escape, sorted(replacements, key=len, reverse=True)))
+    )
+
+    def replace(match: re.Match[str]) -> str:
+        return replacements[match.group()]
 
     def filter_func(text: str) -> str:
-        result = text
-        for secret in secrets:
-            result = redact_in_text(result, secret)
-        return result
+        return pattern.sub(replace, text)
 
     return filter_func
@@ -1,5 +1,6 @@
 """Validator module for API key validation."""
 
+from ai_truffle_hog.validator.cache import ValidationCache
 from ai_truffle_hog.validator.client import (
     SecretCandidate,
     ValidationClient,
@@ -19,6 +20,7 @@ __all__ = [
     "RateLimiter",
     "SecretCandidate",
     "TokenBucket",
+    "ValidationCache",
     "ValidationClient",
     "ValidationClientConfig",
     "ValidationStats",
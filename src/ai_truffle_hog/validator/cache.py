@@ -0,0 +1,106 @@
+"""Caching of validation results.
+
+The same leaked key often appears in many files. Caching results lets
+every occurrence after the first skip the network round trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+
+from ai_truffle_hog.providers.base import ValidationResult, ValidationStatus
+
+# Outcomes that describe the key itself; errors and rate limits are
+# transient and must be retried rather than cached
+CACHEABLE_STATUSES = frozenset(
+    {
+        ValidationStatus.VALID,
+        ValidationStatus.INVALID,
+        ValidationStatus.QUOTA_EXCEEDED,
+    }
+)
+
+
+class ValidationCache:
+    """Least-recently-used cache of validation results with expiry.
+
+    Keys are stored as BLAKE2b digests, so the cache never holds plaintext
+    secrets. Entries expire after ``ttl`` seconds so that keys rotated
+    during a long run are eventually re-validated.
+
+    Example:
+        >>> cache = ValidationCache()
+        >>> if (result := cache.get("openai", key)) is None:
+        ...     result = await validate(key)
+        ...     cache.put("openai", key, result)
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached results.
+            ttl: Seconds a result stays valid.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # (provider name, key digest) -> (expiry time, result)
+        self._entries: OrderedDict[
+            tuple[str, bytes], tuple[float, ValidationResult]
+        ] = OrderedDict()
+
+    @staticmethod
+    def _cache_key(provider_name: str, key: str) -> tuple[str, bytes]:
+        """Build the cache key for a provider's API key."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        return provider_name, digest
+
+    def get(self, provider_name: str, key: str) -> ValidationResult | None:
+        """Look up a cached result.
+
+        Args:
+            provider_name: Name of the provider.
+            key: The API key.
+
+        Returns:
+            Cached ValidationResult, or None if absent or expired.
+        """
+        cache_key = self._cache_key(provider_name, key)
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return None
+
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._entries[cache_key]
+            return None
+
+        self._entries.move_to_end(cache_key)
+        return result
+
+    def put(self, provider_name: str, key: str, result: ValidationResult) -> None:
+        """Store a result if its status is worth caching.
+
+        Args:
+            provider_name: Name of the provider.
+            key: The API key.
+            result: Validation result to cache.
+        """
+        if result.status not in CACHEABLE_STATUSES:
+            return
+
+        cache_key = self._cache_key(provider_name, key)
+        self._entries[cache_key] = (time.monotonic() + self.ttl, result)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return number of cached results."""
+        return len(self._entries)
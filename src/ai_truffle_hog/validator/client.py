@@ -7,24 +7,28 @@ validating discovered API keys against provider endpoints.
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import logging
+import random
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 import httpx
 
 from ai_truffle_hog.providers.base import ValidationResult, ValidationStatus
 from ai_truffle_hog.providers.registry import get_registry
+from ai_truffle_hog.validator.cache import ValidationCache
+from ai_truffle_hog.validator.http_client import create_http_client, pool_limits
 from ai_truffle_hog.validator.rate_limiter import RateLimiter, create_rate_limiter
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
     from ai_truffle_hog.providers.base import BaseProvider
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SecretCandidate:
     """A secret candidate for validation.
 
@@ -56,7 +60,7 @@ class SecretCandidate:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationStats:
     """Statistics from a validation batch.
 
@@ -76,46 +80,52 @@ class ValidationStats:
     errors: int = 0
     skipped: int = 0
 
+    # Counter incremented for each status; other statuses only count as
+    # validated
+    _STATUS_FIELDS: ClassVar[dict[ValidationStatus, str]] = {
+        ValidationStatus.VALID: "valid",
+        ValidationStatus.INVALID: "invalid",
+        ValidationStatus.ERROR: "errors",
+        ValidationStatus.SKIPPED: "skipped",
+    }
+
     def add_result(self, result: ValidationResult) -> None:
         """Update stats based on a validation result."""
         self.validated += 1
-        match result.status:
-            case ValidationStatus.VALID:
-                self.valid += 1
-            case ValidationStatus.INVALID:
-                self.invalid += 1
-            case ValidationStatus.ERROR:
-                self.errors += 1
-            case ValidationStatus.SKIPPED:
-                self.skipped += 1
-            case _:
-                pass
-
-
-@dataclass
+        field = self._STATUS_FIELDS.get(result.status)
+        if field is not None:
+            setattr(self, field, getattr(self, field) + 1)
+
+
+@dataclass(slots=True)
 class ValidationClientConfig:
     """Configuration for the validation client.
 
     Attributes:
         timeout: HTTP request timeout in seconds.
         max_concurrent: Maximum concurrent validations.
+        max_concurrent_per_host: Maximum concurrent validations against any
+            single provider host.
         skip_validation: If True, mark all as skipped without HTTP calls.
         retry_on_rate_limit: If True, retry after rate limit delay.
         max_retries: Maximum number of retries per request.
+        max_backoff: Upper bound in seconds on any rate limit backoff.
     """
 
     timeout: float = 10.0
     max_concurrent: int = 5
+    max_concurrent_per_host: int = 10
     skip_validation: bool = False
     retry_on_rate_limit: bool = True
     max_retries: int = 3
+    max_backoff: float = 60.0
 
 
 class ValidationClient:
     """Async HTTP client to validate API keys against provider endpoints.
 
     This client handles:
-    - Async HTTP requests with proper timeout handling
+    - Async HTTP requests over a pooled, keep-alive connection client
     - Rate limiting per provider
     - Batch validation with concurrency limits
     - Error handling and retries
@@ -132,18 +142,28 @@ class ValidationClient:
         self,
         config: ValidationClientConfig | None = None,
         rate_limiter: RateLimiter | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        cache: ValidationCache | None = None,
     ) -> None:
         """Initialize the validation client.
 
         Args:
             config: Client configuration.
             rate_limiter: Rate limiter instance.
+            http_client: HTTP client to share with other users, e.g. from
+                ``http_client.get_client()``. It is not closed by ``close``.
+                If omitted, the client creates and owns its own.
+            cache: Validation result cache, which may be shared between
+                clients. If omitted, the client uses a private one.
         """
         self.config = config or ValidationClientConfig()
         self._rate_limiter = rate_limiter or create_rate_limiter()
         self._registry = get_registry()
+        self._shared_client = http_client
+        self._cache = cache if cache is not None else ValidationCache()
         self._client: httpx.AsyncClient | None = None
         self._semaphore: asyncio.Semaphore | None = None
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
 
     @property
     def is_open(self) -> bool:
@@ -153,9 +173,9 @@ class ValidationClient:
     async def _ensure_client(self) -> httpx.AsyncClient:
         """Ensure HTTP client is created."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.config.timeout),
-                follow_redirects=True,
+            self._client = self._shared_client or create_http_client(
+                self.config.timeout,
+                limits=pool_limits(self.config.max_concurrent),
             )
             self._semaphore = asyncio.Semaphore(self.config.max_concurrent)
         return self._client
@@ -163,9 +183,11 @@ class ValidationClient:
     async def close(self) -> None:
         """Close the HTTP client and release resources."""
         if self._client is not None:
-            await self._client.aclose()
+            if self._client is not self._shared_client:
+                await self._client.aclose()
             self._client = None
             self._semaphore = None
+            self._host_semaphores.clear()
 
     async def __aenter__(self) -> ValidationClient:
         """Enter async context manager."""
@@ -181,19 +203,20 @@ class ValidationClient:
         """Exit async context manager."""
         await self.close()
 
-    async def validate_key(
+    def _result_without_request(
         self,
         provider: BaseProvider,
         key: str,
-    ) -> ValidationResult:
-        """Validate a single API key against a provider.
+    ) -> ValidationResult | None:
+        """Get a key's validation result if it is known without a request.
 
         Args:
             provider: The provider to validate against.
             key: The API key to validate.
 
         Returns:
-            ValidationResult with the validation status.
+            ValidationResult if validation is skipped, the key is malformed
+            or its result is cached; otherwise None.
         """
         if self.config.skip_validation:
             return ValidationResult(
@@ -201,22 +224,41 @@ class ValidationClient:
                 message="Validation skipped by configuration",
             )
 
+        # Malformed keys cannot be valid; don't spend a request or rate limit
+        # token on them
+        if provider.quick_reject(key):
+            return ValidationResult(
+                status=ValidationStatus.INVALID,
+                message="Key does not match the provider's key format",
+            )
+
+        return self._cache.get(provider.name, key)
+
+    async def validate_key(
+        self,
+        provider: BaseProvider,
+        key: str,
+    ) -> ValidationResult:
+        """Validate a single API key against a provider.
+
+        Args:
+            provider: The provider to validate against.
+            key: The API key to validate.
+
+        Returns:
+            ValidationResult with the validation status.
+        """
+        known = self._result_without_request(provider, key)
+        if known is not None:
+            return known
+
         client = await self._ensure_client()
 
         # Rate limiting
         await self._rate_limiter.acquire(provider.name)
 
-        # Build request
-        headers = provider.build_auth_header(key)
-        endpoint = provider.validation_endpoint
-
         try:
-            response = await client.get(endpoint, headers=headers)
-            body: dict[str, object] | None = None
-            with contextlib.suppress(Exception):
-                body = response.json()
-
-            return provider.interpret_response(response.status_code, body)
+            result = await provider.validate(key, client)
 
         except httpx.TimeoutException:
             return ValidationResult(
@@ -235,6 +277,11 @@ class ValidationClient:
                 message=f"Unexpected error: {e!s}",
             )
 
+        if result.status != ValidationStatus.RATE_LIMITED:
+            self._rate_limiter.recover(provider.name)
+        self._cache.put(provider.name, key, result)
+        return result
+
     async def _validate_with_retry(
         self,
         provider: BaseProvider,
@@ -252,55 +299,97 @@ class ValidationClient:
         for attempt in range(self.config.max_retries):
             result = await self.validate_key(provider, key)
 
-            # Retry on rate limit if configured
-            if (
-                result.status == ValidationStatus.RATE_LIMITED
-                and self.config.retry_on_rate_limit
-                and attempt < self.config.max_retries - 1
-            ):
-                # Exponential backoff
-                wait_time = 2**attempt
-                logger.debug(
-                    "Rate limited by %s, retrying in %ds (attempt %d/%d)",
-                    provider.name,
-                    wait_time,
-                    attempt + 1,
-                    self.config.max_retries,
-                )
-                await asyncio.sleep(wait_time)
-                continue
+            if result.status == ValidationStatus.RATE_LIMITED:
+                # Honour Retry-After, else jittered exponential backoff. The
+                # pause applies to the provider's bucket on every 429, retried
+                # or not, so other keys for the same provider wait too instead
+                # of drawing more 429s.
+                wait_time = result.retry_after
+                if wait_time is None:
+                    wait_time = 2**attempt * random.uniform(0.5, 1.0)
+                wait_time = min(wait_time, self.config.max_backoff)
+                self._rate_limiter.backoff(provider.name, wait_time)
+
+                # Retry on rate limit if configured
+                if (
+                    self.config.retry_on_rate_limit
+                    and attempt < self.config.max_retries - 1
+                ):
+                    logger.debug(
+                        "Rate limited by %s, retrying in %.1fs (attempt %d/%d)",
+                        provider.name,
+                        wait_time,
+                        attempt + 1,
+                        self.config.max_retries,
+                    )
+                    continue
 
             return result
 
         return result  # Return last result after all retries
 
-    async def _validate_candidate(
+    def _host_semaphore(self, provider: BaseProvider) -> asyncio.Semaphore:
+        """Get the semaphore limiting concurrent requests to a provider's host."""
+        origin = provider.origin
+        semaphore = self._host_semaphores.get(origin)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.config.max_concurrent_per_host)
+            self._host_semaphores[origin] = semaphore
+        return semaphore
+
+    async def _validate_bounded(
         self,
-        candidate: SecretCandidate,
-    ) -> SecretCandidate:
-        """Validate a single secret candidate.
+        provider: BaseProvider,
+        key: str,
+    ) -> ValidationResult:
+        """Validate a key within the global and per-host concurrency limits.
+
+        The host slot is taken first so that keys waiting on a busy host do
+        not hold global slots other hosts could use.
 
         Args:
-            candidate: The candidate to validate.
+            provider: The provider to validate against.
+            key: The API key to validate.
 
         Returns:
-            The candidate with validation_result set.
+            ValidationResult with the validation status.
         """
-        provider = self._registry.get(candidate.provider_name)
-        if provider is None:
-            candidate.validation_result = ValidationResult(
-                status=ValidationStatus.ERROR,
-                message=f"Unknown provider: {candidate.provider_name}",
-            )
-            return candidate
+        # Callers open the client first; a private semaphore would not limit
+        # anything
+        assert self._semaphore is not None
+        async with self._host_semaphore(provider), self._semaphore:
+            return await self._validate_with_retry(provider, key)
 
-        # Use semaphore for concurrency limiting
-        semaphore = self._semaphore or asyncio.Semaphore(self.config.max_concurrent)
-        async with semaphore:
-            result = await self._validate_with_retry(provider, candidate.secret_value)
-            candidate.validation_result = result
+    async def _drain(
+        self,
+        pending: Iterator[tuple[BaseProvider, list[SecretCandidate]]],
+        stats: ValidationStats,
+    ) -> None:
+        """Validate groups of duplicate candidates until the queue is empty.
+
+        Several workers may share one iterator. Each group is validated once
+        and every candidate in it receives the result.
+
+        Args:
+            pending: Queue of (provider, candidates sharing a key) pairs.
+            stats: Statistics to update with each result.
+        """
+        for provider, group in pending:
+            try:
+                result = await self._validate_bounded(provider, group[0].secret_value)
+            except Exception as e:
+                error = ValidationResult(
+                    status=ValidationStatus.ERROR,
+                    message=str(e),
+                )
+                for candidate in group:
+                    candidate.validation_result = error
+                    stats.errors += 1
+                continue
 
-        return candidate
+            for candidate in group:
+                candidate.validation_result = result
+                stats.add_result(result)
 
     async def validate_batch(
         self,
@@ -321,22 +410,40 @@ class ValidationClient:
         if not candidates:
             return candidates, stats
 
-        # Create tasks for all candidates
-        tasks = [self._validate_candidate(c) for c in candidates]
-
-        # Run all validations concurrently (semaphore limits concurrency)
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results and update stats
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                candidates[i].validation_result = ValidationResult(
+        # Validate each distinct (provider, key) once; duplicates share the result
+        groups: dict[str, dict[str, list[SecretCandidate]]] = {}
+        for candidate in candidates:
+            groups.setdefault(candidate.provider_name, {}).setdefault(
+                candidate.secret_value, []
+            ).append(candidate)
+
+        # Resolve each provider once, then bucket by provider host and let each
+        # host drain its own queue with at most max_concurrent_per_host workers,
+        # rather than one task per key; a host with many keys then cannot crowd
+        # out the others
+        lanes: dict[str, list[tuple[BaseProvider, list[SecretCandidate]]]] = {}
+        for provider_name, key_groups in groups.items():
+            provider = self._registry.get(provider_name)
+            if provider is None:
+                unknown = ValidationResult(
                     status=ValidationStatus.ERROR,
-                    message=str(result),
+                    message=f"Unknown provider: {provider_name}",
                 )
-                stats.errors += 1
-            elif isinstance(result, SecretCandidate) and result.validation_result:
-                stats.add_result(result.validation_result)
+                for group in key_groups.values():
+                    for candidate in group:
+                        candidate.validation_result = unknown
+                        stats.add_result(unknown)
+                continue
+            lanes.setdefault(provider.origin, []).extend(
+                (provider, group) for group in key_groups.values()
+            )
+
+        async with asyncio.TaskGroup() as task_group:
+            for lane_groups in lanes.values():
+                pending = iter(lane_groups)
+                workers = min(len(lane_groups), self.config.max_concurrent_per_host)
+                for _ in range(workers):
+                    task_group.create_task(self._drain(pending, stats))
 
         return candidates, stats
 
@@ -366,18 +473,48 @@ class ValidationClient:
 
         await self._ensure_client()
 
-        async def validate_one(key: str) -> ValidationResult:
-            semaphore = self._semaphore or asyncio.Semaphore(self.config.max_concurrent)
-            async with semaphore:
-                return await self._validate_with_retry(provider, key)
+        # Concurrent duplicates would all miss the cache, so validate each once
+        unique = list(dict.fromkeys(keys))
+        results = await asyncio.gather(
+            *[self._validate_bounded(provider, k) for k in unique]
+        )
+        by_key = dict(zip(unique, results, strict=True))
+        return [by_key[k] for k in keys]
 
-        return await asyncio.gather(*[validate_one(k) for k in keys])
+    async def validate_many(
+        self,
+        keys: Sequence[tuple[str, str]],
+    ) -> list[ValidationResult]:
+        """Validate keys for any mix of providers concurrently.
+
+        Args:
+            keys: Pairs of (provider name, key).
+
+        Returns:
+            Validation results in the same order as keys. Failures are
+            reported as ERROR results rather than raised.
+        """
+        candidates = [
+            SecretCandidate(provider_name=provider_name, secret_value=key)
+            for provider_name, key in keys
+        ]
+        await self.validate_batch(candidates)
+        return [
+            candidate.validation_result
+            or ValidationResult(
+                status=ValidationStatus.ERROR,
+                message="Validation did not complete",
+            )
+            for candidate in candidates
+        ]
 
 
 def create_validation_client(
     timeout: float = 10.0,
     max_concurrent: int = 5,
     skip_validation: bool = False,
+    http_client: httpx.AsyncClient | None = None,
+    cache: ValidationCache | None = None,
 ) -> ValidationClient:
     """Create a configured validation client.
 
@@ -385,6 +522,8 @@ def create_validation_client(
         timeout: HTTP request timeout in seconds.
         max_concurrent: Maximum concurrent validations.
         skip_validation: If True, skip actual HTTP validation.
+        http_client: Shared HTTP client to use instead of a private one.
+        cache: Shared validation result cache.
 
     Returns:
         Configured ValidationClient instance.
@@ -394,4 +533,4 @@ def create_validation_client(
         max_concurrent=max_concurrent,
         skip_validation=skip_validation,
     )
-    return ValidationClient(config=config)
+    return ValidationClient(config=config, http_client=http_client, cache=cache)
@@ -0,0 +1,108 @@
+"""Shared, connection-pooled HTTP client for key validation.
+
+Validating many keys against the same few provider hosts is dominated by
+connection setup. Reusing one pooled client keeps TCP/TLS connections
+alive across validations instead of handshaking for every key. When the
+optional ``h2`` package is installed (``pip install ai-truffle-hog[http2]``)
+requests to each provider host are also multiplexed over a single HTTP/2
+connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import weakref
+
+import httpx
+
+# Connection pool sizing shared by every validation client
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 30.0
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=MAX_CONNECTIONS,
+    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=KEEPALIVE_EXPIRY,
+)
+
+# HTTP/2 support in httpx requires the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_TIMEOUT = 10.0
+
+# One client per event loop; httpx clients cannot be shared across loops
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def pool_limits(max_concurrent: int) -> httpx.Limits:
+    """Get pool limits for a client running max_concurrent requests at once.
+
+    Enough connections are kept alive for every concurrent request to reuse
+    one, so raising the concurrency does not turn the surplus into a fresh
+    handshake per request. The cost is more idle sockets between bursts.
+
+    Args:
+        max_concurrent: Maximum number of requests in flight.
+
+    Returns:
+        Limits at least as generous as DEFAULT_LIMITS.
+    """
+    return httpx.Limits(
+        max_connections=max(MAX_CONNECTIONS, max_concurrent * 2),
+        max_keepalive_connections=max(MAX_KEEPALIVE_CONNECTIONS, max_concurrent),
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+def create_http_client(
+    timeout: float = DEFAULT_TIMEOUT,
+    http2: bool | None = None,
+    limits: httpx.Limits | None = None,
+) -> httpx.AsyncClient:
+    """Create a pooled HTTP client configured for key validation.
+
+    Args:
+        timeout: Request timeout in seconds.
+        http2: Whether to negotiate HTTP/2; defaults to HTTP2_AVAILABLE.
+        limits: Connection pool limits; defaults to DEFAULT_LIMITS.
+
+    Returns:
+        New httpx.AsyncClient; the caller is responsible for closing it.
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout),
+        limits=limits or DEFAULT_LIMITS,
+        http2=HTTP2_AVAILABLE if http2 is None else http2,
+        follow_redirects=True,
+    )
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop.
+
+    The client is created on first use and reused by every caller on the
+    same loop until ``close_client`` is awaited.
+
+    Returns:
+        Shared httpx.AsyncClient.
+
+    Raises:
+        RuntimeError: If called outside a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = create_http_client()
+        _clients[loop] = client
+    return client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client of the running event loop, if any."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -7,55 +7,150 @@ overwhelming provider APIs during validation.
 from __future__ import annotations
 
 import asyncio
+import sys
 import time
-from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import ClassVar
+from types import MappingProxyType
+from typing import TYPE_CHECKING, ClassVar
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RateLimitConfig:
     """Configuration for rate limiting a provider.
 
+    The rate adapts to the provider: each rate limit response multiplies it
+    by ``backoff_factor``, down to ``min_rate``, and each successful request
+    raises it by ``recovery_step`` until it is back at requests_per_second.
+
     Attributes:
         requests_per_second: Maximum requests per second.
         burst_size: Maximum burst of requests before rate limiting kicks in.
+        backoff_factor: Factor the rate is multiplied by on a rate limit.
+        min_rate: Lowest requests per second a backoff reduces the rate to.
+        recovery_step: Requests per second regained per successful request.
     """
 
     requests_per_second: float = 1.0
     burst_size: int = 5
+    backoff_factor: float = 0.5
+    min_rate: float = 0.2
+    recovery_step: float = 0.1
+
+
+# Nanoseconds per second; bucket times are integer nanoseconds
+_NS = 1_000_000_000
 
+# Restore time of a bucket with no backoff pending
+_NEVER = sys.maxsize
 
-@dataclass
+
+@dataclass(slots=True)
 class TokenBucket:
     """Token bucket implementation for rate limiting.
 
     Uses the token bucket algorithm for smooth rate limiting
     with burst capability.
 
+    Rather than a token count that is refilled on every check, the bucket
+    stores the time at which it will be full again, so each operation
+    reads the clock once and does no refill arithmetic. Times are integer
+    nanoseconds, so a burst of exactly capacity tokens is never refused
+    through rounding however long the process runs.
+
     Attributes:
         rate: Tokens added per second.
         capacity: Maximum tokens in the bucket.
-        tokens: Current number of tokens.
-        last_update: Last time tokens were added.
+        backoff_factor: Factor the rate is multiplied by on a backoff.
+        min_rate: Lowest rate a backoff reduces the rate to.
+        recovery_step: Rate regained per call to ``recover``.
+        full_at_ns: Time at which the bucket is full again.
+        base_rate: Configured rate, restored after a backoff.
+        restore_at_ns: Time at which a backoff expires and the rate returns
+            to base_rate.
     """
 
     rate: float
     capacity: int
-    tokens: float = field(init=False)
-    last_update: float = field(init=False)
+    backoff_factor: float = 0.5
+    min_rate: float = 0.2
+    recovery_step: float = 0.1
+    full_at_ns: int = field(init=False)
+    base_rate: float = field(init=False)
+    restore_at_ns: int = field(init=False, default=_NEVER)
+    # Nanoseconds per token, and to fill an empty bucket
+    _interval: int = field(init=False, repr=False)
+    _window: int = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize bucket with full capacity."""
-        self.tokens = float(self.capacity)
-        self.last_update = time.monotonic()
+        self.base_rate = self.rate
+        self._set_rate(self.rate)
+        self.full_at_ns = time.monotonic_ns()
+
+    def _set_rate(self, rate: float, now: int | None = None) -> None:
+        """Change the refill rate, keeping the tokens held at time now."""
+        interval = max(round(_NS / rate), 1)
+        if now is not None:
+            # Missing tokens are refilled at the new rate from now on
+            deficit = min(max(self.full_at_ns - now, 0), self._window)
+            self.full_at_ns = now + deficit * interval // self._interval
+        self.rate = rate
+        self._interval = interval
+        self._window = self.capacity * interval
+
+    def _now(self) -> int:
+        """Read the clock, restoring the base rate once a backoff expires."""
+        now = time.monotonic_ns()
+        if now >= self.restore_at_ns:
+            self._restore()
+        return now
+
+    def _restore(self) -> None:
+        """End an expired backoff."""
+        if self.rate < self.base_rate:
+            # Tokens accrue at the reduced rate up to the restore time only
+            self._set_rate(self.base_rate, self.restore_at_ns)
+        self.restore_at_ns = _NEVER
+
+    def backoff(self, delay: float) -> None:
+        """Slow the bucket down after the provider rejected a request.
+
+        The bucket is drained, stops refilling for ``delay`` seconds, and
+        refills at a reduced rate until successful requests raise it again
+        or another ``delay`` passes without a further backoff.
+
+        Rejections that arrive while a pause is pending only extend it,
+        since they answer requests sent before the provider pushed back.
 
-    def _refill(self) -> None:
-        """Refill tokens based on elapsed time."""
-        now = time.monotonic()
-        elapsed = now - self.last_update
-        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-        self.last_update = now
+        Args:
+            delay: Seconds to pause, e.g. from a Retry-After header.
+        """
+        now = self._now()
+        delay_ns = round(delay * _NS)
+        if self.full_at_ns <= now + self._window:
+            floor = min(self.min_rate, self.base_rate)
+            self._set_rate(max(self.rate * self.backoff_factor, floor))
+        # Empty when the pause ends, and refilling from then on
+        self.full_at_ns = max(self.full_at_ns, now + delay_ns + self._window)
+        restore_at = now + 2 * delay_ns
+        if self.restore_at_ns == _NEVER or restore_at > self.restore_at_ns:
+            self.restore_at_ns = restore_at
+
+    def recover(self) -> None:
+        """Raise a reduced rate by one step after a successful request.
+
+        Successes that complete during a backoff pause leave the rate alone,
+        since they were sent before the provider pushed back.
+        """
+        if self.rate >= self.base_rate:
+            return
+        now = self._now()
+        if self.rate >= self.base_rate or self.full_at_ns > now + self._window:
+            return
+        self._set_rate(min(self.rate + self.recovery_step, self.base_rate), now)
 
     def consume(self, tokens: int = 1) -> bool:
         """Try to consume tokens from the bucket.
@@ -66,11 +161,15 @@ class TokenBucket:
         Returns:
             True if tokens were consumed, False if not enough tokens.
         """
-        self._refill()
-        if self.tokens >= tokens:
-            self.tokens -= tokens
-            return True
-        return False
+        # Clock read inlined from _now, as this runs for every request
+        now = time.monotonic_ns()
+        if now >= self.restore_at_ns:
+            self._restore()
+        full_at = max(self.full_at_ns, now) + tokens * self._interval
+        if full_at > now + self._window:
+            return False
+        self.full_at_ns = full_at
+        return True
 
     def wait_time(self, tokens: int = 1) -> float:
         """Calculate time to wait before tokens are available.
@@ -81,17 +180,24 @@ class TokenBucket:
         Returns:
             Time in seconds to wait (0 if tokens are available).
         """
-        self._refill()
-        if self.tokens >= tokens:
-            return 0.0
-        needed = tokens - self.tokens
-        return needed / self.rate
+        now = time.monotonic_ns()
+        if now >= self.restore_at_ns:
+            self._restore()
+        wait = self.full_at_ns + tokens * self._interval - self._window - now
+        return wait / _NS if wait > 0 else 0.0
 
     @property
     def available_tokens(self) -> float:
         """Get current number of available tokens."""
-        self._refill()
-        return self.tokens
+        now = self._now()
+        missing = max(self.full_at_ns - now, 0) / self._interval
+        return max(self.capacity - missing, 0.0)
+
+
+def _resolve(wakeup: asyncio.Future[None]) -> None:
+    """Wake whoever awaits wakeup, unless it is already done."""
+    if not wakeup.done():
+        wakeup.set_result(None)
 
 
 class RateLimiter:
@@ -114,17 +220,19 @@ class RateLimiter:
         ```
     """
 
-    # Default rate limits for known providers
-    DEFAULT_LIMITS: ClassVar[dict[str, RateLimitConfig]] = {
-        "openai": RateLimitConfig(requests_per_second=2.0, burst_size=10),
-        "anthropic": RateLimitConfig(requests_per_second=2.0, burst_size=10),
-        "huggingface": RateLimitConfig(requests_per_second=5.0, burst_size=20),
-        "cohere": RateLimitConfig(requests_per_second=2.0, burst_size=10),
-        "replicate": RateLimitConfig(requests_per_second=2.0, burst_size=10),
-        "google_gemini": RateLimitConfig(requests_per_second=2.0, burst_size=10),
-        "groq": RateLimitConfig(requests_per_second=5.0, burst_size=20),
-        "langsmith": RateLimitConfig(requests_per_second=2.0, burst_size=10),
-    }
+    # Default rate limits for known providers, shared by every limiter
+    DEFAULT_LIMITS: ClassVar[Mapping[str, RateLimitConfig]] = MappingProxyType(
+        {
+            "openai": RateLimitConfig(requests_per_second=2.0, burst_size=10),
+            "anthropic": RateLimitConfig(requests_per_second=2.0, burst_size=10),
+            "huggingface": RateLimitConfig(requests_per_second=5.0, burst_size=20),
+            "cohere": RateLimitConfig(requests_per_second=2.0, burst_size=10),
+            "replicate": RateLimitConfig(requests_per_second=2.0, burst_size=10),
+            "google_gemini": RateLimitConfig(requests_per_second=2.0, burst_size=10),
+            "groq": RateLimitConfig(requests_per_second=5.0, burst_size=20),
+            "langsmith": RateLimitConfig(requests_per_second=2.0, burst_size=10),
+        }
+    )
 
     def __init__(
         self,
@@ -139,18 +247,14 @@ class RateLimiter:
             requests_per_second=1.0,
             burst_size=5,
         )
-        self._buckets: defaultdict[str, TokenBucket] = defaultdict(
-            self._create_default_bucket
-        )
+        self._buckets: dict[str, TokenBucket] = {}
         self._configs: dict[str, RateLimitConfig] = {}
-        self._lock = asyncio.Lock()
-
-    def _create_default_bucket(self) -> TokenBucket:
-        """Create a bucket with default configuration."""
-        return TokenBucket(
-            rate=self._default_config.requests_per_second,
-            capacity=self._default_config.burst_size,
-        )
+        # Effective config per provider, after falling back to the defaults
+        self._resolved_configs: dict[str, RateLimitConfig] = {}
+        # Per-provider queue of waiting acquire calls
+        self._gates: dict[str, asyncio.Lock] = {}
+        # Resolved to wake the waiter at the head of a provider's queue early
+        self._wakeups: dict[str, asyncio.Future[None]] = {}
 
     def configure_provider(
         self,
@@ -164,11 +268,16 @@ class RateLimiter:
             config: Rate limit configuration.
         """
         self._configs[provider_name] = config
+        self._resolved_configs[provider_name] = config
         # Reset bucket with new config
-        self._buckets[provider_name] = TokenBucket(
-            rate=config.requests_per_second,
-            capacity=config.burst_size,
-        )
+        self._buckets[provider_name] = self._new_bucket(provider_name)
+        self._wake(provider_name)
+
+    def _wake(self, provider_name: str) -> None:
+        """Make a provider's sleeping waiter re-check its replaced bucket."""
+        wakeup = self._wakeups.pop(provider_name, None)
+        if wakeup is not None:
+            _resolve(wakeup)
 
     def _get_bucket(self, provider_name: str) -> TokenBucket:
         """Get or create token bucket for a provider.
@@ -179,17 +288,33 @@ class RateLimiter:
         Returns:
             Token bucket for the provider.
         """
-        if provider_name not in self._buckets:
-            # Check for default limits
-            config = self._configs.get(
-                provider_name,
-                self.DEFAULT_LIMITS.get(provider_name, self._default_config),
-            )
-            self._buckets[provider_name] = TokenBucket(
-                rate=config.requests_per_second,
-                capacity=config.burst_size,
+        bucket = self._buckets.get(provider_name)
+        if bucket is None:
+            bucket = self._buckets[provider_name] = self._new_bucket(provider_name)
+        return bucket
+
+    def _new_bucket(self, provider_name: str) -> TokenBucket:
+        """Create a full token bucket from a provider's effective config."""
+        config = self._resolved_configs.get(provider_name)
+        if config is None:
+            config = self._configs.get(provider_name) or self.DEFAULT_LIMITS.get(
+                provider_name, self._default_config
             )
-        return self._buckets[provider_name]
+            self._resolved_configs[provider_name] = config
+        return TokenBucket(
+            rate=config.requests_per_second,
+            capacity=config.burst_size,
+            backoff_factor=config.backoff_factor,
+            min_rate=config.min_rate,
+            recovery_step=config.recovery_step,
+        )
+
+    def _gate(self, provider_name: str) -> asyncio.Lock:
+        """Get the lock that queues a provider's waiters in arrival order."""
+        gate = self._gates.get(provider_name)
+        if gate is None:
+            gate = self._gates[provider_name] = asyncio.Lock()
+        return gate
 
     async def acquire(self, provider_name: str) -> None:
         """Wait until rate limit allows a request.
@@ -197,12 +322,96 @@ class RateLimiter:
         Args:
             provider_name: Name of the provider.
         """
-        async with self._lock:
+        # Same as acquire_many(provider_name, 1), without the extra coroutine
+        # on the fast path every unthrottled request takes
+        gate = self._gate(provider_name)
+        if not gate.locked() and self._get_bucket(provider_name).consume():
+            return
+        async with gate:
+            await self._take(provider_name, 1)
+
+    async def acquire_many(self, provider_name: str, count: int) -> None:
+        """Wait until rate limit allows count requests.
+
+        Tokens are taken a bucketful at a time, so a large count sleeps
+        once per bucketful rather than once per request.
+
+        Args:
+            provider_name: Name of the provider.
+            count: Number of requests to reserve.
+        """
+        # Waiters for a provider queue on its own lock in arrival order, and
+        # only the one at the head sleeps until its tokens are due or its
+        # bucket is replaced. Other providers have their own queues and are
+        # never held up.
+        gate = self._gate(provider_name)
+        if not gate.locked() and self._get_bucket(provider_name).consume(count):
+            # Nobody is queued and the tokens are ready
+            return
+        async with gate:
+            while count > 0:
+                count -= await self._take(provider_name, count)
+
+    async def _take(self, provider_name: str, tokens: int) -> int:
+        """Sleep until tokens are available and consume them.
+
+        The caller must hold the provider's gate. The bucket is checked
+        again after every wake, since a backoff or reconfiguration may have
+        moved the time or replaced the bucket.
+
+        Args:
+            provider_name: Name of the provider.
+            tokens: Tokens wanted; at most the bucket's capacity is taken.
+
+        Returns:
+            Number of tokens consumed.
+        """
+        while True:
             bucket = self._get_bucket(provider_name)
-            wait_time = bucket.wait_time()
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-            bucket.consume()
+            chunk = min(tokens, bucket.capacity)
+            wait_time = bucket.wait_time(chunk)
+            if wait_time <= 0:
+                bucket.consume(chunk)
+                return chunk
+            await self._sleep(provider_name, wait_time)
+
+    async def _sleep(self, provider_name: str, delay: float) -> None:
+        """Sleep for delay seconds, or until the provider is woken.
+
+        The timer resolves the wakeup future directly, which spares the
+        task and cancellation that ``asyncio.wait_for`` would add to every
+        throttled request.
+
+        Args:
+            provider_name: Name of the provider.
+            delay: Seconds to sleep at most.
+        """
+        loop = asyncio.get_running_loop()
+        wakeup = self._wakeups[provider_name] = loop.create_future()
+        timer = loop.call_later(delay, _resolve, wakeup)
+        try:
+            await wakeup
+        finally:
+            timer.cancel()
+
+    def backoff(self, provider_name: str, delay: float) -> None:
+        """Pause and slow down requests to a provider that is rate limiting.
+
+        Args:
+            provider_name: Name of the provider.
+            delay: Seconds before the provider should be tried again.
+        """
+        self._get_bucket(provider_name).backoff(delay)
+
+    def recover(self, provider_name: str) -> None:
+        """Speed a backed-off provider up again after a successful request.
+
+        Args:
+            provider_name: Name of the provider.
+        """
+        bucket = self._buckets.get(provider_name)
+        if bucket is not None:
+            bucket.recover()
 
     def try_acquire(self, provider_name: str) -> bool:
         """Try to acquire rate limit without blocking.
@@ -236,16 +445,12 @@ class RateLimiter:
         """
         if provider_name:
             if provider_name in self._buckets:
-                config = self._configs.get(
-                    provider_name,
-                    self.DEFAULT_LIMITS.get(provider_name, self._default_config),
-                )
-                self._buckets[provider_name] = TokenBucket(
-                    rate=config.requests_per_second,
-                    capacity=config.burst_size,
-                )
+                self._buckets[provider_name] = self._new_bucket(provider_name)
+                self._wake(provider_name)
         else:
             self._buckets.clear()
+            for name in list(self._wakeups):
+                self._wake(name)
 
 
 def create_rate_limiter(
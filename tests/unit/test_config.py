@@ -3,6 +3,9 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+from pydantic import ValidationError
+
 from ai_truffle_hog.utils.config import (
     LoggingSettings,
     OutputSettings,
@@ -98,6 +101,11 @@ class TestLoadConfig:
         config = load_config()
         assert isinstance(config, Settings)
 
+    def test_missing_file_uses_defaults(self, tmp_path: Path) -> None:
+        """A config path that does not exist falls back to the defaults."""
+        config = load_config(tmp_path / "missing.toml")
+        assert config == load_config()
+
     def test_load_from_toml(self) -> None:
         """Load config from TOML file."""
         toml_content = """
@@ -141,3 +149,11 @@ class TestGetSettings:
         settings2 = get_settings()
         # New instance after reset
         assert settings1 is not settings2
+
+    def test_settings_are_frozen(self) -> None:
+        """The shared instance and its sections cannot be modified."""
+        settings = get_settings()
+        with pytest.raises(ValidationError):
+            settings.scanner.max_file_size_kb = 1
+        with pytest.raises(ValidationError):
+            settings.output = OutputSettings()
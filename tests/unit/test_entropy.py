@@ -1,5 +1,10 @@
 """Unit tests for entropy calculation utilities."""
 
+import math
+from collections import Counter
+
+import pytest
+
 from ai_truffle_hog.utils.entropy import (
     calculate_entropy,
     calculate_entropy_ratio,
@@ -7,87 +12,95 @@ from ai_truffle_hog.utils.entropy import (
     is_high_entropy,
 )
 
+# (text, lowest expected entropy, highest expected entropy)
+ENTROPY_CASES = [
+    ("", 0.0, 0.0),
+    ("aaaaaaa", 0.0, 0.0),
+    ("ab", 0.999, 1.001),
+    # Random-looking mix of character types
+    ("aB3xK9mZ2pQ7nR5", 3.5, math.inf),
+    # 'password' has only 6 unique chars in 8 total
+    ("password", 0.0, 3.0),
+    ("sk-proj-abc123def456ghi789jkl012mno345", 4.0, math.inf),
+]
+
 
 class TestCalculateEntropy:
     """Tests for calculate_entropy function."""
 
-    def test_empty_string(self) -> None:
-        """Empty string should have zero entropy."""
-        assert calculate_entropy("") == 0.0
-
-    def test_single_character_repeated(self) -> None:
-        """Repeated single character has zero entropy."""
-        assert calculate_entropy("aaaaaaa") == 0.0
-
-    def test_two_characters_equal(self) -> None:
-        """Two characters with equal frequency have entropy 1."""
-        result = calculate_entropy("ab")
-        assert abs(result - 1.0) < 0.001
-
-    def test_high_entropy_random(self) -> None:
-        """Random-looking string has high entropy."""
-        # Using a mix of different character types
-        random_like = "aB3xK9mZ2pQ7nR5"
-        result = calculate_entropy(random_like)
-        assert result > 3.5
-
-    def test_low_entropy_word(self) -> None:
-        """Common word has lower entropy."""
-        result = calculate_entropy("password")
-        # 'password' has only 6 unique chars in 8 total
-        assert result < 3.0
-
-    def test_api_key_like(self) -> None:
-        """API key patterns should have high entropy."""
-        api_key = "sk-proj-abc123def456ghi789jkl012mno345"
-        result = calculate_entropy(api_key)
-        assert result > 4.0
+    @pytest.mark.parametrize(("text", "low", "high"), ENTROPY_CASES)
+    def test_entropy_range(self, text: str, low: float, high: float) -> None:
+        """Entropy falls within the range expected for the string."""
+        assert low <= calculate_entropy(text) <= high
+
+    def test_matches_shannon_formula(self) -> None:
+        """Short and long strings agree with -sum(p * log2(p))."""
+        texts = (
+            "ab",
+            "abc123XYZ",
+            "sk-" + "a1b2c3" * 30,
+            "xyz0" * 600,
+            "a" * 70_000 + "bc",
+        )
+        for text in texts:
+            expected = -sum(
+                count / len(text) * math.log2(count / len(text))
+                for count in Counter(text).values()
+            )
+            assert math.isclose(calculate_entropy(text), expected, abs_tol=1e-9)
 
 
 class TestIsHighEntropy:
     """Tests for is_high_entropy function."""
 
-    def test_low_entropy_returns_false(self) -> None:
-        """Low entropy string returns False."""
-        assert is_high_entropy("password123") is False
-
-    def test_high_entropy_returns_true(self) -> None:
-        """High entropy string returns True."""
-        # Long random-looking string
-        assert is_high_entropy("aB3xK9mZ2pQ7nR5yU8wE1tS4iO6lH") is True
-
-    def test_custom_threshold(self) -> None:
-        """Custom threshold is respected."""
-        medium = "abc123XYZ789"
-        # With default high threshold
-        assert is_high_entropy(medium, threshold=5.0) is False
-        # With lower threshold
-        assert is_high_entropy(medium, threshold=3.0) is True
+    @pytest.mark.parametrize(
+        ("text", "threshold", "expected"),
+        [
+            ("password123", 4.5, False),
+            # Long random-looking string
+            ("aB3xK9mZ2pQ7nR5yU8wE1tS4iO6lH", 4.5, True),
+            ("abc123XYZ789", 5.0, False),
+            ("abc123XYZ789", 3.0, True),
+        ],
+    )
+    def test_threshold(self, text: str, threshold: float, expected: bool) -> None:
+        """Strings are high entropy exactly when they reach the threshold."""
+        assert is_high_entropy(text, threshold) is expected
+
+    def test_bounds_agree_with_entropy(self) -> None:
+        """Pruning by length and distinct characters never changes the result."""
+        texts = [
+            "",
+            "a",
+            "ab" * 20,
+            "abcd" * 8,
+            "0123456789abcdefghijklmnopqrstuv",
+            "aB3xK9mZ2pQ7nR5yU8wE1tS4iO6lH",
+            "sk-" + "a" * 40,
+        ]
+        for text in texts:
+            for threshold in (0.0, 1.0, 2.0, 4.5, 5.0):
+                expected = calculate_entropy(text) >= threshold
+                assert is_high_entropy(text, threshold) is expected, (text, threshold)
 
 
 class TestDetectCharset:
     """Tests for detect_charset function."""
 
-    def test_empty(self) -> None:
-        """Empty string returns 'empty'."""
-        assert detect_charset("") == "empty"
-
-    def test_hex(self) -> None:
-        """Hex string is detected."""
-        assert detect_charset("deadbeef") == "hex"
-        assert detect_charset("0123456789ABCDEF") == "hex"
-
-    def test_alphanumeric(self) -> None:
-        """Alphanumeric string is detected."""
-        assert detect_charset("abc123XYZ") == "alphanumeric"
-
-    def test_base64(self) -> None:
-        """Base64 string is detected."""
-        assert detect_charset("abc123+/=") == "base64"
-
-    def test_mixed(self) -> None:
-        """Mixed charset with special chars is detected."""
-        assert detect_charset("abc!@#$%") == "mixed"
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("", "empty"),
+            ("deadbeef", "hex"),
+            ("0123456789ABCDEF", "hex"),
+            ("abc123XYZ", "alphanumeric"),
+            ("abc123+/=", "base64"),
+            ("abc!@#$%", "mixed"),
+        ],
+    )
+    def test_charset(self, text: str, expected: str) -> None:
+        """The narrowest charset containing the string is detected."""
+        assert detect_charset(text) == expected
 
 
 class TestCalculateEntropyRatio:
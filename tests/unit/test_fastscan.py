@@ -0,0 +1,105 @@
+"""Unit tests for literal-prefix search."""
+
+from ai_truffle_hog.providers.fastscan import find_all, find_first
+from ai_truffle_hog.providers.registry import get_registry
+
+
+class TestFindFirst:
+    """Tests for find_first."""
+
+    def test_not_found(self) -> None:
+        """Missing literals return -1."""
+        assert find_first("no keys here", ("sk-", "hf_")) == -1
+
+    def test_empty_literals(self) -> None:
+        """No literals means nothing can be found."""
+        assert find_first("sk-abc", ()) == -1
+
+    def test_single_literal(self) -> None:
+        """Offset of a single literal is returned."""
+        assert find_first("key = sk-abc", ("sk-",)) == 6
+
+    def test_earliest_of_several(self) -> None:
+        """The earliest occurrence across all literals wins."""
+        text = "a = 'hf_x'; b = 'sk-y'"
+        assert find_first(text, ("sk-", "hf_")) == text.index("hf_")
+        assert find_first(text, ("hf_", "sk-")) == text.index("hf_")
+
+    def test_overlapping_literals(self) -> None:
+        """Overlapping literals report the earliest start."""
+        assert find_first("gsk_abc", ("sk-", "gsk_", "sk_")) == 0
+
+
+class TestFindAll:
+    """Tests for find_all."""
+
+    def test_not_found(self) -> None:
+        """Missing literals give no offsets."""
+        assert find_all("no keys here", ("sk-",)) == []
+
+    def test_sorted_and_distinct(self) -> None:
+        """Offsets from several literals are merged without duplicates."""
+        text = "hf_1 sk-ant-2 sk-3"
+        assert find_all(text, ("sk-", "sk-ant-", "hf_")) == [0, 5, 14]
+
+    def test_start(self) -> None:
+        """Occurrences before start are ignored."""
+        assert find_all("sk- sk-", ("sk-",), start=1) == [4]
+
+
+class TestCandidateOffset:
+    """Tests for starting regex scans at the first candidate."""
+
+    def test_word_boundary_respected(self) -> None:
+        """Starting mid-string keeps \\b semantics of the full string."""
+        provider = get_registry().get("openai")
+        assert provider is not None
+        key = "sk-" + "a" * 30
+        # Preceded by a word character, so the \\b must still reject it
+        assert provider.match("x" + key) == []
+        assert len(provider.match("x " + key)) == 1
+
+    def test_matches_equal_full_scan(self) -> None:
+        """Offset scanning finds exactly what a full scan finds."""
+        text = (
+            "prefix text\n"
+            f"a = 'sk-ant-api03-{'b' * 90}'\n"
+            f"b = 'gsk_{'c' * 52}'\n"
+            f"c = 'hf_{'d' * 34}'\n"
+        )
+        for provider in get_registry().all():
+            full = [m.group(0) for p in provider.patterns for m in p.finditer(text)]
+            assert [m.group(0) for m in provider.match(text)] == full, provider.name
+
+    def test_ignore_case_offset_is_zero(self) -> None:
+        """Case-insensitive providers don't skip ahead."""
+        provider = get_registry().get("cohere")
+        assert provider is not None
+        assert provider.first_candidate_offset("xx COHERE") == 0
+        assert provider.first_candidate_offset("xx") == -1
+
+    def test_ignore_case_offsets(self) -> None:
+        """Case-insensitive providers report every literal occurrence."""
+        provider = get_registry().get("cohere")
+        assert provider is not None
+        assert provider.candidate_offsets("CoHeRe x cohere") == [0, 9]
+        # Lowercasing "İ" changes the string length; offsets must still hold
+        assert provider.candidate_offsets("İ COHERE") == [2]
+
+    def test_windowed_matches_equal_finditer(self) -> None:
+        """Anchoring at candidate offsets finds exactly what finditer finds."""
+        key = "a" * 40
+        text = (
+            f"cohere cohere = '{key}'\n"
+            f"COHERE_API_KEY={key}\n"
+            f"x = 'sk-proj-{'e' * 30}' y = 'sk-ant-admin-{'f' * 30}'\n"
+            f"xsk-{'g' * 30} AIza{'h' * 35}\n"
+        )
+        for provider in get_registry().all():
+            offsets = provider.candidate_offsets(text)
+            for pattern in provider.patterns:
+                expected = [m.span() for m in pattern.finditer(text)]
+                actual = [
+                    m.span() for m in provider.iter_matches(pattern, text, offsets)
+                ]
+                assert actual == expected, (provider.name, pattern.pattern)
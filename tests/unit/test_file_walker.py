@@ -40,13 +40,13 @@ class TestDefaultConstants:
 
     def test_default_exclude_patterns_has_git(self) -> None:
         """Test that .git directory is excluded by default."""
-        patterns = [re.compile(p, re.IGNORECASE) for p in DEFAULT_EXCLUDE_PATTERNS]
+        patterns = FileFilter().exclude_patterns
         git_matched = any(p.search(".git/config") for p in patterns)
         assert git_matched
 
     def test_default_exclude_patterns_has_node_modules(self) -> None:
         """Test that node_modules is excluded by default."""
-        patterns = [re.compile(p, re.IGNORECASE) for p in DEFAULT_EXCLUDE_PATTERNS]
+        patterns = FileFilter().exclude_patterns
         node_matched = any(p.search("node_modules/package.json") for p in patterns)
         assert node_matched
 
@@ -71,6 +71,14 @@ class TestFileFilter:
         assert file_filter.skip_hidden is True
         assert file_filter.skip_symlinks is True
 
+    def test_default_patterns_compiled_once(self) -> None:
+        """Default filters share one compiled copy of the default patterns."""
+        first, second = FileFilter(), FileFilter.from_config()
+        assert [p.pattern for p in first.exclude_patterns] == list(
+            DEFAULT_EXCLUDE_PATTERNS
+        )
+        assert first.exclude_patterns is second.exclude_patterns
+
     def test_from_config_custom_extensions(self) -> None:
         """Test creating FileFilter with custom extensions."""
         file_filter = FileFilter.from_config(
@@ -106,6 +114,43 @@ class TestFileFilter:
         src_file = tmp_path / "src" / "main.py"
         assert file_filter.should_include_path(src_file, tmp_path) is True
 
+    def test_combined_patterns_agree_with_each_pattern(self, tmp_path: Path) -> None:
+        """The single combined search excludes exactly what the patterns do."""
+        file_filter = FileFilter()
+        assert file_filter._exclude_regex is not None
+        paths = [
+            "src/main.py",
+            "docs/Logo.PNG",
+            "a/b/.git/config",
+            "gitignored/x.py",
+            "build.gradle",
+            "app.min.js.map",
+            "lib/foo.egg-info/PKG-INFO",
+            "vendored/Cargo.lock",
+            "line\nbreak.zip",
+        ]
+        for relative in paths:
+            excluded = any(p.search(relative) for p in file_filter.exclude_patterns)
+            included = file_filter.should_include_path(tmp_path / relative, tmp_path)
+            assert included is not excluded, relative
+
+    def test_uncombinable_patterns_checked_one_by_one(self, tmp_path: Path) -> None:
+        """Patterns with different flags are still each applied."""
+        file_filter = FileFilter(
+            exclude_patterns=(re.compile(r"secret"), re.compile(r"tmp", re.IGNORECASE))
+        )
+        assert file_filter._exclude_regex is None
+        assert not file_filter.should_include_path(tmp_path / "TMP" / "a.py", tmp_path)
+        assert file_filter.should_include_path(tmp_path / "SECRET.py", tmp_path)
+
+    def test_inline_flag_patterns_checked_one_by_one(self, tmp_path: Path) -> None:
+        """Patterns with inline global flags are applied without combining."""
+        file_filter = FileFilter.from_config(exclude_patterns=["(?i)secret", "tmp"])
+        assert file_filter._exclude_regex is None
+        assert not file_filter.should_include_path(tmp_path / "SECRET.py", tmp_path)
+        assert not file_filter.should_include_path(tmp_path / "tmp" / "a.py", tmp_path)
+        assert file_filter.should_include_path(tmp_path / "src" / "a.py", tmp_path)
+
     def test_should_include_file_basic(self, tmp_path: Path) -> None:
         """Test basic file inclusion check."""
         file_filter = FileFilter()
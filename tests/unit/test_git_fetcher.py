@@ -8,11 +8,13 @@ from pathlib import Path  # noqa: TC003
 from unittest.mock import MagicMock, patch
 
 import pytest
-from git.exc import InvalidGitRepositoryError
+from git.exc import GitCommandError, InvalidGitRepositoryError
 
 from ai_truffle_hog.fetcher.git import (
+    CommitChangeSet,
     CommitInfo,
     FileChange,
+    GitBlobReader,
     GitFetcher,
     GitHistoryScanner,
     clone_repository,
@@ -94,6 +96,48 @@ class TestFileChange:
         assert change.is_added is True
         assert change.content == "print('hello')"
 
+    def test_content_key_prefers_blob_sha(self) -> None:
+        """Content key is the blob SHA when known."""
+        change = FileChange(
+            path="a.py",
+            old_path=None,
+            content="x = 1",
+            diff=None,
+            added_lines=1,
+            deleted_lines=0,
+            blob_sha="abc123",
+        )
+        assert change.content_key == "abc123"
+
+    def test_content_key_hashes_content(self) -> None:
+        """Without a blob SHA, identical content gives identical keys."""
+        kwargs = {
+            "old_path": None,
+            "diff": None,
+            "added_lines": 1,
+            "deleted_lines": 0,
+        }
+        a = FileChange(path="a.py", content="x = 1", **kwargs)
+        b = FileChange(path="b.py", content="x = 1", **kwargs)
+        c = FileChange(path="c.py", content="x = 2", **kwargs)
+        assert a.content_key == b.content_key
+        assert a.content_key != c.content_key
+        assert FileChange(path="d.py", content=None, **kwargs).content_key is None
+
+    def test_change_set_decodes_empty_blob(self) -> None:
+        """Prefetched empty blobs decode to an empty string, not None."""
+        mod = MagicMock()
+        mod.new_path = "empty.py"
+        mod.old_path = None
+        mod.change_type.name = "ADD"
+        mod._c_diff.b_blob.hexsha = "e" * 40
+
+        change_set = CommitChangeSet.from_pydriller_modifications(
+            [mod], {"e" * 40: b""}
+        )
+
+        assert change_set.contents == [""]
+
 
 class TestGitFetcher:
     """Tests for GitFetcher class."""
@@ -134,14 +178,16 @@ class TestGitFetcher:
         with GitFetcher(url=str(repo_path)) as fetcher:
             assert fetcher is not None
 
-    def test_cleanup_removes_temp_dir(self, tmp_path: Path) -> None:
+    def test_cleanup_removes_temp_dir(self) -> None:
         """Test that cleanup removes temporary directory."""
         fetcher = GitFetcher(url="https://github.com/user/repo.git")
-        temp_dir = tmp_path / "temp"
-        temp_dir.mkdir()
-        fetcher._temp_dir = temp_dir
-        fetcher.repo_path = temp_dir / "repo"
-        fetcher.repo_path.mkdir()
+        with patch("ai_truffle_hog.fetcher.git.Repo.clone_from") as mock_clone:
+            fetcher.clone()
+        mock_clone.assert_called_once()
+        temp_dir = fetcher._temp_dir
+        assert temp_dir is not None
+        assert temp_dir.name.startswith("aitruffle_")
+        assert temp_dir.exists()
 
         fetcher.cleanup()
 
@@ -150,6 +196,67 @@ class TestGitFetcher:
         assert fetcher._temp_dir is None
         assert fetcher.repo_path is None
 
+    def test_failed_removal_resets_state(self) -> None:
+        """A cleanup that cannot remove the clone still forgets it."""
+        fetcher = GitFetcher(url="https://github.com/user/repo.git")
+        with (
+            patch("ai_truffle_hog.fetcher.git.Repo.clone_from"),
+            patch("ai_truffle_hog.fetcher.git.tempfile.TemporaryDirectory") as tmp,
+        ):
+            tmp.return_value.name = "/nonexistent/aitruffle_x"
+            fetcher.clone()
+        tmp.return_value.cleanup.side_effect = PermissionError("busy")
+
+        with pytest.raises(PermissionError):
+            fetcher.cleanup()
+        assert fetcher._temp_dir is None
+        assert fetcher.repo_path is None
+        assert fetcher._repo is None
+
+    def test_exit_keeps_body_exception(self) -> None:
+        """A cleanup failure does not replace the exception of the block."""
+        with (
+            patch("ai_truffle_hog.fetcher.git.Repo.clone_from"),
+            patch("ai_truffle_hog.fetcher.git.tempfile.TemporaryDirectory") as tmp,
+        ):
+            tmp.return_value.name = "/nonexistent/aitruffle_x"
+            tmp.return_value.cleanup.side_effect = PermissionError("busy")
+            with (
+                pytest.raises(ValueError, match="scan failed"),
+                GitFetcher(url="https://github.com/user/repo.git") as fetcher,
+            ):
+                fetcher.clone()
+                raise ValueError("scan failed")
+
+    def test_exit_raises_cleanup_error_without_body_exception(self) -> None:
+        """A cleanup failure is raised when the block itself succeeded."""
+        with (
+            patch("ai_truffle_hog.fetcher.git.Repo.clone_from"),
+            patch("ai_truffle_hog.fetcher.git.tempfile.TemporaryDirectory") as tmp,
+        ):
+            tmp.return_value.name = "/nonexistent/aitruffle_x"
+            tmp.return_value.cleanup.side_effect = PermissionError("busy")
+            with (
+                pytest.raises(PermissionError),
+                GitFetcher(url="https://github.com/user/repo.git") as fetcher,
+            ):
+                fetcher.clone()
+
+    def test_failed_clone_removes_temp_dir(self) -> None:
+        """A failed clone leaves no temporary directory behind."""
+        fetcher = GitFetcher(url="https://github.com/user/repo.git")
+        error = GitCommandError("clone", 128)
+        with (
+            patch("ai_truffle_hog.fetcher.git.Repo.clone_from", side_effect=error),
+            patch("ai_truffle_hog.fetcher.git.tempfile.TemporaryDirectory") as tmp,
+        ):
+            tmp.return_value.name = "/nonexistent/aitruffle_x"
+            with pytest.raises(GitCommandError):
+                fetcher.clone()
+
+        tmp.return_value.cleanup.assert_called_once()
+        assert fetcher._temp_dir is None
+
 
 class TestGitFetcherWithLocalRepo:
     """Tests for GitFetcher with actual local git operations."""
@@ -347,6 +454,68 @@ class TestGitHistoryScanner:
             assert isinstance(commit, CommitInfo)
             assert isinstance(change, FileChange)
 
+    def test_iter_commit_change_sets(self, repo_with_history: Path) -> None:
+        """Columnar change sets materialize to the same FileChanges."""
+        scanner = GitHistoryScanner(repo_with_history)
+        listed = list(scanner.iter_commits_with_changes())
+        columnar = list(scanner.iter_commit_change_sets())
+
+        assert len(columnar) == len(listed)
+        for (commit_a, changes), (commit_b, change_set) in zip(
+            listed, columnar, strict=True
+        ):
+            assert isinstance(change_set, CommitChangeSet)
+            assert commit_a.hash == commit_b.hash
+            assert [change_set[i] for i in range(len(change_set))] == changes
+
+    @pytest.mark.parametrize("num_procs", [1, 2])
+    def test_parallel_matches_serial(
+        self, repo_with_history: Path, num_procs: int
+    ) -> None:
+        """Parallel traversal yields the same changes as the serial one."""
+        scanner = GitHistoryScanner(repo_with_history)
+
+        def key(item: tuple[CommitInfo, FileChange]) -> tuple[str, str]:
+            return item[0].hash, item[1].path
+
+        serial = sorted(scanner.iter_all_file_changes(), key=key)
+        parallel = sorted(
+            scanner.iter_all_file_changes_parallel(num_procs=num_procs), key=key
+        )
+
+        assert [(c.hash, f) for c, f in parallel] == [(c.hash, f) for c, f in serial]
+
+    def test_file_changes_have_blob_sha(self, repo_with_history: Path) -> None:
+        """Blob SHAs are read from the underlying git diff."""
+        scanner = GitHistoryScanner(repo_with_history)
+        for _commit, change in scanner.iter_all_file_changes():
+            assert change.blob_sha is not None
+            assert len(change.blob_sha) == 40
+
+    def test_batch_contents_match_pydriller(self, repo_with_history: Path) -> None:
+        """Contents streamed via cat-file match PyDriller's source_code."""
+        from pydriller import Repository
+
+        expected = {
+            (commit.hash, mod.new_path or mod.old_path): mod.source_code
+            for commit in Repository(str(repo_with_history)).traverse_commits()
+            for mod in commit.modified_files
+        }
+        scanner = GitHistoryScanner(repo_with_history)
+        actual = {
+            (commit.hash, change.path): change.content
+            for commit, change in scanner.iter_all_file_changes()
+        }
+
+        assert actual == expected
+
+    def test_blob_reader_missing_object(self, repo_with_history: Path) -> None:
+        """Unknown object IDs are reported as missing."""
+        missing = "0" * 40
+        with GitBlobReader(repo_with_history) as reader:
+            assert reader.read_many([missing]) == {missing: None}
+            assert reader.read_many([]) == {}
+
     def test_get_commit_count(self, repo_with_history: Path) -> None:
         """Test getting commit count."""
         scanner = GitHistoryScanner(repo_with_history)
@@ -1,5 +1,8 @@
 """Unit tests for Pydantic models."""
 
+import subprocess
+import sys
+
 from ai_truffle_hog.core.models import (
     ScanResult,
     ScanSession,
@@ -110,3 +113,19 @@ class TestScanSession:
 
         assert len(session.results) == 1
         assert session.results[0].secrets_count == 1
+
+
+class TestLazyExports:
+    """Tests for the lazily loaded re-exports in ai_truffle_hog.core."""
+
+    def test_models_reexported(self) -> None:
+        """The models are available from the core package."""
+        from ai_truffle_hog import core
+
+        assert core.SecretCandidate is SecretCandidate
+        assert core.ValidationStatus is ValidationStatus
+
+    def test_cli_import_skips_pydantic(self) -> None:
+        """Loading the CLI does not import Pydantic."""
+        code = "import sys, ai_truffle_hog.cli.app; sys.exit('pydantic' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
@@ -0,0 +1,76 @@
+"""Unit tests for the combined multi-provider matcher."""
+
+from ai_truffle_hog.providers.multimatch import CompiledMultiMatcher
+from ai_truffle_hog.providers.registry import get_registry
+
+ANTHROPIC_KEY = "sk-ant-api03-" + "a" * 85
+GROQ_KEY = "gsk_" + "b" * 52
+COHERE_KEY = "c" * 40
+
+
+class TestCompiledMultiMatcher:
+    """Tests for CompiledMultiMatcher."""
+
+    def test_combines_all_patterns(self) -> None:
+        """Every registered pattern is part of the combined expression."""
+        registry = get_registry()
+        expected = sum(len(p.patterns) for p in registry.all())
+        assert registry.matcher.pattern_count == expected
+
+    def test_scan_tags_providers(self) -> None:
+        """Hits are tagged with the provider whose pattern matched."""
+        text = f"a = '{ANTHROPIC_KEY}'\nb = '{GROQ_KEY}'\n"
+        hits = list(get_registry().scan(text))
+
+        assert [name for name, _, _ in hits] == ["anthropic", "groq"]
+        _, start, end = hits[1]
+        assert text[start:end] == GROQ_KEY
+
+    def test_inline_flags_stay_scoped(self) -> None:
+        """A provider's (?i) flag applies only to its own pattern."""
+        text = f"CoHeRe_Api_Key = '{COHERE_KEY}'"
+        assert [name for name, _, _ in get_registry().scan(text)] == ["cohere"]
+        assert get_registry().matcher.search("SK-ANT-API03-" + "a" * 85) is None
+
+    def test_search_none_without_keys(self) -> None:
+        """search returns None when no provider pattern matches."""
+        assert get_registry().matcher.search("nothing to see here") is None
+
+    def test_search_finds_earliest_hit(self) -> None:
+        """search reports the earliest offset any provider matches at."""
+        text = f"x = 1\ny = '{GROQ_KEY}'\nz = '{ANTHROPIC_KEY}'"
+        match = get_registry().matcher.search(text)
+        assert match is not None
+        assert match.start() == text.index(GROQ_KEY)
+
+    def test_subset_of_providers(self) -> None:
+        """A matcher over some providers ignores the others."""
+        groq = get_registry().get("groq")
+        assert groq is not None
+        matcher = CompiledMultiMatcher([groq])
+        assert matcher.search(ANTHROPIC_KEY) is None
+        assert list(matcher.scan(GROQ_KEY)) == [("groq", 0, len(GROQ_KEY))]
+
+    def test_literal_anchoring_equals_finditer(self) -> None:
+        """Anchoring at prefix literals finds exactly what finditer does."""
+        matcher = get_registry().matcher
+        texts = [
+            f"x{GROQ_KEY} sk-{'z' * 30} COHERE_API_KEY={COHERE_KEY}",
+            f"cohere: '{COHERE_KEY}' gsk_short sk-ant-{ANTHROPIC_KEY}",
+            "sk-sk-sk-" + "a" * 40 + " hf_" + "b" * 34,
+            "no literals at all",
+            "İstanbul cohere = '" + COHERE_KEY + "'",
+        ]
+        for text in texts:
+            expected = [
+                (m.lastgroup, m.span())
+                for m in matcher._regex.finditer(text)  # type: ignore[union-attr]
+            ]
+            actual = [(m.lastgroup, m.span()) for m in matcher._finditer(text, 0)]
+            assert actual == expected
+
+    def test_no_providers(self) -> None:
+        """An empty matcher never matches."""
+        matcher = CompiledMultiMatcher([])
+        assert matcher.search(GROQ_KEY) is None
+        assert list(matcher.scan(GROQ_KEY)) == []
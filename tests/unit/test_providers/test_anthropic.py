@@ -145,3 +145,10 @@ class TestAnthropicProviderInterpretResponse:
         """500 response indicates server error."""
         result = provider.interpret_response(500, None)
         assert result.status == ValidationStatus.ERROR
+        assert result.message == "Server error: 500"
+
+    def test_unexpected_status(self, provider: AnthropicProvider) -> None:
+        """Unlisted non-5xx codes are reported as unexpected responses."""
+        result = provider.interpret_response(418, None)
+        assert result.status == ValidationStatus.ERROR
+        assert result.message == "Unexpected response: 418"
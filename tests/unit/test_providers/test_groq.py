@@ -73,6 +73,11 @@ class TestGroqProviderPatterns:
         matches = provider.match(text)
         assert len(matches) == 0
 
+    def test_overlong_run_not_matched(self, provider: GroqProvider) -> None:
+        """Alphanumeric run longer than any real key is not matched."""
+        key = "gsk_" + "d" * 200
+        assert provider.match(f"api_key = '{key}'") == []
+
     def test_wrong_prefix_not_matched(self, provider: GroqProvider) -> None:
         """Key without gsk_ prefix is not matched."""
         key = "gak_" + "e" * 50
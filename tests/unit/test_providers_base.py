@@ -1,11 +1,21 @@
 """Unit tests for provider base and registry."""
 
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from typing import ClassVar
 
+import pytest
+
+from ai_truffle_hog.providers import registry as registry_module
 from ai_truffle_hog.providers.base import (
     BaseProvider,
     ValidationResult,
     ValidationStatus,
+    compile_status_rules,
+    parse_retry_after,
 )
 from ai_truffle_hog.providers.registry import ProviderRegistry, get_registry
 
@@ -13,6 +23,10 @@ from ai_truffle_hog.providers.registry import ProviderRegistry, get_registry
 class MockProvider(BaseProvider):
     """Mock provider for testing."""
 
+    patterns: ClassVar[tuple[re.Pattern[str], ...]] = (
+        re.compile(r"mock-[a-z0-9]{16}"),
+    )
+
     @property
     def name(self) -> str:
         return "mock"
@@ -21,10 +35,6 @@ class MockProvider(BaseProvider):
     def display_name(self) -> str:
         return "Mock Provider"
 
-    @property
-    def patterns(self) -> list[re.Pattern[str]]:
-        return [re.compile(r"mock-[a-z0-9]{16}")]
-
     @property
     def validation_endpoint(self) -> str:
         return "https://api.mock.com/v1/validate"
@@ -92,6 +102,27 @@ class TestBaseProvider:
         assert len(matches) == 2
 
 
+class TestOrigin:
+    """Tests for BaseProvider.origin."""
+
+    def test_origin_strips_path(self) -> None:
+        """origin keeps only scheme and authority of the endpoint."""
+        assert MockProvider().origin == "https://api.mock.com"
+
+    def test_endpoint_url_parsed_once(self) -> None:
+        """endpoint_url is parsed once and used as the validation URL."""
+        provider = MockProvider()
+        assert provider.endpoint_url is provider.endpoint_url
+        assert str(provider.endpoint_url) == provider.validation_endpoint
+        assert provider.build_validation_url("mock-key") is provider.endpoint_url
+
+    def test_registered_provider_origins(self) -> None:
+        """Every registered provider has an https origin."""
+        for provider in get_registry().all():
+            assert provider.origin.startswith("https://")
+            assert provider.validation_endpoint.startswith(provider.origin)
+
+
 class TestValidationResult:
     """Tests for ValidationResult dataclass."""
 
@@ -151,6 +182,25 @@ class TestProviderRegistry:
         assert len(providers) == 1
         assert providers[0].name == "mock"
 
+    def test_frozen_registry_rejects_register(self) -> None:
+        """A frozen registry refuses new providers."""
+        registry = ProviderRegistry()
+        registry.register(MockProvider())
+        registry.freeze()
+
+        assert registry.frozen
+        with pytest.raises(RuntimeError, match="frozen"):
+            registry.register(MockProvider())
+
+    def test_providers_mapping_is_read_only(self) -> None:
+        """The providers mapping cannot be mutated."""
+        registry = ProviderRegistry()
+        registry.register(MockProvider())
+
+        with pytest.raises(TypeError):
+            registry.providers["other"] = MockProvider()  # type: ignore[index]
+        assert list(registry.providers) == ["mock"]
+
 
 class TestGetRegistry:
     """Tests for get_registry singleton."""
@@ -165,3 +215,167 @@ class TestGetRegistry:
         registry1 = get_registry()
         registry2 = get_registry()
         assert registry1 is registry2
+
+    def test_global_registry_is_frozen(self) -> None:
+        """The global registry is frozen after initialization."""
+        assert get_registry().frozen
+
+    def test_concurrent_initialization(self) -> None:
+        """Threads racing on first access share one registry."""
+        get_registry.cache_clear()
+        registry_module._build_registry.cache_clear()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            registries = list(pool.map(lambda _: get_registry(), range(32)))
+
+        assert all(r is registries[0] for r in registries)
+
+
+class TestPatternBounds:
+    """Tests that provider patterns stay linear on pathological input."""
+
+    def test_long_alphanumeric_run_is_fast(self) -> None:
+        """A megabyte run after every key prefix is rejected quickly."""
+        text = "gsk_lsv2_sk_sk-ant-admin-" + "A" * 1_000_000
+
+        start = time.perf_counter()
+        for provider in get_registry().all():
+            assert provider.match(text) == []
+        assert time.perf_counter() - start < 0.05
+
+
+class TestPrefixLiterals:
+    """Tests for the literal-prefix prefilter in BaseProvider.match."""
+
+    def test_no_literals_always_might_match(self) -> None:
+        """Providers without prefix literals never skip the regex pass."""
+        provider = MockProvider()
+        assert provider.might_match("anything at all")
+
+    def test_missing_literal_skips_regex(self) -> None:
+        """Text without the literal prefix yields no matches."""
+        provider = get_registry().get("anthropic")
+        assert provider is not None
+        assert not provider.might_match("x = 'sk-proj-abc'")
+        assert provider.match("x = 'sk-proj-abc'") == []
+
+    def test_present_literal_runs_regex(self) -> None:
+        """Text with the literal prefix is still matched by the regex."""
+        provider = get_registry().get("anthropic")
+        assert provider is not None
+        text = f"key = 'sk-ant-api03-{'a' * 85}'"
+        assert provider.might_match(text)
+        assert len(provider.match(text)) == 1
+
+    def test_ignore_case_literals(self) -> None:
+        """Case-insensitive providers match literals regardless of case."""
+        provider = get_registry().get("cohere")
+        assert provider is not None
+        assert provider.might_match("CoHeRe_key = 'x'")
+        assert not provider.might_match("unrelated = 'x'")
+
+    def test_every_registered_provider_declares_literals(self) -> None:
+        """All built-in providers opt in to the prefilter."""
+        for provider in get_registry().all():
+            assert provider.prefix_literals, provider.name
+
+
+class TestQuickReject:
+    """Tests for rejecting malformed keys before validation."""
+
+    # Text containing a key each provider's patterns detect
+    SAMPLES: ClassVar[dict[str, str]] = {
+        "anthropic": f"sk-ant-api03-{'a' * 85} sk-ant-admin-{'b' * 40}",
+        "cohere": f"COHERE_API_KEY='{'c' * 40}'",
+        "google_gemini": f"AIza{'d' * 35}",
+        "groq": f"gsk_{'e' * 52}",
+        "huggingface": f"hf_{'f' * 34}",
+        "langsmith": f"lsv2_sk_{'g' * 32} lsv2_pt_{'h' * 64}",
+        "openai": f"sk-proj-{'i' * 40}",
+        "replicate": f"r8_{'j' * 37}",
+    }
+
+    def test_no_format_never_rejects(self) -> None:
+        """Providers without a key format let every key through."""
+        assert not MockProvider().quick_reject("anything")
+
+    def test_malformed_key_rejected(self) -> None:
+        """Keys of the wrong shape are rejected, well-formed ones are not."""
+        provider = get_registry().get("groq")
+        assert provider is not None
+        assert provider.quick_reject("gsk_tooshort")
+        assert provider.quick_reject(f"gsk_{'a' * 52} trailing")
+        assert not provider.quick_reject(f"gsk_{'a' * 52}")
+
+    def test_detected_keys_never_rejected(self) -> None:
+        """Every key a provider's patterns capture fits its key format."""
+        registry = get_registry()
+        assert set(self.SAMPLES) == set(registry.names())
+        for name, text in self.SAMPLES.items():
+            provider = registry.get(name)
+            assert provider is not None
+            matches = provider.match(text)
+            assert matches, name
+            for match in matches:
+                assert not provider.quick_reject(match.group(1)), name
+
+
+class TestCompileStatusRules:
+    """Tests for rule-based interpret_response generation."""
+
+    interpret = staticmethod(
+        compile_status_rules(
+            {
+                200: (ValidationStatus.VALID, "ok"),
+                401: (ValidationStatus.INVALID, "bad key"),
+            }
+        )
+    )
+
+    def test_declared_status(self) -> None:
+        """Declared codes produce their fixed result."""
+        result = self.interpret(None, 401, None)
+        assert result.status == ValidationStatus.INVALID
+        assert result.http_status_code == 401
+        assert result.message == "bad key"
+
+    def test_results_are_independent(self) -> None:
+        """Each call returns a fresh result object."""
+        first = self.interpret(None, 200, None)
+        first.metadata["x"] = "y"
+        assert self.interpret(None, 200, None).metadata == {}
+
+    def test_undeclared_status(self) -> None:
+        """Undeclared codes fall back to ERROR."""
+        assert self.interpret(None, 503, None).message == "Server error: 503"
+        assert self.interpret(None, 418, None).message == "Unexpected response: 418"
+        assert self.interpret(None, 418, None).status == ValidationStatus.ERROR
+
+    def test_extract_metadata(self) -> None:
+        """The metadata extractor fills in matched results only."""
+        interpret = compile_status_rules(
+            {200: (ValidationStatus.VALID, "ok")},
+            lambda code, body: {"user": str(body["user"])} if body else {},
+        )
+        assert interpret(None, 200, {"user": "alice"}).metadata == {"user": "alice"}
+        assert interpret(None, 500, {"user": "alice"}).metadata == {}
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    def test_seconds(self) -> None:
+        """Delta-seconds values are returned as floats."""
+        assert parse_retry_after("120") == 120.0
+
+    def test_http_date(self) -> None:
+        """HTTP dates become the delay until that time."""
+        when = datetime.now(UTC) + timedelta(seconds=30)
+        delay = parse_retry_after(format_datetime(when, usegmt=True))
+        assert delay is not None
+        assert 25.0 <= delay <= 30.0
+
+    def test_missing_or_malformed(self) -> None:
+        """Absent and unparseable values give None."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import time
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
 import pytest
 
+from ai_truffle_hog.validator import rate_limiter as rate_limiter_module
 from ai_truffle_hog.validator.rate_limiter import (
     RateLimitConfig,
     RateLimiter,
@@ -14,6 +17,16 @@ from ai_truffle_hog.validator.rate_limiter import (
     create_rate_limiter,
 )
 
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
+
+def fake_clock(clock: list[float]) -> AbstractContextManager[Any]:
+    """Make rate limiter clock reads return clock[0] seconds."""
+    return patch.object(
+        rate_limiter_module.time, "monotonic_ns", lambda: round(clock[0] * 1e9)
+    )
+
 
 class TestRateLimitConfig:
     """Tests for RateLimitConfig dataclass."""
@@ -89,6 +102,113 @@ class TestTokenBucket:
         # Should have some tokens now
         assert bucket.available_tokens > 0
 
+    def test_backoff_pauses_and_halves_rate(self) -> None:
+        """Backoff drains the bucket and waits out the pause first."""
+        bucket = TokenBucket(rate=10.0, capacity=5)
+        bucket.backoff(2.0)
+
+        assert bucket.rate == 5.0
+        assert not bucket.consume(1)
+        # 2s pause plus 1 token at the halved rate
+        assert bucket.wait_time(1) == pytest.approx(2.2, abs=0.05)
+
+    def test_backoff_rate_restored(self) -> None:
+        """The configured rate returns once the recovery window passes."""
+        bucket = TokenBucket(rate=10.0, capacity=5)
+        bucket.backoff(0.05)
+        time.sleep(0.12)
+
+        assert bucket.available_tokens > 0
+        assert bucket.rate == 10.0
+
+    def test_backoff_rate_restored_at_restore_time(self) -> None:
+        """Tokens accrue at the reduced rate until the restore time exactly."""
+        clock = [100.0]
+        with fake_clock(clock):
+            bucket = TokenBucket(rate=10.0, capacity=50)
+            # Paused for 1s, then 5/s until 2s after the backoff, then 10/s
+            bucket.backoff(1.0)
+            clock[0] = 101.5
+            assert bucket.available_tokens == pytest.approx(2.5)
+            clock[0] = 102.5
+            assert bucket.available_tokens == pytest.approx(10.0)
+            assert bucket.rate == 10.0
+            assert bucket.wait_time(20) == pytest.approx(1.0)
+
+    def test_backoff_floor(self) -> None:
+        """Repeated backoffs never push the rate below min_rate."""
+        clock = [100.0]
+        with fake_clock(clock):
+            bucket = TokenBucket(rate=2.0, capacity=5, min_rate=0.5)
+            for _ in range(5):
+                bucket.backoff(1.0)
+                # Each pause ends before the next rejection
+                clock[0] += 1.0
+            assert bucket.rate == 0.5
+
+    def test_backoff_during_pause_only_extends_it(self) -> None:
+        """Simultaneous rejections slow the bucket down once."""
+        clock = [100.0]
+        with fake_clock(clock):
+            bucket = TokenBucket(rate=2.0, capacity=10)
+            for _ in range(4):
+                bucket.backoff(1.0)
+            assert bucket.rate == 1.0
+
+            clock[0] = 100.5
+            bucket.backoff(2.0)
+            assert bucket.rate == 1.0
+            # The later, longer pause wins
+            assert bucket.wait_time(1) == pytest.approx(3.0)
+
+    def test_backoff_after_expiry_starts_from_base_rate(self) -> None:
+        """A rejection after an expired backoff halves the restored rate."""
+        clock = [100.0]
+        with fake_clock(clock):
+            bucket = TokenBucket(rate=2.0, capacity=10)
+            bucket.backoff(1.0)
+            # Past the restore time, with no request in between
+            clock[0] = 110.0
+            bucket.backoff(1.0)
+            assert bucket.rate == 1.0
+
+    def test_recover_steps_rate_back_up(self) -> None:
+        """Each recovery adds one step, up to the configured rate."""
+        clock = [100.0]
+        with fake_clock(clock):
+            bucket = TokenBucket(rate=2.0, capacity=10, recovery_step=0.5)
+            bucket.backoff(1.0)
+            # Successes during the pause do not count
+            bucket.recover()
+            assert bucket.rate == 1.0
+
+            clock[0] = 101.5
+            tokens = bucket.available_tokens
+            bucket.recover()
+            assert bucket.rate == 1.5
+            assert bucket.available_tokens == pytest.approx(tokens)
+            bucket.recover()
+            bucket.recover()
+            assert bucket.rate == 2.0
+
+    def test_full_burst_despite_rounding(self) -> None:
+        """A burst of exactly capacity is allowed whatever the rate."""
+        for rate in (0.3, 3.0, 7.0, 1 / 3):
+            bucket = TokenBucket(rate=rate, capacity=3)
+            assert all(bucket.consume(1) for _ in range(3)), rate
+            assert not bucket.consume(1), rate
+
+    def test_full_burst_after_long_uptime(self) -> None:
+        """Refills stay exact however large the clock reading is."""
+        clock = [1e7]
+        with fake_clock(clock):
+            bucket = TokenBucket(rate=4.0, capacity=3)
+            for _ in range(1000):
+                assert bucket.consume(3)
+                clock[0] += 0.75
+            assert bucket.consume(3)
+            assert not bucket.consume(1)
+
 
 class TestRateLimiter:
     """Tests for RateLimiter class."""
@@ -172,6 +292,14 @@ class TestRateLimiter:
         assert "anthropic" in RateLimiter.DEFAULT_LIMITS
         assert "huggingface" in RateLimiter.DEFAULT_LIMITS
 
+    def test_default_limits_read_only(self) -> None:
+        """Shared default limits cannot be changed through one limiter."""
+        limiter = RateLimiter()
+        with pytest.raises(TypeError):
+            limiter.DEFAULT_LIMITS["openai"] = RateLimitConfig()
+        with pytest.raises(AttributeError):
+            limiter.DEFAULT_LIMITS["openai"].burst_size = 1
+
     def test_unknown_provider_uses_default(self) -> None:
         """Test unknown provider uses default config."""
         limiter = RateLimiter(
@@ -182,6 +310,18 @@ class TestRateLimiter:
         assert limiter.try_acquire("unknown_provider")
         assert limiter.try_acquire("unknown_provider")
 
+    def test_reset_keeps_configured_limits(self) -> None:
+        """Test reset recreates a bucket from the provider's configured limits."""
+        limiter = RateLimiter()
+        limiter.configure_provider(
+            "openai", RateLimitConfig(requests_per_second=1.0, burst_size=2)
+        )
+        limiter.try_acquire("openai")
+        limiter.reset()
+        assert limiter.try_acquire("openai")
+        assert limiter.try_acquire("openai")
+        assert not limiter.try_acquire("openai")
+
 
 class TestRateLimiterAsync:
     """Async tests for RateLimiter."""
@@ -223,6 +363,105 @@ class TestRateLimiterAsync:
         # Run 5 concurrent acquires
         await asyncio.gather(*[limiter.acquire("test") for _ in range(5)])
 
+    @pytest.mark.asyncio
+    async def test_backoff_does_not_block_other_providers(self) -> None:
+        """A provider paused by backoff doesn't hold up the others."""
+        limiter = RateLimiter()
+        limiter.backoff("groq", 5.0)
+
+        paused = asyncio.create_task(limiter.acquire("groq"))
+        await asyncio.wait_for(limiter.acquire("openai"), timeout=0.5)
+
+        assert not paused.done()
+        assert limiter.get_wait_time("groq") > 4.0
+        paused.cancel()
+
+    @pytest.mark.asyncio
+    async def test_waiters_admitted_in_order_one_sleeping(self) -> None:
+        """Throttled waiters are admitted FIFO with only the head sleeping."""
+        limiter = RateLimiter()
+        limiter.configure_provider(
+            "test", RateLimitConfig(requests_per_second=500.0, burst_size=1)
+        )
+        real_sleep = limiter._sleep
+        sleeping = 0
+        peak = 0
+        admitted: list[int] = []
+
+        async def tracking_sleep(provider_name: str, delay: float) -> None:
+            nonlocal sleeping, peak
+            sleeping += 1
+            peak = max(peak, sleeping)
+            try:
+                await real_sleep(provider_name, delay)
+            finally:
+                sleeping -= 1
+
+        async def waiter(index: int) -> None:
+            await limiter.acquire("test")
+            admitted.append(index)
+
+        with patch.object(limiter, "_sleep", tracking_sleep):
+            await asyncio.gather(*(waiter(i) for i in range(6)))
+
+        assert admitted == list(range(6))
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_many_sleeps_per_bucketful(self) -> None:
+        """A count beyond capacity is taken in bucketfuls, one sleep each."""
+        limiter = RateLimiter()
+        limiter.configure_provider(
+            "test", RateLimitConfig(requests_per_second=1000.0, burst_size=4)
+        )
+        with patch.object(limiter, "_sleep", wraps=limiter._sleep) as sleep:
+            await limiter.acquire_many("test", 10)
+
+        # 4 tokens up front, then two refills for the remaining 6
+        assert sleep.call_count == 2
+        assert limiter.get_wait_time("test") > 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_many_fast_path(self) -> None:
+        """Tokens that are ready are reserved without waiting."""
+        limiter = RateLimiter()
+        limiter.configure_provider(
+            "test", RateLimitConfig(requests_per_second=1.0, burst_size=5)
+        )
+        await asyncio.wait_for(limiter.acquire_many("test", 5), timeout=0.1)
+        assert not limiter.try_acquire("test")
+
+    @pytest.mark.asyncio
+    async def test_reset_wakes_waiter(self) -> None:
+        """A waiter sleeping on a backoff proceeds once its bucket is reset."""
+        limiter = RateLimiter()
+        limiter.backoff("groq", 5.0)
+
+        waiter = asyncio.create_task(limiter.acquire("groq"))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        limiter.reset("groq")
+        await asyncio.wait_for(waiter, timeout=0.5)
+
+    @pytest.mark.asyncio
+    async def test_reconfigure_wakes_waiter(self) -> None:
+        """A waiter on a slow bucket proceeds once the provider is reconfigured."""
+        limiter = RateLimiter()
+        limiter.configure_provider(
+            "test", RateLimitConfig(requests_per_second=0.1, burst_size=1)
+        )
+        await limiter.acquire("test")
+
+        waiter = asyncio.create_task(limiter.acquire("test"))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        limiter.configure_provider(
+            "test", RateLimitConfig(requests_per_second=10.0, burst_size=5)
+        )
+        await asyncio.wait_for(waiter, timeout=0.5)
+
 
 class TestCreateRateLimiter:
     """Tests for create_rate_limiter factory function."""
@@ -97,3 +97,18 @@ class TestCreateRedactionFilter:
         filter_func = create_redaction_filter([])
         text = "no secrets here"
         assert filter_func(text) == text
+
+    def test_overlapping_secrets_prefer_longest(self) -> None:
+        """A secret containing another is redacted as a whole."""
+        filter_func = create_redaction_filter(["sk-abc123xyz", "sk-abc123xyz789"])
+        result = filter_func("key=sk-abc123xyz789 old=sk-abc123xyz")
+
+        assert result == (
+            f"key={redact_secret('sk-abc123xyz789')} old={redact_secret('sk-abc123xyz')}"
+        )
+
+    def test_regex_metacharacters_are_literal(self) -> None:
+        """Secrets are matched literally, not as patterns."""
+        filter_func = create_redaction_filter(["a.b+c*d?e(f)g", ""])
+        assert filter_func("aXb+c*d?e(f)g") == "aXb+c*d?e(f)g"
+        assert filter_func("x=a.b+c*d?e(f)g") == f"x={redact_secret('a.b+c*d?e(f)g')}"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 from io import StringIO
 from pathlib import Path  # noqa: TC003
 
@@ -27,6 +28,7 @@ from ai_truffle_hog.reporter.sarif import (
     SARIFRule,
     create_sarif_reporter,
 )
+from ai_truffle_hog.reporter.serialization import dump, dumps, dumps_str
 
 
 def create_test_match(
@@ -95,7 +97,7 @@ class TestSARIFRule:
             short_description="Exposed OpenAI key",
             full_description="Full description here",
             default_severity="error",
-            tags=["security", "secrets"],
+            tags=("security", "secrets"),
         )
 
         result = rule.to_dict()
@@ -106,6 +108,19 @@ class TestSARIFRule:
         assert "fullDescription" in result
         assert "properties" in result
 
+    def test_as_dict_cached(self) -> None:
+        """as_dict is built once and equals to_dict."""
+        rule = SARIFRule(
+            id="groq/api-key",
+            name="GROQ API Key Exposure",
+            short_description="Exposed GROQ key",
+            tags=("security", "groq"),
+        )
+
+        assert rule.as_dict is rule.as_dict
+        assert rule.as_dict == rule.to_dict()
+        assert rule.as_dict["properties"]["tags"] == ["security", "groq"]
+
 
 class TestSARIFResult:
     """Tests for SARIFResult dataclass."""
@@ -186,6 +201,94 @@ class TestSARIFReporter:
         content = json.loads(output_file.read_text())
         assert content["version"] == SARIF_VERSION
 
+    def test_shared_timestamp(self) -> None:
+        """A caller-supplied timestamp is used by both report formats."""
+        timestamp = "2024-01-02T03:04:05+00:00"
+        matches = [create_test_match()]
+
+        sarif = SARIFReporter().generate(matches, timestamp=timestamp)
+        report = JSONReporter().generate(matches, timestamp=timestamp)
+
+        assert sarif["runs"][0]["invocations"][0]["endTimeUtc"] == timestamp
+        assert report["timestamp"] == timestamp
+
+    def test_repeats_on_a_line_grouped(self) -> None:
+        """Matches of one rule on one line become a single result."""
+        first = create_test_match()
+        second = create_test_match()
+        second.column_start, second.column_end = 60, 95
+        other_line = create_test_match(line_number=11)
+
+        results = SARIFReporter().generate([first, second, other_line])["runs"][0][
+            "results"
+        ]
+
+        assert len(results) == 2
+        assert results[0]["occurrenceCount"] == 2
+        columns = [
+            loc["physicalLocation"]["region"]["startColumn"]
+            for loc in results[0]["locations"]
+        ]
+        assert columns == [11, 61]
+        assert "occurrenceCount" not in results[1]
+
+    def test_grouped_result_names_every_key(self) -> None:
+        """A result for two different keys on one line names both of them."""
+        first = create_test_match()
+        second = create_test_match()
+        second.secret_value = "sk-other987654321zyxwvutsrqponmlk"
+        second.column_start, second.column_end = 60, 95
+        repeat = create_test_match()
+
+        results = SARIFReporter().generate([first, second, repeat])["runs"][0][
+            "results"
+        ]
+
+        assert len(results) == 1
+        message = results[0]["message"]["text"]
+        assert first.redacted_value in message
+        assert second.redacted_value in message
+        assert message.count(first.redacted_value) == 1
+        assert results[0]["occurrenceCount"] == 3
+
+    def test_fingerprint_is_short_stable_hash(self) -> None:
+        """Fingerprints are 16 hex digits that depend on file, line, provider."""
+
+        def fingerprint(match: ScanMatch) -> str:
+            result = SARIFReporter().generate([match])["runs"][0]["results"][0]
+            return str(result["fingerprints"]["primaryLocationLineHash"])
+
+        value = fingerprint(create_test_match())
+        assert len(value) == 16
+        int(value, 16)
+        assert fingerprint(create_test_match()) == value
+        assert fingerprint(create_test_match(line_number=11)) != value
+        assert fingerprint(create_test_match(provider="groq")) != value
+
+    def test_rule_id_normalized(self) -> None:
+        """Rule IDs are lowercase with spaces replaced by dashes."""
+        match = create_test_match()
+        match.pattern_name = "Project Key"
+
+        result = SARIFReporter().generate([match])["runs"][0]["results"][0]
+
+        assert result["ruleId"] == "openai/project-key"
+
+    def test_rules_reused_across_reports(self) -> None:
+        """Rules are built once but only listed in reports that use them."""
+        reporter = SARIFReporter()
+        reporter.generate([create_test_match()])
+        rule = reporter._rules["openai/test-pattern"]
+
+        sarif = reporter.generate([create_test_match(provider="groq")])
+        assert [r["id"] for r in sarif["runs"][0]["tool"]["driver"]["rules"]] == [
+            "groq/test-pattern"
+        ]
+
+        reporter.generate([create_test_match()])
+        assert reporter._rules["openai/test-pattern"] is rule
+        assert reporter.rule_count == 1
+
     def test_multiple_providers(self) -> None:
         """Test SARIF with multiple providers."""
         reporter = SARIFReporter()
@@ -238,6 +341,28 @@ class TestJSONFinding:
         assert finding.provider == "openai"
         assert finding.validation_status is None
 
+    def test_to_dict_matches_asdict(self) -> None:
+        """to_dict produces the same mapping as dataclasses.asdict."""
+        finding = JSONFinding(
+            provider="openai",
+            pattern_name="test",
+            secret_redacted="sk-****",
+            file_path="config.py",
+            line_number=10,
+            column_start=5,
+            column_end=50,
+            line_content="api = ...",
+            entropy=4.2,
+            context_before=["a"],
+            context_after=["b", "c"],
+        )
+
+        result = finding.to_dict()
+
+        assert result == asdict(finding)
+        assert list(result) == list(asdict(finding))
+        assert result["context_before"] is not finding.context_before
+
 
 class TestJSONReporter:
     """Tests for JSONReporter class."""
@@ -289,6 +414,48 @@ class TestJSONReporter:
         content = json.loads(output_file.read_text())
         assert content["total_findings"] == 1
 
+    def test_write_stream_matches_generate(self, tmp_path: Path) -> None:
+        """Streamed output has the content and layout of the full report."""
+        reporter = JSONReporter()
+        matches = [
+            create_test_match(),
+            create_test_match(provider="groq", file_path="other.py"),
+            create_test_match(line_number=20),
+        ]
+        for pretty in (True, False):
+            for subset in (matches, []):
+                output_file = tmp_path / "stream.json"
+                reporter.write_stream(iter(subset), output_file, "repo", pretty)
+
+                streamed = json.loads(output_file.read_bytes())
+                expected = reporter.generate(subset, "repo")
+                expected["timestamp"] = streamed["timestamp"]
+                expected["total_findings"] = expected.pop("total_findings")
+                expected["summary"] = expected.pop("summary")
+                assert list(streamed) == list(expected)
+                assert output_file.read_bytes() == dumps(expected, pretty)
+
+    def test_context_shared_until_output(self) -> None:
+        """Findings reuse the match's context; generated output owns a copy."""
+        reporter = JSONReporter()
+        match = create_test_match()
+        match.context_before = ["before"]
+
+        assert reporter._match_to_finding(match).context_before is match.context_before
+
+        output = reporter.generate([match])
+        match.context_before.append("later")
+        assert output["findings"][0]["context_before"] == ["before"]
+
+    def test_context_omitted(self) -> None:
+        """include_context=False leaves context lists empty."""
+        match = create_test_match()
+        match.context_before = ["before"]
+
+        finding = JSONReporter(include_context=False).generate([match])["findings"][0]
+
+        assert finding["context_before"] == []
+
     def test_summary_computed(self) -> None:
         """Test summary is computed correctly."""
         reporter = JSONReporter()
@@ -321,6 +488,40 @@ class TestCreateJSONReporter:
         assert not reporter.include_context
 
 
+class TestDumps:
+    """Tests for the shared JSON encoder."""
+
+    def test_pretty_indents_two_spaces(self) -> None:
+        """Pretty output is indented like json.dumps(indent=2)."""
+        data = {"a": [1, 2], "b": {"c": None}}
+        assert dumps(data).decode() == json.dumps(data, indent=2)
+
+    def test_compact_round_trips(self) -> None:
+        """Compact output has no whitespace and decodes to the input."""
+        data = {"a": [1, 2.5], "b": "x"}
+        encoded = dumps(data, pretty=False)
+        assert encoded == b'{"a":[1,2.5],"b":"x"}'
+        assert json.loads(encoded) == data
+
+    def test_dump_matches_dumps(self, tmp_path: Path) -> None:
+        """Writing to a file produces the same bytes as dumps."""
+        data = {"path": "café.py", "lines": [1, 2], "nested": {"a": None}}
+        for pretty in (True, False):
+            output_file = tmp_path / f"out-{pretty}.json"
+            dump(data, output_file, pretty)
+            assert output_file.read_bytes() == dumps(data, pretty)
+
+    def test_dumps_str_matches_dumps(self) -> None:
+        """dumps_str returns the decoded output of dumps."""
+        data = {"path": "café.py", "lines": [1, 2]}
+        for pretty in (True, False):
+            assert dumps_str(data, pretty) == dumps(data, pretty).decode()
+
+    def test_non_ascii_unescaped(self) -> None:
+        """Non-ASCII text is written as UTF-8 rather than escaped."""
+        assert "café.py".encode() in dumps({"path": "café.py"}, pretty=False)
+
+
 class TestConsoleSummary:
     """Tests for ConsoleSummary dataclass."""
 
@@ -342,6 +543,18 @@ class TestConsoleSummary:
         assert summary.matches_by_provider["openai"] == 2
         assert summary.matches_by_provider["anthropic"] == 1
 
+    def test_sorted_providers(self) -> None:
+        """Providers are ordered by descending count, ties by first seen."""
+        summary = ConsoleSummary()
+        for provider in ("groq", "openai", "openai", "cohere"):
+            summary.add_match(provider)
+
+        assert summary.sorted_providers() == [
+            ("openai", 2),
+            ("groq", 1),
+            ("cohere", 1),
+        ]
+
 
 class TestConsoleReporter:
     """Tests for ConsoleReporter class."""
@@ -392,6 +605,63 @@ class TestConsoleReporter:
         result = output.getvalue()
         assert "OPENAI" in result or "openai" in result.lower()
 
+    def test_label_styles_follow_severity_colors(self) -> None:
+        """Every provider color has a matching bold label style."""
+        reporter = ConsoleReporter(console=Console(file=StringIO()))
+        for provider, color in ConsoleReporter.SEVERITY_COLORS.items():
+            assert reporter._get_label_style(provider) == f"bold {color}"
+        assert reporter._get_label_style("unknown") == "bold white"
+
+    def test_provider_labels(self) -> None:
+        """Known and unknown providers are labelled in uppercase."""
+        reporter = ConsoleReporter(console=Console(file=StringIO()))
+        assert reporter._get_label("google_gemini") == "GOOGLE_GEMINI"
+        assert reporter._get_label("acme") == "ACME"
+
+    def test_print_matches_truncates_long_paths(self) -> None:
+        """Long file paths keep only their tail in the table."""
+        output = StringIO()
+        reporter = ConsoleReporter(console=Console(file=output, width=200))
+        path = "deeply/nested/" * 5 + "settings.py"
+
+        reporter.print_matches([create_test_match(file_path=path)])
+
+        result = output.getvalue()
+        assert "..." + path[-37:] in result
+        assert path not in result
+
+    def test_print_match_detail_literal_content(self) -> None:
+        """Source lines are printed verbatim, not parsed as Rich markup."""
+        output = StringIO()
+        reporter = ConsoleReporter(console=Console(file=output, width=120))
+        match = create_test_match()
+        match.line_content = 'token = "[red]sk-test[/red]"'
+        match.context_before = ["# before"]
+        match.context_after = ["# after"]
+
+        reporter.print_match_detail(match)
+
+        assert output.getvalue().splitlines() == [
+            "",
+            "● OPENAI in config.py:10",
+            "  # before",
+            '  token = "[red]sk-test[/red]"',
+            "  # after",
+        ]
+
+    def test_print_file_matches(self) -> None:
+        """File header is followed by one line per match."""
+        output = StringIO()
+        reporter = ConsoleReporter(console=Console(file=output, width=120))
+        matches = [create_test_match(), create_test_match(provider="groq")]
+
+        reporter.print_file_matches("config.py", matches)
+
+        lines = output.getvalue().splitlines()
+        assert lines[1] == "📁 config.py"
+        assert lines[2].startswith("  Line 10: OPENAI sk-t")
+        assert lines[3].startswith("  Line 10: GROQ sk-t")
+
     def test_print_summary_no_matches(self) -> None:
         """Test printing summary with no matches."""
         output = StringIO()
@@ -429,6 +699,21 @@ class TestConsoleReporter:
 
         assert "Error" in output.getvalue()
 
+    def test_messages_not_parsed_as_markup(self) -> None:
+        """Message text is printed verbatim, brackets included."""
+        output = StringIO()
+        reporter = ConsoleReporter(console=Console(file=output), verbose=True)
+
+        reporter.print_error("bad [red]value[/red]")
+        reporter.print_warning("[b]")
+        reporter.print_info("skipped [dim]x[/dim]")
+
+        assert output.getvalue().splitlines() == [
+            "Error: bad [red]value[/red]",
+            "Warning: [b]",
+            "skipped [dim]x[/dim]",
+        ]
+
     def test_print_warning(self) -> None:
         """Test printing warning."""
         output = StringIO()
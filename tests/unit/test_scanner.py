@@ -10,6 +10,7 @@ from ai_truffle_hog.core.scanner import (
     ScanMatch,
     create_scanner,
 )
+from ai_truffle_hog.utils.entropy import calculate_entropy
 
 
 class TestScanMatch:
@@ -32,6 +33,11 @@ class TestScanMatch:
         assert match.line_number == 10
         assert match.secret_value == "sk-abc123def456"
 
+    def test_slotted(self) -> None:
+        """ScanMatch stores fields in slots rather than a per-instance dict."""
+        match = ScanMatch("openai", "p", "sk-x", 1, 0, 4, "sk-x")
+        assert not hasattr(match, "__dict__")
+
     def test_redacted_value_short(self) -> None:
         """Test redaction of short secrets."""
         match = ScanMatch(
@@ -162,6 +168,27 @@ key2 = "sk-proj-xyz987wvu654tsr321pon098mlk765jih432fed109cba876"
 
         assert len(matches) == 2
 
+    def test_pattern_names_shared_across_scans(self) -> None:
+        """Matches of the same pattern share one interned name object."""
+        scanner = PatternScanner(providers=["openai"])
+        content = 'key = "sk-proj-abc123def456ghi789jkl012mno345pqr678stu901vwx234"'
+
+        first = scanner.scan_content(content, file_path="a.py")[0]
+        second = scanner.scan_content(content, file_path="b.py")[0]
+
+        assert first.pattern_name is second.pattern_name
+
+    def test_entropy_memoized(self) -> None:
+        """A secret repeated across scans is measured once."""
+        scanner = PatternScanner(providers=["openai"])
+        key = "sk-proj-abc123def456ghi789jkl012mno345pqr678stu901vwx234"
+
+        first = scanner.scan_content(f'a = "{key}"')[0]
+        second = scanner.scan_content(f'b = "{key}"')[0]
+
+        assert first.entropy == second.entropy == calculate_entropy(key)
+        assert list(scanner._entropy_cache) == [key]
+
     def test_scan_content_deduplication(self) -> None:
         """Test that duplicate secrets on same line are deduplicated."""
         scanner = PatternScanner(providers=["openai"])
@@ -320,7 +347,7 @@ class TestPatternScannerProviders:
     def test_scan_groq_key(self) -> None:
         """Test scanning for Groq keys."""
         scanner = PatternScanner(providers=["groq"])
-        # Groq pattern: gsk_[a-zA-Z0-9]{50,} (at least 50 chars after gsk_)
+        # Groq pattern: gsk_[a-zA-Z0-9]{50,80} (50 to 80 chars after gsk_)
         content = (
             'groq_key = "gsk_abcdefghijklmnopqrstuvwxyz1234567890abcdefghijklmnop"'
         )
@@ -436,3 +463,52 @@ DATABASE_URL = "postgresql://localhost/mydb"
 
         assert len(matches) >= 1
         assert matches[0].line_number == 4  # Key is on line 4
+
+
+class TestPatternScannerMmap:
+    """Tests for memory-mapped file scanning."""
+
+    def test_scan_empty_file(self, tmp_path: Path) -> None:
+        """Empty files are skipped without mapping."""
+        empty = tmp_path / "empty.py"
+        empty.write_bytes(b"")
+        assert PatternScanner().scan_file(empty) == []
+
+    def test_crlf_line_numbers(self, tmp_path: Path) -> None:
+        """CRLF files report the same lines as a text-mode read."""
+        test_file = tmp_path / "config.py"
+        test_file.write_bytes(
+            b"# header\r\n"
+            b'key = "sk-proj-abc123def456ghi789jkl012mno345pqr678stu901vwx234"\r\n'
+        )
+        matches = PatternScanner(providers=["openai"]).scan_file(test_file)
+        assert len(matches) == 1
+        assert matches[0].line_number == 2
+        assert not matches[0].line_content.endswith("\r")
+
+    def test_latin1_fallback(self, tmp_path: Path) -> None:
+        """Non-UTF-8 files are still decoded and scanned."""
+        test_file = tmp_path / "legacy.py"
+        test_file.write_bytes(
+            b"# caf\xe9\n"
+            b'key = "sk-proj-abc123def456ghi789jkl012mno345pqr678stu901vwx234"\n'
+        )
+        matches = PatternScanner(providers=["openai"]).scan_file(test_file)
+        assert len(matches) == 1
+
+    def test_prefilter_ignore_case(self, tmp_path: Path) -> None:
+        """Case-insensitive literals pass the bytes prefilter."""
+        test_file = tmp_path / "settings.py"
+        key = "a1b2c3d4e5" * 4
+        test_file.write_text(f'CoHeRe_token = "{key}"\n')
+        matches = PatternScanner(providers=["cohere"]).scan_file(test_file)
+        assert len(matches) == 1
+
+    def test_prefilter_drops_subsumed_literals(self) -> None:
+        """Literals containing a shorter literal are not searched separately."""
+        prefilter = PatternScanner(providers=["openai", "anthropic"])._bytes_prefilter
+        assert prefilter is not None
+        assert prefilter.literals == (b"sk-",)
+        assert prefilter.folded is None
+        assert prefilter.might_match(b"x = 'sk-ant-...'")
+        assert not prefilter.might_match(b"nothing")
@@ -0,0 +1,57 @@
+"""Unit tests for the validation result cache."""
+
+from unittest.mock import patch
+
+from ai_truffle_hog.providers.base import ValidationResult, ValidationStatus
+from ai_truffle_hog.validator.cache import ValidationCache
+
+VALID = ValidationResult(status=ValidationStatus.VALID)
+
+
+class TestValidationCache:
+    """Tests for ValidationCache."""
+
+    def test_put_and_get(self) -> None:
+        """Stored results are returned for the same provider and key."""
+        cache = ValidationCache()
+        cache.put("openai", "sk-abc", VALID)
+
+        assert cache.get("openai", "sk-abc") is VALID
+        assert cache.get("openai", "sk-other") is None
+        assert cache.get("groq", "sk-abc") is None
+
+    def test_transient_results_not_cached(self) -> None:
+        """Errors and rate limits are retried, not cached."""
+        cache = ValidationCache()
+        for status in (ValidationStatus.ERROR, ValidationStatus.RATE_LIMITED):
+            cache.put("openai", "sk-abc", ValidationResult(status=status))
+        assert len(cache) == 0
+
+    def test_no_plaintext_keys(self) -> None:
+        """The cache stores digests rather than the secret itself."""
+        cache = ValidationCache()
+        cache.put("openai", "sk-secret-value", VALID)
+        assert all("sk-secret-value" not in repr(k) for k in cache._entries)
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used entry is evicted first."""
+        cache = ValidationCache(maxsize=2)
+        cache.put("p", "a", VALID)
+        cache.put("p", "b", VALID)
+        cache.get("p", "a")
+        cache.put("p", "c", VALID)
+
+        assert cache.get("p", "a") is VALID
+        assert cache.get("p", "b") is None
+        assert cache.get("p", "c") is VALID
+
+    def test_expiry(self) -> None:
+        """Entries are dropped once their TTL has passed."""
+        cache = ValidationCache(ttl=10.0)
+        with patch("ai_truffle_hog.validator.cache.time.monotonic", return_value=0.0):
+            cache.put("p", "a", VALID)
+        with patch("ai_truffle_hog.validator.cache.time.monotonic", return_value=5.0):
+            assert cache.get("p", "a") is VALID
+        with patch("ai_truffle_hog.validator.cache.time.monotonic", return_value=11.0):
+            assert cache.get("p", "a") is None
+        assert len(cache) == 0
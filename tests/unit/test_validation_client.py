@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
-from ai_truffle_hog.providers.base import ValidationResult, ValidationStatus
+from ai_truffle_hog.providers.base import (
+    BaseProvider,
+    ValidationResult,
+    ValidationStatus,
+)
+from ai_truffle_hog.providers.registry import get_registry
 from ai_truffle_hog.validator.client import (
     SecretCandidate,
     ValidationClient,
@@ -15,6 +22,20 @@ from ai_truffle_hog.validator.client import (
     ValidationStats,
     create_validation_client,
 )
+from ai_truffle_hog.validator.http_client import (
+    DEFAULT_LIMITS,
+    HTTP2_AVAILABLE,
+    close_client,
+    create_http_client,
+    get_client,
+    pool_limits,
+)
+from ai_truffle_hog.validator.rate_limiter import RateLimitConfig, RateLimiter
+
+GROQ_KEY = "gsk_" + "a" * 52
+OTHER_GROQ_KEY = "gsk_" + "b" * 52
+HUGGINGFACE_KEY = "hf_" + "c" * 34
+GOOGLE_KEY = "AIza" + "d" * 35
 
 
 class TestSecretCandidate:
@@ -124,6 +145,13 @@ class TestValidationStats:
         assert stats.validated == 1
         assert stats.skipped == 1
 
+    def test_add_uncounted_status(self) -> None:
+        """Statuses without their own counter only count as validated."""
+        stats = ValidationStats(total=1)
+        stats.add_result(ValidationResult(status=ValidationStatus.RATE_LIMITED))
+        assert stats.validated == 1
+        assert (stats.valid, stats.invalid, stats.errors, stats.skipped) == (0, 0, 0, 0)
+
 
 class TestValidationClientConfig:
     """Tests for ValidationClientConfig dataclass."""
@@ -200,8 +228,10 @@ class TestValidationClient:
         async with ValidationClient() as client:
             mock_provider = MagicMock()
             mock_provider.name = "test"
+            mock_provider.quick_reject.return_value = False
             mock_provider.validation_endpoint = "https://api.test.com/validate"
             mock_provider.build_auth_header.return_value = {"Authorization": "Bearer x"}
+            mock_provider.validate = partial(BaseProvider.validate, mock_provider)
 
             with patch.object(
                 client._client,
@@ -219,8 +249,10 @@ class TestValidationClient:
         async with ValidationClient() as client:
             mock_provider = MagicMock()
             mock_provider.name = "test"
+            mock_provider.quick_reject.return_value = False
             mock_provider.validation_endpoint = "https://api.test.com/validate"
             mock_provider.build_auth_header.return_value = {"Authorization": "Bearer x"}
+            mock_provider.validate = partial(BaseProvider.validate, mock_provider)
 
             with patch.object(
                 client._client,
@@ -238,8 +270,10 @@ class TestValidationClient:
         async with ValidationClient() as client:
             mock_provider = MagicMock()
             mock_provider.name = "test"
+            mock_provider.quick_reject.return_value = False
             mock_provider.validation_endpoint = "https://api.test.com/validate"
             mock_provider.build_auth_header.return_value = {"Authorization": "Bearer x"}
+            mock_provider.validate = partial(BaseProvider.validate, mock_provider)
             mock_provider.interpret_response.return_value = ValidationResult(
                 status=ValidationStatus.VALID
             )
@@ -258,6 +292,338 @@ class TestValidationClient:
             assert result.status == ValidationStatus.VALID
 
 
+class TestQuickReject:
+    """Tests for skipping requests for malformed keys."""
+
+    @pytest.mark.asyncio
+    async def test_malformed_key_skips_request(self) -> None:
+        """A key that cannot be valid is rejected without I/O."""
+        provider = get_registry().get("groq")
+        assert provider is not None
+        limiter = RateLimiter()
+        with (
+            patch.object(BaseProvider, "validate") as validate,
+            patch.object(limiter, "acquire") as acquire,
+        ):
+            async with ValidationClient(rate_limiter=limiter) as client:
+                result = await client.validate_key(provider, "gsk_tooshort")
+
+        assert result.status == ValidationStatus.INVALID
+        validate.assert_not_called()
+        acquire.assert_not_called()
+
+
+class TestSharedHttpClient:
+    """Tests for the shared, pooled HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_get_client_reused_until_closed(self) -> None:
+        """The same client is returned on a loop until it is closed."""
+        client = get_client()
+        assert get_client() is client
+
+        await close_client()
+        assert client.is_closed
+        assert get_client() is not client
+        await close_client()
+
+    @pytest.mark.asyncio
+    async def test_validation_client_does_not_close_shared(self) -> None:
+        """A ValidationClient leaves an injected client open."""
+        shared = get_client()
+        async with ValidationClient(http_client=shared) as client:
+            assert client._client is shared
+        assert not shared.is_closed
+        await close_client()
+
+    @pytest.mark.asyncio
+    async def test_own_client_is_pooled(self) -> None:
+        """Clients created by ValidationClient use the shared pool limits."""
+        async with ValidationClient() as client:
+            assert client._client is not None
+            pool = client._client._transport._pool  # type: ignore[attr-defined]
+            assert pool._max_connections == DEFAULT_LIMITS.max_connections
+
+    @pytest.mark.asyncio
+    async def test_own_pool_keeps_a_connection_per_slot(self) -> None:
+        """High concurrency keeps one idle connection alive per slot."""
+        config = ValidationClientConfig(max_concurrent=64)
+        async with ValidationClient(config=config) as client:
+            assert client._client is not None
+            pool = client._client._transport._pool  # type: ignore[attr-defined]
+            assert pool._max_keepalive_connections == 64
+            assert pool._max_connections == 128
+
+    def test_pool_limits_never_below_defaults(self) -> None:
+        """Low concurrency keeps the default pool sizes."""
+        limits = pool_limits(1)
+        assert limits.max_connections == DEFAULT_LIMITS.max_connections
+        assert limits.max_keepalive_connections == (
+            DEFAULT_LIMITS.max_keepalive_connections
+        )
+        assert limits.keepalive_expiry == DEFAULT_LIMITS.keepalive_expiry
+
+    @pytest.mark.asyncio
+    async def test_http2_follows_h2_availability(self) -> None:
+        """HTTP/2 is negotiated only when the h2 package is installed."""
+        client = create_http_client()
+        try:
+            pool = client._transport._pool  # type: ignore[attr-defined]
+            assert pool._http2 is HTTP2_AVAILABLE
+        finally:
+            await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_validate_uses_validation_url(self) -> None:
+        """Providers that put the key in the URL are requested there."""
+        provider = get_registry().get("google_gemini")
+        assert provider is not None
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {}
+
+        async with ValidationClient() as client:
+            assert client._client is not None
+            with patch.object(
+                client._client, "get", return_value=mock_response
+            ) as mock_get:
+                result = await client.validate_key(provider, GOOGLE_KEY)
+
+        assert mock_get.call_args.args[0].endswith(f"?key={GOOGLE_KEY}")
+        assert result.status == ValidationStatus.VALID
+
+
+class TestResponseBodyParsing:
+    """Tests for decoding response bodies only when they are read."""
+
+    @staticmethod
+    async def _validate(
+        provider_name: str, status_code: int, key: str
+    ) -> dict[str, object] | None:
+        """Validate a key and return the body passed to interpret_response."""
+        provider = get_registry().get(provider_name)
+        assert provider is not None
+        mock_response = MagicMock()
+        mock_response.status_code = status_code
+        mock_response.content = b'{"name": "alice"}'
+        mock_response.json.return_value = {"name": "alice"}
+
+        async with ValidationClient() as client:
+            assert client._client is not None
+            with (
+                patch.object(client._client, "get", return_value=mock_response),
+                patch.object(
+                    provider, "interpret_response", wraps=provider.interpret_response
+                ) as interpret,
+            ):
+                await client.validate_key(provider, key)
+        return interpret.call_args.args[1]
+
+    @pytest.mark.asyncio
+    async def test_body_decoded_when_read(self) -> None:
+        """A provider reading the 200 body gets it decoded."""
+        body = await self._validate("huggingface", 200, HUGGINGFACE_KEY)
+        assert body == {"name": "alice"}
+
+    @pytest.mark.asyncio
+    async def test_body_skipped_for_other_statuses(self) -> None:
+        """Error responses are not decoded."""
+        assert await self._validate("huggingface", 401, HUGGINGFACE_KEY) is None
+
+    @pytest.mark.asyncio
+    async def test_body_skipped_when_never_read(self) -> None:
+        """Providers that ignore the body never decode it."""
+        assert await self._validate("groq", 200, GROQ_KEY) is None
+
+
+class TestRateLimitBackoff:
+    """Tests for backing off when a provider answers 429."""
+
+    @pytest.mark.asyncio
+    async def test_retry_after_header_recorded(self) -> None:
+        """A 429's Retry-After is carried on the result."""
+        provider = get_registry().get("groq")
+        assert provider is not None
+        mock_response = MagicMock()
+        mock_response.status_code = 429
+        mock_response.headers = httpx.Headers({"Retry-After": "7"})
+
+        async with ValidationClient() as client:
+            assert client._client is not None
+            with patch.object(client._client, "get", return_value=mock_response):
+                result = await client.validate_key(provider, GROQ_KEY)
+
+        assert result.status == ValidationStatus.RATE_LIMITED
+        assert result.retry_after == 7.0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_backs_off_provider(self) -> None:
+        """A 429 pauses the provider's bucket for the requested delay."""
+        results = [
+            ValidationResult(status=ValidationStatus.RATE_LIMITED, retry_after=0.01),
+            ValidationResult(status=ValidationStatus.VALID),
+        ]
+
+        async def fake_validate(
+            _self: BaseProvider, _key: str, _client: httpx.AsyncClient
+        ) -> ValidationResult:
+            return results.pop(0)
+
+        provider = get_registry().get("groq")
+        assert provider is not None
+        limiter = RateLimiter()
+        limiter.configure_provider("groq", RateLimitConfig(requests_per_second=1000.0))
+        with (
+            patch.object(BaseProvider, "validate", fake_validate),
+            patch.object(limiter, "backoff", wraps=limiter.backoff) as backoff,
+            patch.object(limiter, "recover", wraps=limiter.recover) as recover,
+        ):
+            async with ValidationClient(rate_limiter=limiter) as client:
+                result = await client._validate_with_retry(provider, GROQ_KEY)
+
+        assert result.status == ValidationStatus.VALID
+        backoff.assert_called_once_with("groq", 0.01)
+        # Only the successful attempt speeds the provider back up
+        recover.assert_called_once_with("groq")
+
+    @pytest.mark.asyncio
+    async def test_unretried_rate_limit_still_pauses_provider(self) -> None:
+        """A 429 that is not retried still pauses the provider's bucket."""
+
+        async def fake_validate(
+            _self: BaseProvider, _key: str, _client: httpx.AsyncClient
+        ) -> ValidationResult:
+            return ValidationResult(
+                status=ValidationStatus.RATE_LIMITED, retry_after=5.0
+            )
+
+        provider = get_registry().get("groq")
+        assert provider is not None
+        limiter = RateLimiter()
+        config = ValidationClientConfig(retry_on_rate_limit=False)
+        with patch.object(BaseProvider, "validate", fake_validate):
+            async with ValidationClient(config=config, rate_limiter=limiter) as client:
+                result = await client._validate_with_retry(provider, GROQ_KEY)
+
+        assert result.status == ValidationStatus.RATE_LIMITED
+        assert limiter.get_wait_time("groq") > 4.0
+        assert not limiter.try_acquire("groq")
+
+
+class TestValidateMany:
+    """Tests for mixed-provider concurrent validation."""
+
+    @pytest.mark.asyncio
+    async def test_results_follow_input_order(self) -> None:
+        """Results line up with the input pairs."""
+
+        async def fake_validate(
+            _self: ValidationClient, provider: BaseProvider, key: str
+        ) -> ValidationResult:
+            await asyncio.sleep(0.01 if key == "slow" else 0)
+            return ValidationResult(
+                status=ValidationStatus.VALID, message=f"{provider.name}:{key}"
+            )
+
+        with patch.object(ValidationClient, "validate_key", fake_validate):
+            async with ValidationClient() as client:
+                results = await client.validate_many(
+                    [("groq", "slow"), ("openai", "fast"), ("nope", "x")]
+                )
+
+        assert [r.message for r in results[:2]] == ["groq:slow", "openai:fast"]
+        assert results[2].status == ValidationStatus.ERROR
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self) -> None:
+        """No more than max_concurrent_per_host requests hit one host."""
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def fake_validate(
+            _self: ValidationClient, provider: BaseProvider, _key: str
+        ) -> ValidationResult:
+            active[provider.name] = active.get(provider.name, 0) + 1
+            peak[provider.name] = max(peak.get(provider.name, 0), active[provider.name])
+            await asyncio.sleep(0.01)
+            active[provider.name] -= 1
+            return ValidationResult(status=ValidationStatus.VALID)
+
+        config = ValidationClientConfig(max_concurrent=10, max_concurrent_per_host=2)
+        keys = [("groq", str(i)) for i in range(6)] + [("openai", "a"), ("openai", "b")]
+        with patch.object(ValidationClient, "validate_key", fake_validate):
+            async with ValidationClient(config=config) as client:
+                await client.validate_many(keys)
+
+        assert peak == {"groq": 2, "openai": 2}
+
+
+class TestValidationDedup:
+    """Tests for skipping repeated validations of the same key."""
+
+    @pytest.mark.asyncio
+    async def test_duplicates_validated_once(self) -> None:
+        """Duplicate keys in a batch and across batches hit the API once."""
+        calls: list[str] = []
+
+        async def fake_validate(
+            _self: BaseProvider, key: str, _client: httpx.AsyncClient
+        ) -> ValidationResult:
+            calls.append(key)
+            return ValidationResult(status=ValidationStatus.VALID)
+
+        with patch.object(BaseProvider, "validate", fake_validate):
+            async with ValidationClient() as client:
+                results = await client.validate_many(
+                    [("groq", GROQ_KEY), ("groq", GROQ_KEY), ("groq", OTHER_GROQ_KEY)]
+                )
+                again = await client.validate_many([("groq", GROQ_KEY)])
+
+        assert sorted(calls) == [GROQ_KEY, OTHER_GROQ_KEY]
+        assert all(r.status == ValidationStatus.VALID for r in results + again)
+
+    @pytest.mark.asyncio
+    async def test_validate_by_provider_dedups(self) -> None:
+        """Duplicate keys for one provider are validated once, in order."""
+        calls: list[str] = []
+
+        async def fake_validate(
+            _self: BaseProvider, key: str, _client: httpx.AsyncClient
+        ) -> ValidationResult:
+            calls.append(key)
+            await asyncio.sleep(0)
+            return ValidationResult(status=ValidationStatus.VALID, message=key)
+
+        with patch.object(BaseProvider, "validate", fake_validate):
+            async with ValidationClient() as client:
+                results = await client.validate_by_provider(
+                    "groq", [GROQ_KEY, OTHER_GROQ_KEY, GROQ_KEY]
+                )
+
+        assert sorted(calls) == [GROQ_KEY, OTHER_GROQ_KEY]
+        assert [r.message for r in results] == [GROQ_KEY, OTHER_GROQ_KEY, GROQ_KEY]
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self) -> None:
+        """Transient failures are retried on the next request."""
+        calls: list[str] = []
+
+        async def fake_validate(
+            _self: BaseProvider, key: str, _client: httpx.AsyncClient
+        ) -> ValidationResult:
+            calls.append(key)
+            raise httpx.RequestError("down")
+
+        provider = get_registry().get("groq")
+        assert provider is not None
+        with patch.object(BaseProvider, "validate", fake_validate):
+            async with ValidationClient() as client:
+                await client.validate_key(provider, GROQ_KEY)
+                await client.validate_key(provider, GROQ_KEY)
+
+        assert calls == [GROQ_KEY, GROQ_KEY]
+
+
 class TestValidationClientBatch:
     """Tests for batch validation."""
 
@@ -288,6 +654,91 @@ class TestValidationClientBatch:
         assert results[0].validation_result.status == ValidationStatus.ERROR
         assert "Unknown provider" in results[0].validation_result.message
 
+    @pytest.mark.asyncio
+    async def test_failure_does_not_cancel_other_hosts(self) -> None:
+        """An unexpected failure becomes an ERROR without stopping the batch."""
+
+        async def fake_validate(
+            _self: ValidationClient, _provider: BaseProvider, key: str
+        ) -> ValidationResult:
+            await asyncio.sleep(0)
+            if key == "boom":
+                raise RuntimeError("exploded")
+            return ValidationResult(status=ValidationStatus.VALID)
+
+        candidates = [
+            SecretCandidate(provider_name="groq", secret_value="boom"),
+            SecretCandidate(provider_name="groq", secret_value="boom"),
+            SecretCandidate(provider_name="groq", secret_value="ok"),
+            SecretCandidate(provider_name="openai", secret_value="ok"),
+        ]
+        with patch.object(ValidationClient, "_validate_bounded", fake_validate):
+            async with ValidationClient() as client:
+                results, stats = await client.validate_batch(candidates)
+
+        statuses = [c.validation_result.status for c in results]  # type: ignore[union-attr]
+        assert statuses == [
+            ValidationStatus.ERROR,
+            ValidationStatus.ERROR,
+            ValidationStatus.VALID,
+            ValidationStatus.VALID,
+        ]
+        assert stats.errors == 2
+        assert stats.valid == 2
+
+    @pytest.mark.asyncio
+    async def test_workers_bounded_per_host(self) -> None:
+        """A host's keys are validated by at most max_concurrent_per_host tasks."""
+        tasks: set[asyncio.Task[object] | None] = set()
+
+        async def fake_validate(
+            _self: ValidationClient, _provider: BaseProvider, _key: str
+        ) -> ValidationResult:
+            tasks.add(asyncio.current_task())
+            await asyncio.sleep(0)
+            return ValidationResult(status=ValidationStatus.VALID)
+
+        config = ValidationClientConfig(max_concurrent_per_host=3)
+        candidates = [
+            SecretCandidate(provider_name="groq", secret_value=str(i))
+            for i in range(20)
+        ]
+        with patch.object(ValidationClient, "_validate_bounded", fake_validate):
+            async with ValidationClient(config=config) as client:
+                await client.validate_batch(candidates)
+
+        assert len(tasks) == 3
+        assert all(c.is_valid for c in candidates)
+
+    @pytest.mark.asyncio
+    async def test_provider_resolved_once(self) -> None:
+        """Each provider in a batch is looked up once, not once per key."""
+        candidates = [
+            SecretCandidate(provider_name=name, secret_value=str(i))
+            for i in range(5)
+            for name in ("groq", "openai", "nope")
+        ]
+
+        async def fake_validate(
+            _self: ValidationClient, _provider: BaseProvider, _key: str
+        ) -> ValidationResult:
+            return ValidationResult(status=ValidationStatus.VALID)
+
+        with patch.object(ValidationClient, "_validate_bounded", fake_validate):
+            async with ValidationClient() as client:
+                with patch.object(
+                    client._registry, "get", wraps=client._registry.get
+                ) as get:
+                    _, stats = await client.validate_batch(candidates)
+
+        assert sorted(call.args[0] for call in get.call_args_list) == [
+            "groq",
+            "nope",
+            "openai",
+        ]
+        assert stats.valid == 10
+        assert stats.errors == 5
+
     @pytest.mark.asyncio
     async def test_validate_by_provider_unknown(self) -> None:
         """Test validating by unknown provider."""